@@ -5,6 +5,8 @@ import os
 import re
 import secrets
 import uuid
+import zlib
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -12,6 +14,7 @@ from typing import Any
 from flask import Flask, Response, g, render_template, request
 from flask_babel import Babel
 from flask_cors import CORS
+from itsdangerous import URLSafeTimedSerializer
 from werkzeug.middleware.proxy_fix import ProxyFix
 
 from .config import config
@@ -21,11 +24,17 @@ from .models import db, init_db
 from .routes import admin_bp, analytics_bp, api_bp, health_bp, main_bp, new_books_bp, public_api_bp
 from .setup import shutdown_scheduler
 from .utils.error_handler import ErrorCategory, log_error
+from .utils.json_provider import init_json_provider
 
 babel = Babel()
 
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# 模板过滤器每次渲染逐本调用，正则在导入时编译
+_REPEATED_OPEN_MARK_RE = re.compile(r'《{2,}')
+_REPEATED_CLOSE_MARK_RE = re.compile(r'》{2,}')
+_ISBN_SEPARATOR_RE = re.compile(r'[\s\-]')
+
 
 def create_app(config_name: str | None = None) -> Flask:
     """
@@ -43,6 +52,7 @@ def create_app(config_name: str | None = None) -> Flask:
     app = Flask(__name__, template_folder=str(PROJECT_ROOT / 'templates'), static_folder=str(PROJECT_ROOT / 'static'))
 
     app.config.from_object(config[config_name])
+    init_json_provider(app)
     app.config['APP_ENV'] = config_name
     app.config['ENV'] = config_name
     config[config_name].init_app(app)
@@ -151,6 +161,11 @@ def _init_extensions(app: Flask, config_name: str) -> None:
 
     init_db(app)
 
+    # CSRF 令牌签名器：应用级单例，签发/校验均无需读写数据库
+    if not app.secret_key:
+        raise ValueError('未配置 SECRET_KEY，无法创建 CSRF 令牌签名器')
+    app.extensions['csrf_signer'] = URLSafeTimedSerializer(app.secret_key, salt='csrf')
+
     try:
         from flask_mail import Mail
 
@@ -294,6 +309,16 @@ def _configure_logging(app: Flask) -> None:
         logging.getLogger('urllib3').setLevel(logging.WARNING)
 
 
+def _gzip_stream(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """逐块 gzip 压缩流式响应，每块后 Z_SYNC_FLUSH 使客户端可立即解压已收到的内容"""
+    compressor = zlib.compressobj(4, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
 def _apply_security_headers(app: Flask) -> None:
     """应用安全响应头和静态资源缓存"""
 
@@ -346,15 +371,26 @@ def _apply_security_headers(app: Flask) -> None:
         if request_path.startswith('/static/'):
             response.headers['Cache-Control'] = 'public, max-age=2592000, immutable'
 
-        if (
+        compressible = (
             'gzip' in request.headers.get('Accept-Encoding', '')
             and response.content_type
             and any(
                 t in response.content_type for t in ('text/', 'application/json', 'application/javascript', 'image/svg')
             )
-            and response.content_length
-            and response.content_length > 1024
+        )
+        if (
+            compressible
+            and response.is_streamed
+            and response.mimetype == 'text/html'
+            and response.status_code == 200
+            and not response.direct_passthrough
         ):
+            # 仅流式模板页：没有 Content-Length，逐块压缩并同步刷新，保留边渲染边发送的效果
+            response.response = _gzip_stream(response.iter_encoded())
+            response.headers['Content-Encoding'] = 'gzip'
+            response.headers.pop('Content-Length', None)
+            response.headers['Vary'] = 'Accept-Encoding'
+        elif compressible and response.content_length and response.content_length > 1024:
             response.direct_passthrough = False
             gzip_buffer = io.BytesIO()
             with gzip.GzipFile(fileobj=gzip_buffer, mode='wb', compresslevel=4) as gz:
@@ -393,8 +429,8 @@ def _enable_rate_limiting(app: Flask) -> None:
 
         if request.path.startswith('/api/cron/'):
             client_ip = request.remote_addr or 'unknown'
-            if not cron_rate_limiter.is_allowed(client_ip):
-                retry_after = cron_rate_limiter.get_retry_after(client_ip)
+            retry_after = cron_rate_limiter.acquire(client_ip)
+            if retry_after:
                 response = make_response(
                     {'success': False, 'message': 'Rate limit exceeded. Please try again later.'}, 429
                 )
@@ -411,8 +447,8 @@ def _enable_rate_limiting(app: Flask) -> None:
 
         client_ip = request.remote_addr or 'unknown'
 
-        if not rate_limiter.is_allowed(client_ip):
-            retry_after = rate_limiter.get_retry_after(client_ip)
+        retry_after = rate_limiter.acquire(client_ip)
+        if retry_after:
             response = make_response({'success': False, 'message': 'Rate limit exceeded. Please try again later.'}, 429)
             response.headers['Retry-After'] = str(retry_after)
             return response
@@ -523,9 +559,8 @@ def _register_jinja_filters(app: Flask) -> None:
         """清理文本中所有重复的书名号（《《xxx》》 → 《xxx》）"""
         if not text:
             return ''
-        text = re.sub(r'《{2,}', '《', text)
-        text = re.sub(r'》{2,}', '》', text)
-        return text
+        text = _REPEATED_OPEN_MARK_RE.sub('《', text)
+        return _REPEATED_CLOSE_MARK_RE.sub('》', text)
 
     @app.template_filter('is_valid_isbn')
     def is_valid_isbn_filter(value: str | None) -> bool:
@@ -539,7 +574,7 @@ def _register_jinja_filters(app: Flask) -> None:
         """去除 ISBN 中的空格和连字符"""
         if not value:
             return ''
-        return re.sub(r'[\s\-]', '', value)
+        return _ISBN_SEPARATOR_RE.sub('', value)
 
     @app.template_filter('is_invalid_publisher')
     def is_invalid_publisher_filter(value: str | None) -> bool:
@@ -29,6 +29,11 @@ def _ensure_supabase_sslmode(db_url: str) -> str:
     return f'{db_url}{separator}sslmode=require'
 
 
+def monthly_categories(frequencies: dict[str, str]) -> tuple[str, ...]:
+    """Derive the monthly-updated categories, sorted by ID, from the frequency table."""
+    return tuple(sorted(category_id for category_id, frequency in frequencies.items() if frequency == 'monthly'))
+
+
 class Config:
     """基础配置类"""
 
@@ -70,6 +75,12 @@ class Config:
 
     CACHE_DIR: Path = BASE_DIR / 'cache'
     IMAGE_CACHE_DIR: Path = CACHE_DIR / 'images'
+    # 前置 nginx 时设置为 internal location 前缀（如 /_protected_images），由 nginx 直接发送缓存图片
+    IMAGE_ACCEL_REDIRECT_PREFIX: str | None = os.environ.get('IMAGE_ACCEL_REDIRECT_PREFIX')
+    # 前置 Apache/lighttpd 时启用 Flask 内置的 X-Sendfile 支持
+    USE_X_SENDFILE: bool = os.environ.get('USE_X_SENDFILE', 'false').lower() == 'true'
+    # send_file / 内置 static 路由的默认缓存时间（30 天），配合 ETag 条件请求返回 304
+    SEND_FILE_MAX_AGE_DEFAULT: int = 30 * 24 * 3600
 
     API_RATE_LIMIT: int = int(os.environ.get('API_RATE_LIMIT', 100))
     API_RATE_LIMIT_WINDOW: int = int(os.environ.get('API_RATE_LIMIT_WINDOW', 60))
@@ -102,6 +113,8 @@ class Config:
         'childrens-middle-grade-hardcover': 'weekly',
         'young-adult-hardcover': 'weekly',
     }
+    # 月更分类 NYT_MONTHLY_CATEGORIES（首页脚本用于判断榜单新鲜度）在 init_app 中由上表派生，
+    # 子类覆盖更新频率后同样生效
 
     NYT_API_BASE_URL: str = 'https://api.nytimes.com/svc/books/v3/lists/current'
     NYT_LIST_NAMES_URL: str = 'https://api.nytimes.com/svc/books/v3/lists/names.json'
@@ -158,6 +171,8 @@ class Config:
         cls.CACHE_DIR.mkdir(exist_ok=True, mode=0o755)
         cls.IMAGE_CACHE_DIR.mkdir(exist_ok=True, mode=0o755)
 
+        app.config['NYT_MONTHLY_CATEGORIES'] = monthly_categories(app.config['NYT_CATEGORY_UPDATE_FREQUENCIES'])
+
         _max_emails = os.environ.get('MAIL_MAX_EMAILS')
         if _max_emails:
             try:
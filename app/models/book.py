@@ -1,5 +1,5 @@
 import hashlib
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 
 
 @dataclass
@@ -35,7 +35,10 @@ class Book:
     def to_dict(self) -> dict:
         from ..utils import quick_clean_translation
 
-        data = asdict(self)
+        # 按字段浅拷贝，替代 asdict 的递归深拷贝（列表接口逐本序列化，热点路径）
+        data = {name: getattr(self, name) for name in _BOOK_FIELD_NAMES}
+        if self.buy_links:
+            data['buy_links'] = [dict(link) for link in self.buy_links]
         data['title_zh'] = quick_clean_translation(self.title_zh, 'title')
         data['description_zh'] = quick_clean_translation(self.description_zh, 'description')
         data['details_zh'] = quick_clean_translation(self.details_zh, 'details')
@@ -103,3 +106,6 @@ class Book:
             isbn10=raw_isbn10 if cls._is_valid_isbn(raw_isbn10) else '',
             price=final_price,
         )
+
+
+_BOOK_FIELD_NAMES = tuple(f.name for f in fields(Book))
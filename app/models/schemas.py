@@ -1,5 +1,7 @@
 from datetime import UTC, datetime
 
+from sqlalchemy import DDL, event
+
 from .book import Book
 from .database import db
 
@@ -237,8 +239,22 @@ class AwardBook(db.Model):
     __table_args__ = (
         db.UniqueConstraint('award_id', 'year', 'category', 'isbn13', name='uix_award_book'),
         db.Index('idx_award_books_award_year_category', 'award_id', 'year', 'category'),
+        # 按奖项筛选并按 (year DESC, rank ASC) 排序时可直接按索引顺序读取
+        db.Index('idx_award_books_award_year_rank', 'award_id', 'year', 'rank'),
+        # 按奖项 + 类别筛选（不带年份）及按奖项取不重复类别
+        db.Index('idx_award_books_award_category', 'award_id', 'category'),
         db.Index('idx_award_books_search_combined', 'title', 'author'),
         db.Index('idx_award_books_displayable_year', 'is_displayable', 'year'),
+        # 三元组索引：搜索与关键词筛选的 ILIKE '%kw%' 子串匹配在 PostgreSQL 下可走索引
+        *(
+            db.Index(
+                f'idx_award_books_{column}_trgm',
+                column,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+            ).ddl_if(dialect='postgresql')
+            for column in ('title', 'author', 'title_zh')
+        ),
     )
 
     @staticmethod
@@ -259,11 +275,16 @@ class AwardBook(db.Model):
         - 退化到非 ISBN 的 title_zh
         - 最后回退到原 title（兜底，避免空字符串）
         """
-        if self.title and not self._looks_like_isbn(self.title):
-            return self.title
-        if self.title_zh and not self._looks_like_isbn(self.title_zh):
-            return self.title_zh
-        return self.title or self.title_zh or ''
+        return self.pick_display_title(self.title, self.title_zh)
+
+    @classmethod
+    def pick_display_title(cls, title: str | None, title_zh: str | None) -> str:
+        """display_title 的取值规则，供只查询了列的结果行复用"""
+        if title and not cls._looks_like_isbn(title):
+            return title
+        if title_zh and not cls._looks_like_isbn(title_zh):
+            return title_zh
+        return title or title_zh or ''
 
     def to_dict(self, include_zh: bool = True) -> dict:
         data = {
@@ -299,6 +320,14 @@ class AwardBook(db.Model):
         return data
 
 
+# gin_trgm_ops 依赖 pg_trgm 扩展，create_all 建表前确保已安装
+event.listen(
+    AwardBook.__table__,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql'),
+)
+
+
 class TranslationCache(db.Model):
     """翻译内容缓存表"""
 
@@ -19,6 +19,7 @@ from ..services.admin_service import (
 )
 from ..utils.admin_auth import admin_required
 from ..utils.api_helpers import APIResponse, csrf_protect
+from ..utils.cache import result_cache
 from ..utils.error_handler import ErrorCategory, log_error
 from ..utils.error_tracker import error_tracker
 from ..utils.service_helpers import get_book_service, get_image_cache_service
@@ -808,6 +809,8 @@ def seed_award_books():
         from ..initialization.sample_award_books import init_sample_award_books
 
         init_sample_award_books(current_app._get_current_object())  # type: ignore[attr-defined]
+        # 新增的奖项/年份/类别需立即出现在奖项页筛选与接口中，丢弃缓存的列表与计数
+        result_cache.clear()
 
         from ..models.schemas import AwardBook
 
@@ -1,9 +1,17 @@
 import logging
 import secrets
+from collections.abc import Callable
+from typing import Any
 
-from flask import Blueprint, current_app, session
+from flask import Blueprint, current_app, request, session
 
+from ...models.database import db
 from ...services.user_service import UserService
+from ...utils.api_helpers import APIResponse, get_csrf_token, validate_isbn
+from ...utils.cache import result_cache
+from ...utils.exceptions import ValidationException
+from ...utils.rate_limiter import get_rate_limiter
+from ...utils.service_helpers import submit_background_task
 
 logger = logging.getLogger(__name__)
 
@@ -19,28 +27,88 @@ def get_session_id() -> str:
     return session['session_id']
 
 
+@api_bp.record_once
+def _init_valid_categories(state) -> None:
+    """注册蓝图时把合法分类（含 'all'）固化为 frozenset、分类ID固化为元组，CATEGORIES 在应用创建后视为只读"""
+    categories = state.app.config.get('CATEGORIES', {})
+    state.app.extensions['valid_categories'] = frozenset(categories) | {'all'}
+    state.app.extensions['category_ids'] = tuple(categories)
+
+
 def validate_category(category: str) -> bool:
     """验证分类ID是否有效"""
-    categories = current_app.config.get('CATEGORIES', {})
-    return category in categories or category == 'all'
+    return category in current_app.extensions['valid_categories']
+
+
+def record_in_background(func: Callable[..., Any], *args: Any) -> None:
+    """将与响应无关的统计写入（搜索历史、分类偏好、浏览记录）交给后台线程，请求无需等待提交
+
+    测试环境下同步执行，保证断言可见且不与测试线程争用数据库连接。
+    """
+    app = current_app._get_current_object()
+    if app.config.get('TESTING'):
+        func(*args)
+        return
+
+    def _task() -> None:
+        with app.app_context():
+            func(*args)
+
+    submit_background_task(_task)
+
+
+def cached_success(cache_key: str, build: Callable[[], Any], ttl: int | None = None) -> tuple[Any, int]:
+    """缓存序列化后的成功响应体：命中时直接用字节构建响应，跳过服务查询与 JSON 编码
+
+    build 返回带 'error' 键的降级结果时不写缓存，避免把临时故障固化到 TTL 结束。
+    """
+    body = result_cache.get(cache_key)
+    if body is not None:
+        return current_app.response_class(body, mimetype='application/json'), 200
+
+    data = build()
+    response, status_code = APIResponse.success(data=data)
+    if not (isinstance(data, dict) and 'error' in data):
+        result_cache.set(cache_key, response.get_data(), ttl=ttl)
+    return response, status_code
+
+
+# 需要在分发前校验路径参数的端点；ISBN 端点各自保留原有的错误提示
+_CATEGORY_ENDPOINTS = frozenset({'api.get_books', 'api.export_csv'})
+_ISBN_ENDPOINT_MESSAGES = {
+    'api.get_book_details': 'Invalid ISBN format',
+    'api.translate_book': '无效的ISBN格式',
+}
+
+
+@api_bp.url_value_preprocessor
+def _validate_path_values(endpoint: str | None, values: dict[str, Any] | None) -> None:
+    """分发前统一校验分类/ISBN 路径参数，非法请求在进入视图（限流、CSRF、服务查找）之前即被拒绝"""
+    if not values:
+        return
+    if endpoint in _CATEGORY_ENDPOINTS and not validate_category(values['category']):
+        raise ValidationException(
+            f'Invalid category. Available categories: {list(current_app.config["CATEGORIES"].keys())} or "all"'
+        )
+    message = _ISBN_ENDPOINT_MESSAGES.get(endpoint)
+    if message and not validate_isbn(values['isbn']):
+        raise ValidationException(message)
+
+
+@api_bp.errorhandler(ValidationException)
+def validation_error(error: ValidationException):
+    return APIResponse.error(error.message, 400)
 
 
 @api_bp.route('/health')
 def health_check():
     """健康检查端点"""
-    from ...utils.api_helpers import APIResponse
-
     return APIResponse.success(data={'status': 'healthy', 'service': 'book-rank-api'})
 
 
 @api_bp.route('/csrf-token')
 def get_csrf_token_endpoint():
     """获取CSRF令牌端点（含速率限制：每 IP 每分钟最多 10 次）"""
-    from flask import request
-
-    from ...utils.api_helpers import APIResponse, get_csrf_token
-    from ...utils.rate_limiter import get_rate_limiter
-
     csrf_limiter = get_rate_limiter(max_requests=10, window_seconds=60)
     client_ip = request.remote_addr or 'unknown'
     if not csrf_limiter.is_allowed(client_ip):
@@ -52,24 +120,17 @@ def get_csrf_token_endpoint():
 
 @api_bp.errorhandler(404)
 def not_found(error):
-    from ...utils.api_helpers import APIResponse
-
     return APIResponse.error('Resource not found', 404)
 
 
 @api_bp.errorhandler(405)
 def method_not_allowed(error):
-    from ...utils.api_helpers import APIResponse
-
     return APIResponse.error('Method not allowed', 405)
 
 
 @api_bp.errorhandler(500)
 def internal_error(error):
     # 框架级异常回滚：释放可能处于未提交状态的数据库会话，避免连接泄漏
-    from ...models.database import db
-    from ...utils.api_helpers import APIResponse
-
     db.session.rollback()
     return APIResponse.error('Internal server error', 500)
 
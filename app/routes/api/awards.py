@@ -1,10 +1,14 @@
+import base64
+import binascii
 import logging
 
 from flask import request
 
+from ...models.schemas import AwardBook
 from ...services.award_book_service import AwardBookService
 from ...utils.admin_auth import admin_required
 from ...utils.api_helpers import APIResponse, csrf_protect, validate_pagination
+from ...utils.cache import result_cache
 from ...utils.error_handler import ErrorCategory, log_error
 from . import api_bp
 
@@ -13,12 +17,41 @@ logger = logging.getLogger(__name__)
 _award_service = AwardBookService()
 
 
+def _encode_cursor(cursor: tuple[int, int] | None) -> str | None:
+    """将 (year, id) 编码为不透明的游标字符串"""
+    if cursor is None:
+        return None
+    return base64.urlsafe_b64encode(f'{cursor[0]}:{cursor[1]}'.encode()).decode()
+
+
+def _decode_cursor(raw: str) -> tuple[int, int] | None:
+    """解析游标字符串；空字符串表示第一页，格式非法时抛出 ValueError"""
+    if not raw:
+        return None
+    try:
+        year, book_id = base64.urlsafe_b64decode(raw.encode()).decode().split(':')
+        return int(year), int(book_id)
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(f'invalid cursor: {raw}') from e
+
+
+def _load_cursor_page(cursor: tuple[int, int] | None, limit: int, **filters) -> tuple[list[AwardBook], dict]:
+    """游标分页：返回 (图书列表, 分页信息)，不统计总数"""
+    books, next_cursor = _award_service.get_award_books_after(cursor=cursor, limit=limit, **filters)
+    pagination = {'limit': limit, 'next_cursor': _encode_cursor(next_cursor), 'has_more': next_cursor is not None}
+    return books, pagination
+
+
 @api_bp.route('/awards')
 def get_awards():
     """获取所有奖项列表（通过 Service 层）"""
     try:
-        awards = _award_service.get_all_awards()
-        return APIResponse.success(data={'awards': [award.to_dict() for award in awards]})
+        payload = result_cache.get('awards')
+        if payload is None:
+            payload = {'awards': [award.to_dict() for award in _award_service.get_all_awards()]}
+            # 奖项列表极少变化，使用较长的缓存时间
+            result_cache.set('awards', payload, ttl=300)
+        return APIResponse.success(data=payload)
 
     except Exception as e:
         log_error(ErrorCategory.API_CALL, f'获取奖项列表错误: {e}', exc_info=True)
@@ -33,26 +66,37 @@ def get_award_books(award_id: int):
         if year and (year < 1900 or year > 2100):
             return APIResponse.error('无效的年份', 400)
 
-        award = _award_service.get_award_by_id(award_id)
-        if not award:
-            return APIResponse.error('奖项不存在', 404)
-
         category = request.args.get('category')
         page, limit = validate_pagination(
             request.args.get('page', 1, type=int), request.args.get('limit', 20, type=int)
         )
 
-        books, total = _award_service.get_award_books(
-            award_id=award_id, year=year, category=category, page=page, limit=limit
-        )
-
-        return APIResponse.success(
-            data={
-                'award': award.to_dict(),
-                'books': [book.to_dict() for book in books],
-                'pagination': {'page': page, 'limit': limit, 'total': total, 'pages': (total + limit - 1) // limit},
-            }
-        )
+        # 传入 cursor 参数时使用游标分页，否则保持原有 page/limit 分页
+        use_cursor = 'cursor' in request.args
+        page_key = f'c{request.args["cursor"]}' if use_cursor else page
+        cache_key = f'award_books:{award_id}:{year}:{category}:{page_key}:{limit}'
+        payload = result_cache.get(cache_key)
+        if payload is None:
+            if use_cursor:
+                try:
+                    cursor = _decode_cursor(request.args['cursor'])
+                except ValueError:
+                    return APIResponse.error('无效的分页游标', 400)
+                books, pagination = _load_cursor_page(cursor, limit, award_id=award_id, year=year, category=category)
+            else:
+                books, total = _award_service.get_award_books(
+                    award_id=award_id, year=year, category=category, page=page, limit=limit
+                )
+                pagination = {'page': page, 'limit': limit, 'total': total, 'pages': (total + limit - 1) // limit}
+
+            # 图书已随 joinedload 载入所属奖项；仅当前页为空时才单独查询奖项是否存在
+            award = books[0].award if books else _award_service.get_award_by_id(award_id)
+            if not award:
+                return APIResponse.error('奖项不存在', 404)
+            payload = {'award': award.to_dict(), 'books': [book.to_dict() for book in books], 'pagination': pagination}
+            result_cache.set(cache_key, payload)
+
+        return APIResponse.success(data=payload)
 
     except Exception as e:
         log_error(ErrorCategory.API_CALL, f'获取奖项图书错误: {e}', exc_info=True)
@@ -74,6 +118,17 @@ def get_all_award_books():
             request.args.get('page', 1, type=int), request.args.get('limit', 20, type=int)
         )
 
+        if 'cursor' in request.args:
+            # 游标分页：无 count()、无 OFFSET，深翻页不退化
+            try:
+                cursor = _decode_cursor(request.args['cursor'])
+            except ValueError:
+                return APIResponse.error('无效的分页游标', 400)
+            books, pagination = _load_cursor_page(
+                cursor, limit, award_id=award_id, year=year, category=category, keyword=keyword
+            )
+            return APIResponse.success(data={'books': [book.to_dict() for book in books], 'pagination': pagination})
+
         books, total = _award_service.get_award_books(
             award_id=award_id, year=year, category=category, keyword=keyword, page=page, limit=limit
         )
@@ -119,14 +174,34 @@ def search_award_books():
             request.args.get('page', 1, type=int), request.args.get('limit', 20, type=int)
         )
 
-        books, total = _award_service.search_award_books(keyword=keyword, page=page, limit=limit)
+        if 'cursor' in request.args:
+            # 游标分页：无 count()、无 OFFSET，深翻页不退化
+            try:
+                cursor = _decode_cursor(request.args['cursor'])
+            except ValueError:
+                return APIResponse.error('无效的分页游标', 400)
+            books, next_cursor = _award_service.search_award_books_after(keyword=keyword, cursor=cursor, limit=limit)
+            pagination = {
+                'limit': limit,
+                'next_cursor': _encode_cursor(next_cursor),
+                'has_more': next_cursor is not None,
+            }
+        # exact_total=0 时只判断是否有下一页，跳过 COUNT；默认保持返回 total/pages
+        elif request.args.get('exact_total') == '0':
+            books, has_more = _award_service.search_award_books_page(keyword=keyword, page=page, limit=limit)
+            pagination = {'page': page, 'limit': limit, 'has_more': has_more}
+        else:
+            books, total = _award_service.search_award_books(keyword=keyword, page=page, limit=limit)
+            pagination = {
+                'page': page,
+                'limit': limit,
+                'total': total,
+                'pages': (total + limit - 1) // limit,
+                'has_more': page * limit < total,
+            }
 
         return APIResponse.success(
-            data={
-                'keyword': keyword,
-                'books': [book.to_dict() for book in books],
-                'pagination': {'page': page, 'limit': limit, 'total': total, 'pages': (total + limit - 1) // limit},
-            }
+            data={'keyword': keyword, 'books': [book.to_dict() for book in books], 'pagination': pagination}
         )
 
     except Exception as e:
@@ -145,6 +220,8 @@ def fix_award_book_titles():
     """
     try:
         result = _award_service.fix_award_book_titles()
+        # 标题已修改，丢弃缓存的奖项图书列表
+        result_cache.clear()
         fixed_entries = result['fixed_entries']
         debug_entries = result['debug_entries']
         logger.info(f'🔧 admin fix-award-book-titles: 修复 {len(fixed_entries)} 项')
@@ -182,6 +259,8 @@ def fix_award_book_titles_by_ids():
 
     try:
         result = _award_service.fix_award_book_titles_by_ids(items)
+        # 标题已修改，丢弃缓存的奖项图书列表
+        result_cache.clear()
         fixed_entries = result['fixed_entries']
         skipped = result['skipped']
         logger.info(f'🔧 admin fix-award-book-titles-by-ids: 修复 {len(fixed_entries)} 项')
@@ -1,72 +1,105 @@
-import csv
 import logging
-import re
 from datetime import datetime
-from io import StringIO
+from typing import Any
 from urllib.parse import quote
 
-from flask import current_app, request
+from flask import current_app, request, session, stream_with_context
+from pydantic import ValidationError
 
+from ...models.book import Book
+from ...schemas import UserPreferencesUpdate, parse_json_body
 from ...services.user_service import UserService
 from ...utils.api_helpers import (
     APIResponse,
     api_rate_limit,
     clean_translation_text,
     csrf_protect,
-    validate_isbn,
+    validate_search_keyword,
 )
 from ...utils.error_handler import ErrorCategory, log_error
-from ...utils.service_helpers import get_book_service, get_translation_service
-from . import api_bp, get_session_id, validate_category
+from ...utils.service_helpers import (
+    get_book_service,
+    get_or_create_google_books_client,
+    get_translation_service,
+)
+from . import api_bp, cached_success, get_session_id, record_in_background
 
 logger = logging.getLogger(__name__)
 
 _user_service = UserService()
 
+
 # UTF-8 BOM,确保 Excel 正确识别 CSV 中的中文
 _UTF8_BOM = '﻿'.encode()
 
+# 导出表头固定不变，预先编码为字节（含 BOM），与 csv.writer 一致使用 \r\n 行结束符
+_CSV_HEADER = (
+    _UTF8_BOM
+    + ','.join(
+        [
+            '分类',
+            '书名',
+            '作者',
+            '出版社',
+            '当前排名',
+            '上周排名',
+            '累计上榜周数',
+            '出版日期',
+            '页数',
+            '语言',
+            'ISBN-13',
+            '价格',
+        ]
+    ).encode()
+    + b'\r\n'
+)
+
+
+def _csv_escape(value: Any) -> str:
+    """按 csv.QUOTE_MINIMAL 规则转义单个字段（绝大多数字段无需引号，直接返回）"""
+    text = '' if value is None else str(value)
+    if '"' in text:
+        return '"' + text.replace('"', '""') + '"'
+    if ',' in text or '\n' in text or '\r' in text:
+        return '"' + text + '"'
+    return text
+
 
 @api_bp.route('/books/<category>')
 @api_rate_limit(max_requests=60, window=60)
 def get_books(category: str):
     """获取图书列表"""
     try:
-        if not category or not isinstance(category, str):
-            return APIResponse.error('Invalid category parameter', 400)
-
-        if not validate_category(category):
-            return APIResponse.error(
-                f'Invalid category. Available categories: {list(current_app.config["CATEGORIES"].keys())} or "all"', 400
-            )
-
-        session_id = get_session_id()
         book_service = get_book_service()
         if not book_service:
             return APIResponse.error('Service unavailable', 503)
 
-        if category == 'all':
-            all_books = {}
-            for cat_id in current_app.config['CATEGORIES']:
-                all_books[cat_id] = [book.to_dict() for book in book_service.get_books_by_category(cat_id)]
-            _user_service.save_user_categories(session_id, list(current_app.config['CATEGORIES'].keys()))
-            return APIResponse.success(
-                data={
-                    'books': all_books,
-                    'categories': current_app.config['CATEGORIES'],
-                    'latest_update': book_service.get_latest_cache_time(),
-                }
-            )
-        else:
-            books = book_service.get_books_by_category(category)
-            _user_service.save_user_categories(session_id, [category])
-            return APIResponse.success(
-                data={
-                    'books': [book.to_dict() for book in books],
-                    'category_name': current_app.config['CATEGORIES'].get(category, category),
-                    'latest_update': book_service.get_latest_cache_time(),
+        categories = current_app.config['CATEGORIES']
+        category_ids = current_app.extensions['category_ids'] if category == 'all' else (category,)
+
+        # 缓存键带上数据更新时间，图书缓存刷新后自动失效；缓存的是序列化后的响应体，
+        # 命中时既不调用 to_dict 也不重新编码 JSON
+        latest_update = book_service.get_latest_cache_time()
+
+        def build() -> dict[str, Any]:
+            if category == 'all':
+                books_by_category = book_service.get_books_by_categories(category_ids)
+                return {
+                    'books': {cat_id: list(map(Book.to_dict, books)) for cat_id, books in books_by_category.items()},
+                    'categories': categories,
+                    'latest_update': latest_update,
                 }
-            )
+            return {
+                'books': list(map(Book.to_dict, book_service.get_books_by_category(category))),
+                'category_name': categories.get(category, category),
+                'latest_update': latest_update,
+            }
+
+        response = cached_success(f'books:{category}:{latest_update}', build)
+
+        # 分类偏好只写差异：集合未变时后台保存仅两次 SELECT，不产生写入
+        record_in_background(_user_service.save_user_categories, get_session_id(), category_ids)
+        return response
 
     except Exception as e:
         log_error(ErrorCategory.API_CALL, f'Unexpected error in get_books: {e}', exc_info=True)
@@ -86,20 +119,20 @@ def search_books():
             return APIResponse.error('Keyword must be at least 2 characters', 400)
         if len(keyword) > 100:
             return APIResponse.error('Keyword must be at most 100 characters', 400)
-        if not re.match(r'^[\w\s\-一-鿿]+$', keyword):
+        if not validate_search_keyword(keyword):
             return APIResponse.error('Invalid keyword format', 400)
 
-        session_id = get_session_id()
         book_service = get_book_service()
         if not book_service:
             return APIResponse.error('Service unavailable', 503)
 
         results = book_service.search_books(keyword)[:50]
+        session_id = get_session_id()
 
-        _user_service.save_search_history(session_id, keyword, len(results))
+        record_in_background(_user_service.save_search_history, session_id, keyword, len(results))
 
         if results:
-            _user_service.save_viewed_books(session_id, [book.id for book in results[:5]])
+            record_in_background(_user_service.save_viewed_books, session_id, [book.id for book in results[:5]])
 
         return APIResponse.success(
             data={
@@ -118,7 +151,10 @@ def search_books():
 def get_search_history():
     """获取搜索历史"""
     try:
-        session_id = get_session_id()
+        # 只读接口：尚无会话ID说明没有任何历史，不为此生成ID、改写会话 Cookie
+        session_id = session.get('session_id')
+        if not session_id:
+            return APIResponse.success(data={'history': []})
         limit = min(request.args.get('limit', 5, type=int), 20)
 
         history = _user_service.get_search_history(session_id, limit)
@@ -135,34 +171,26 @@ def get_search_history():
 def user_preferences():
     """获取或更新用户偏好（通过 UserService 层操作数据库）"""
     try:
-        session_id = get_session_id()
-
         if request.method == 'POST':
             if not request.is_json:
                 return APIResponse.error('Content-Type must be application/json', 400)
 
-            data = request.get_json() or {}
-
-            # 通过 Service 层更新 view_mode
-            _user_service.update_preferences(session_id, data)
+            try:
+                prefs = parse_json_body(UserPreferencesUpdate, request.get_data())
+            except ValidationError:
+                return APIResponse.error('Invalid preferences payload', 400)
 
-            preferred_categories = data.get('preferred_categories')
-            if preferred_categories and isinstance(preferred_categories, list):
-                valid_categories = list(current_app.config.get('CATEGORIES', {}).keys())
-                valid_prefs = [c for c in preferred_categories if c in valid_categories]
-                if valid_prefs:
-                    _user_service.save_user_categories(session_id, valid_prefs)
+            valid_categories = current_app.config.get('CATEGORIES', {})
+            valid_prefs = [c for c in prefs.preferred_categories or [] if c in valid_categories]
 
-            last_viewed_isbns = data.get('last_viewed_isbns')
-            if last_viewed_isbns and isinstance(last_viewed_isbns, list):
-                valid_isbns = [isbn for isbn in last_viewed_isbns if validate_isbn(isbn)]
-                if valid_isbns:
-                    _user_service.save_viewed_books(session_id, valid_isbns)
+            # 通过 Service 层在一个事务内保存 view_mode、分类偏好与浏览记录
+            _user_service.save_preferences(get_session_id(), prefs.view_mode, valid_prefs, prefs.last_viewed_isbns)
 
             return APIResponse.success(message='Preferences saved')
 
         else:
-            preferences = _user_service.get_preferences(session_id)
+            session_id = session.get('session_id')
+            preferences = _user_service.get_preferences(session_id) if session_id else {}
             return APIResponse.success(data={'preferences': preferences})
 
     except Exception as e:
@@ -174,43 +202,17 @@ def user_preferences():
 def export_csv(category: str):
     """导出CSV（流式输出，按分类分批生成,避免 category='all' 时内存峰值）"""
     try:
-        if not validate_category(category):
-            return APIResponse.error('Invalid category', 400)
-
         book_service = get_book_service()
         if not book_service:
             return APIResponse.error('Service unavailable', 503)
 
         # 确定要导出的分类列表（延迟到生成器中按分类加载）
-        category_ids = list(current_app.config['CATEGORIES'].keys()) if category == 'all' else [category]
-
-        header_row = [
-            '分类',
-            '书名',
-            '作者',
-            '出版社',
-            '当前排名',
-            '上周排名',
-            '累计上榜周数',
-            '出版日期',
-            '页数',
-            '语言',
-            'ISBN-13',
-            '价格',
-        ]
+        category_ids = current_app.extensions['category_ids'] if category == 'all' else (category,)
 
         def generate():
-            # 输出 UTF-8 BOM,确保 Excel 正确识别中文
-            yield _UTF8_BOM
+            yield _CSV_HEADER
 
-            buf = StringIO()
-            writer = csv.writer(buf)
-            writer.writerow(header_row)
-            yield buf.getvalue().encode()
-            buf.seek(0)
-            buf.truncate()
-
-            # 按分类分批生成,降低内存峰值
+            # 按分类分批生成,每个分类一次性拼接为一个数据块,降低内存峰值
             for cat_id in category_ids:
                 try:
                     books = book_service.get_books_by_category(cat_id)
@@ -222,30 +224,36 @@ def export_csv(category: str):
                     )
                     continue
 
-                for book in books:
-                    writer.writerow(
-                        [
-                            book.category_name,
-                            book.title,
-                            book.author,
-                            book.publisher,
-                            book.rank,
-                            book.rank_last_week,
-                            book.weeks_on_list,
-                            book.publication_dt,
-                            book.page_count,
-                            book.language,
-                            book.isbn13,
-                            book.price,
-                        ]
+                rows = [
+                    ','.join(
+                        map(
+                            _csv_escape,
+                            (
+                                book.category_name,
+                                book.title,
+                                book.author,
+                                book.publisher,
+                                book.rank,
+                                book.rank_last_week,
+                                book.weeks_on_list,
+                                book.publication_dt,
+                                book.page_count,
+                                book.language,
+                                book.isbn13,
+                                book.price,
+                            ),
+                        )
                     )
-                    yield buf.getvalue().encode()
-                    buf.seek(0)
-                    buf.truncate()
+                    + '\r\n'
+                    for book in books
+                ]
+                if rows:
+                    yield ''.join(rows).encode()
 
         filename = f'纽约时报畅销书_{category}_{datetime.now().strftime("%Y%m%d")}.csv'
+        # stream_with_context 保持请求上下文，生成器在响应发送期间仍可访问 current_app
         response = current_app.response_class(
-            generate(),
+            stream_with_context(generate()),
             mimetype='text/csv; charset=utf-8',
         )
         response.headers['Content-Disposition'] = f'attachment; filename={quote(filename)}'
@@ -260,11 +268,6 @@ def export_csv(category: str):
 def get_book_details(isbn: str):
     """从 Google Books API 获取图书详细信息（含中文翻译）"""
     try:
-        if not validate_isbn(isbn):
-            return APIResponse.error('Invalid ISBN format', 400)
-
-        from ...utils.service_helpers import get_or_create_google_books_client
-
         google_client = get_or_create_google_books_client()
 
         try:
@@ -1,7 +1,9 @@
 import logging
 
 from flask import request
+from pydantic import ValidationError
 
+from ...schemas import CacheClearRequest, parse_json_body
 from ...services.api_cache_service import get_api_cache_service
 from ...utils.admin_auth import admin_required
 from ...utils.api_helpers import APIResponse, csrf_protect
@@ -66,11 +68,13 @@ def get_api_cache_recent():
 def clear_api_cache():
     """清理API缓存（通过 Service 层）"""
     try:
-        data = request.get_json() or {}
-        older_than_days = data.get('older_than_days')
+        try:
+            req = parse_json_body(CacheClearRequest, request.get_data())
+        except ValidationError:
+            return APIResponse.error('请求参数无效', 400)
 
         cache_service = get_api_cache_service()
-        deleted = cache_service.delete(older_than_days=older_than_days)
+        deleted = cache_service.delete(older_than_days=req.older_than_days)
 
         return APIResponse.success(message=f'已清理 {deleted} 条API缓存')
 
@@ -1,45 +1,61 @@
 import logging
+from collections.abc import Callable
+from typing import Any
 
-from flask import request
+from flask import request, session
+from sqlalchemy.exc import SQLAlchemyError
 
+from ...services.cache_service import MemoryCache
+from ...services.trie_index import SuggestionTrie, normalize_prefix
 from ...utils.api_helpers import APIResponse, handle_api_errors, validate_pagination
 from ...utils.service_helpers import (
     get_or_create_recommendation_service,
     get_or_create_smart_search_service,
+    get_service,
 )
-from . import api_bp, get_session_id
+from . import api_bp, cached_success, get_session_id, record_in_background
 
 logger = logging.getLogger(__name__)
 
+# 搜索建议的会话级 locus 缓存：session_id -> 上次命中的前缀与前缀树节点
+_LOCUS_TTL = 60
+_locus_cache = MemoryCache(default_ttl=_LOCUS_TTL, max_size=1024)
+
+
+def _similarity_from_request(service, session_id: str, limit: int) -> dict[str, Any]:
+    return service.get_similarity_recommendations(
+        book_id=request.args.get('book_id', type=int),
+        isbn=request.args.get('isbn'),
+        award_id=request.args.get('award_id', type=int),
+        category=request.args.get('category'),
+        limit=limit,
+    )
+
+
+# 会话相关的推荐策略分发表：strategy -> (service, session_id, limit) -> 结果；未知策略按 personalized 处理
+_STRATEGY_DISPATCH: dict[str, Callable[[Any, str, int], dict[str, Any]]] = {
+    'personalized': lambda service, session_id, limit: service.get_personalized_recommendations(session_id, limit),
+    'similarity': _similarity_from_request,
+    'smart': lambda service, session_id, limit: service.get_smart_recommendations(session_id, limit),
+}
+
 
 @api_bp.route('/recommendations')
 @handle_api_errors
 def get_recommendations():
     """获取个性化推荐"""
-    session_id = get_session_id()
     limit = min(max(1, request.args.get('limit', 10, type=int)), 50)
     strategy = request.args.get('strategy', 'personalized')
-    if strategy not in ['personalized', 'similarity', 'smart', 'popular']:
-        strategy = 'personalized'
-
     recommendation_service = get_or_create_recommendation_service()
 
-    if strategy == 'personalized':
-        result = recommendation_service.get_personalized_recommendations(session_id, limit)
-    elif strategy == 'similarity':
-        result = recommendation_service.get_similarity_recommendations(
-            book_id=request.args.get('book_id', type=int),
-            isbn=request.args.get('isbn'),
-            award_id=request.args.get('award_id', type=int),
-            category=request.args.get('category'),
-            limit=limit,
+    if strategy == 'popular':
+        # 热门推荐与会话无关，序列化结果按 limit 短期缓存
+        return cached_success(
+            f'recs:popular:{limit}', lambda: recommendation_service._get_popular_recommendations(limit)
         )
-    elif strategy == 'smart':
-        result = recommendation_service.get_smart_recommendations(session_id, limit)
-    else:
-        result = recommendation_service._get_popular_recommendations(limit)
 
-    return APIResponse.success(data=result)
+    dispatch = _STRATEGY_DISPATCH.get(strategy, _STRATEGY_DISPATCH['personalized'])
+    return APIResponse.success(data=dispatch(recommendation_service, get_session_id(), limit))
 
 
 @api_bp.route('/recommendations/similarity')
@@ -74,12 +90,53 @@ def get_search_suggestions():
     if not prefix:
         return APIResponse.success(data={'suggestions': [], 'prefix': prefix})
 
+    # 优先走进程内前缀树（O(前缀长度)，无数据库往返）；加载失败时回退 LIKE 查询
+    trie = get_service('suggestion_trie')
+    if trie is not None:
+        try:
+            trie.ensure_loaded()
+            return APIResponse.success(data={'suggestions': _suggest_with_locus(trie, prefix, limit), 'prefix': prefix})
+        except SQLAlchemyError as e:
+            logger.warning(f'搜索建议前缀树加载失败，回退数据库查询: {e}')
+
     search_service = get_or_create_smart_search_service()
     result = search_service.get_suggestions(prefix, limit)
 
     return APIResponse.success(data=result)
 
 
+def _suggest_with_locus(trie: SuggestionTrie, prefix: str, limit: int) -> list[dict[str, str]]:
+    """用户逐字输入时新前缀通常是上次前缀的延伸，从上次命中的节点继续下行，跳过公共前缀
+
+    前缀不存在时记录为死前缀（node 为 None）：树内容版本未变时，继续输入的延伸前缀同样不可能命中，直接返回空列表；
+    增量插入会推进版本，使死前缀失效。
+    尚无会话ID时不缓存位置，避免为只读的建议请求生成ID、下发会话 Cookie。
+    """
+    session_id = session.get('session_id')
+    if not session_id:
+        return trie.suggest(prefix, limit)
+    key = normalize_prefix(prefix)
+    cache_key = f'locus:{session_id}'
+    generation, version = trie.generation, trie.version
+    locus = _locus_cache.get(cache_key)
+
+    start, suffix = None, key
+    if locus and key.startswith(locus['prefix']):
+        if locus['node'] is None:
+            if locus['version'] == version:
+                return []
+        elif locus['generation'] == generation:
+            start, suffix = locus['node'], key[len(locus['prefix']) :]
+
+    suggestions, anchor, consumed = trie.suggest_from(start, suffix, limit)
+    if anchor is not None:
+        anchor_prefix = key[: len(key) - len(suffix) + consumed]
+        _locus_cache.set(cache_key, {'prefix': anchor_prefix, 'node': anchor, 'generation': generation})
+    else:
+        _locus_cache.set(cache_key, {'prefix': key, 'node': None, 'version': version})
+    return suggestions
+
+
 @api_bp.route('/search/smart')
 @handle_api_errors
 def smart_search():
@@ -103,8 +160,7 @@ def smart_search():
     )
 
     if keyword:
-        session_id = get_session_id()
-        search_service.save_search_history(session_id, keyword, result.get('total', 0))
+        record_in_background(search_service.save_search_history, get_session_id(), keyword, result.get('total', 0))
 
     return APIResponse.success(data=result)
 
@@ -115,6 +171,4 @@ def get_popular_searches():
     """获取热门搜索词"""
     limit = min(max(1, request.args.get('limit', 10, type=int)), 50)
     search_service = get_or_create_smart_search_service()
-    result = search_service.get_popular_searches(limit)
-
-    return APIResponse.success(data=result)
+    return cached_success(f'search:popular:{limit}', lambda: search_service.get_popular_searches(limit))
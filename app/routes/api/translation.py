@@ -1,15 +1,41 @@
 import logging
 
 from flask import request
+from pydantic import ValidationError
 
+from ...schemas import TranslateRequest, TranslationCacheClearRequest, parse_json_body
+from ...services.award_book_service import AwardBookService
+from ...services.translation_cache_service import get_translation_cache_service
+from ...services.zhipu_translation_service import get_translation_service
 from ...utils.admin_auth import admin_required
-from ...utils.api_helpers import APIResponse, csrf_protect, handle_api_errors, validate_isbn
+from ...utils.api_helpers import APIResponse, csrf_protect, handle_api_errors
 from ...utils.error_handler import ErrorCategory, log_error
 from ...utils.service_helpers import get_book_service
 from . import api_bp
 
 logger = logging.getLogger(__name__)
 
+_award_service = AwardBookService()
+
+_PREVIEW_LENGTH = 100
+
+
+def _preview(text: str | None) -> str | None:
+    """缓存列表摘要：SQL 已截取 _PREVIEW_LENGTH + 1 个字符，超长时补省略号"""
+    if text and len(text) > _PREVIEW_LENGTH:
+        return text[:_PREVIEW_LENGTH] + '...'
+    return text
+
+
+def _translate_error_message(error: ValidationError) -> str:
+    """把 TranslateRequest 校验错误转换为接口既有的提示文案"""
+    for err in error.errors():
+        if err['loc'] == ('text',):
+            if err['type'] == 'string_too_long':
+                return '文本长度超过限制（最大10000字符）'
+            return '缺少要翻译的文本'
+    return '请求参数无效'
+
 
 @api_bp.route('/translate', methods=['POST'])
 @csrf_protect
@@ -19,25 +45,22 @@ def translate_text():
     if not request.is_json:
         return APIResponse.error('Content-Type must be application/json', 400)
 
-    data = request.get_json() or {}
-    text = data.get('text', '').strip()
-    source_lang = data.get('source_lang', 'en')
-    target_lang = data.get('target_lang', 'zh')
-    field_type = data.get('field_type', 'text')
-
-    if not text:
-        return APIResponse.error('缺少要翻译的文本', 400)
-    if len(text) > 10000:
-        return APIResponse.error('文本长度超过限制（最大10000字符）', 400)
-
-    from ...services.zhipu_translation_service import get_translation_service
+    try:
+        req = parse_json_body(TranslateRequest, request.get_data())
+    except ValidationError as e:
+        return APIResponse.error(_translate_error_message(e), 400)
 
     service = get_translation_service()
-    result = service.translate(text, source_lang, target_lang, field_type=field_type)
+    result = service.translate(req.text, req.source_lang, req.target_lang, field_type=req.field_type)
 
     if result:
         return APIResponse.success(
-            data={'original': text, 'translated': result, 'source_lang': source_lang, 'target_lang': target_lang}
+            data={
+                'original': req.text,
+                'translated': result,
+                'source_lang': req.source_lang,
+                'target_lang': req.target_lang,
+            }
         )
     return APIResponse.error('翻译服务暂时不可用', 503)
 
@@ -64,8 +87,6 @@ def translate_book_fields():
     if total_len > 15000:
         return APIResponse.error('文本总长度超过限制（最大15000字符）', 400)
 
-    from ...services.zhipu_translation_service import get_translation_service
-
     service = get_translation_service()
     result = service.translate_book_fields(
         title=title, description=description, details=details, source_lang=source_lang, target_lang=target_lang
@@ -79,20 +100,13 @@ def translate_book_fields():
 @handle_api_errors
 def translate_book(isbn: str):
     """翻译图书信息（同时支持 NYT 分类图书和 AwardBook 获奖书单）"""
-    if not validate_isbn(isbn):
-        return APIResponse.error('无效的ISBN格式', 400)
-
-    from ...services.award_book_service import AwardBookService
-    from ...services.zhipu_translation_service import get_translation_service
-
     book_service = get_book_service()
     book_data = book_service.get_book_by_isbn(isbn) if book_service else None
 
     # Fallback: 查询 AwardBook 表（获奖书单数据不在主 books 缓存中）
     # 注意：用 display_title 替代原始 title，避免 v0.9.57 修复前的 ISBN 脏数据
     # 被当作"书名"送进翻译 API，模型返回 ISBN 字面量后被前端写回页面
-    award_book_service = AwardBookService()
-    award_book = award_book_service.get_award_book_by_isbn(isbn)
+    award_book = _award_service.get_award_book_by_isbn(isbn)
     if award_book and not book_data:
         book_data = {
             'title': award_book.display_title or '',
@@ -116,7 +130,7 @@ def translate_book(isbn: str):
                     details_zh=translated_data.get('details_zh'),
                 )
             if award_book:
-                award_book_service.save_award_book_translation(
+                _award_service.save_award_book_translation(
                     isbn=isbn,
                     title_zh=translated_data.get('title_zh'),
                     description_zh=translated_data.get('description_zh'),
@@ -132,8 +146,6 @@ def translate_book(isbn: str):
 @handle_api_errors
 def get_translation_cache_stats():
     """获取翻译缓存统计信息"""
-    from ...services.zhipu_translation_service import get_translation_service
-
     service = get_translation_service()
     zhipu_available = service.zhipu.is_available()
 
@@ -168,24 +180,20 @@ def get_translation_cache_stats():
 @handle_api_errors
 def get_translation_cache_recent():
     """获取最近的翻译缓存记录"""
-    from ...services.translation_cache_service import get_translation_cache_service
-
     limit = min(max(1, request.args.get('limit', 20, type=int)), 100)
     source_lang = request.args.get('source_lang')
     target_lang = request.args.get('target_lang')
 
     cache_service = get_translation_cache_service()
-    recent = cache_service.get_recent(limit, source_lang, target_lang)
+    recent = cache_service.get_recent_previews(limit, source_lang, target_lang, preview_length=_PREVIEW_LENGTH)
 
     return APIResponse.success(
         data={
             'records': [
                 {
                     'id': r.id,
-                    'source_text': r.source_text[:100] + '...' if len(r.source_text) > 100 else r.source_text,
-                    'translated_text': r.translated_text[:100] + '...'
-                    if len(r.translated_text) > 100
-                    else r.translated_text,
+                    'source_text': _preview(r.source_text),
+                    'translated_text': _preview(r.translated_text),
                     'source_lang': r.source_lang,
                     'target_lang': r.target_lang,
                     'usage_count': r.usage_count,
@@ -205,12 +213,13 @@ def get_translation_cache_recent():
 @handle_api_errors
 def clear_translation_cache():
     """清理翻译缓存"""
-    from ...services.translation_cache_service import get_translation_cache_service
-
-    data = request.get_json() or {}
-    cache_id = data.get('cache_id')
-    older_than_days = data.get('older_than_days')
-    min_usage = data.get('min_usage')
+    try:
+        req = parse_json_body(TranslationCacheClearRequest, request.get_data())
+    except ValidationError:
+        return APIResponse.error('请求参数无效', 400)
+    cache_id = req.cache_id
+    older_than_days = req.older_than_days
+    min_usage = req.min_usage
 
     cache_service = get_translation_cache_service()
 
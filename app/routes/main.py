@@ -1,6 +1,5 @@
 import ipaddress
 import logging
-import re
 from pathlib import Path
 
 from flask import (
@@ -15,23 +14,25 @@ from flask import (
     send_from_directory,
     url_for,
 )
-from werkzeug.utils import secure_filename
 
 from ..data.publishers import PUBLISHERS_DATA
+from ..models.schemas import AwardBook
 from ..services.book_detail_service import fetch_google_books_details, is_valid_isbn, merge_or_translate_book
 from ..utils import ExternalAPIError
-from ..utils.api_helpers import APIResponse, handle_api_errors, quick_clean_translation
+from ..utils.api_helpers import APIResponse, api_rate_limit, handle_api_errors, quick_clean_translation
 from ..utils.book_filters import (
+    BookSearchIndex,
     filter_books_by_publisher,
     filter_books_by_search,
     filter_books_by_weeks,
     get_category_update_frequency,
     sort_books,
 )
+from ..utils.cache import result_cache
 from ..utils.date_helpers import parse_report_content, validate_date
 from ..utils.error_handler import ErrorCategory, log_error
 from ..utils.security import is_safe_redirect_url
-from ..utils.template_resolver import render_adaptive
+from ..utils.template_resolver import render_adaptive, stream_adaptive
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 from ..utils.service_helpers import (
@@ -47,6 +48,14 @@ from ..utils.service_helpers import (
 main_bp = Blueprint('main', __name__)
 logger = logging.getLogger(__name__)
 
+_HEX_DIGITS = frozenset('0123456789abcdef')
+_IMAGE_MAX_AGE = 365 * 24 * 3600
+
+
+def _is_cache_image_name(filename: str) -> bool:
+    """缓存图片文件名：32 位小写十六进制哈希 + .jpg（字符串方法判断，不走正则）"""
+    return len(filename) == 36 and filename.endswith('.jpg') and _HEX_DIGITS.issuperset(filename[:32])
+
 
 def _get_list_published_date(books_data: list[dict]) -> str | None:
     for book in books_data:
@@ -56,18 +65,27 @@ def _get_list_published_date(books_data: list[dict]) -> str | None:
     return None
 
 
+def _resolve_category(category: str | None) -> str:
+    """校验分类 ID，缺失或无效时回退到第一个分类"""
+    categories: dict[str, str] = current_app.config['CATEGORIES']
+    if category is not None and category in categories:
+        return category
+    return next(iter(categories))
+
+
 def _get_books_for_category(category: str) -> tuple[list, str | None]:
     """获取指定分类的书籍数据（统一入口）"""
-    categories = current_app.config['CATEGORIES']
-    default_category = next(iter(categories.keys()))
-    if category not in categories:
-        category = default_category
+    category = _resolve_category(category)
 
     book_service = get_book_service()
     if not book_service:
         return [], None
 
-    books_data, update_time = [], None
+    # 缓存键带上数据更新时间，榜单刷新后自动失效；命中时跳过 Book 重建与 to_dict
+    update_time = _get_category_cache_time(book_service, category)
+    books_data = result_cache.get(f'category_books:{category}:{update_time}') if update_time else None
+    if books_data is not None:
+        return books_data, update_time
 
     try:
         books = book_service.get_books_by_category(category) or []
@@ -77,24 +95,39 @@ def _get_books_for_category(category: str) -> tuple[list, str | None]:
             f"获取分类 '{category}' 数据失败", api_name='book_service', details={'category': category}
         ) from e
 
+    if update_time is None:
+        # 首次抓取才写入图书缓存，此时再读取更新时间
+        update_time = _get_category_cache_time(book_service, category)
+    if books_data and update_time:
+        result_cache.set(f'category_books:{category}:{update_time}', books_data, ttl=300)
+    return books_data, update_time
+
+
+def _get_category_search_index(category: str, update_time: str | None, books_data: list[dict]) -> BookSearchIndex:
+    """分类图书的检索索引，与 _get_books_for_category 的结果同键缓存，重复搜索只校验候选书籍"""
+    if not update_time:
+        return BookSearchIndex(books_data)
+    cache_key = f'category_search_index:{category}:{update_time}'
+    search_index = result_cache.get(cache_key)
+    if search_index is None or len(search_index) != len(books_data):
+        search_index = BookSearchIndex(books_data)
+        result_cache.set(cache_key, search_index, ttl=300)
+    return search_index
+
+
+def _get_category_cache_time(book_service, category: str) -> str | None:
     try:
-        update_time = book_service.get_cache_time(category)
+        return book_service.get_cache_time(category)
     except Exception as e:
         log_error(ErrorCategory.CACHE, f'获取缓存时间失败: {e}')
-        update_time = None
-
-    return books_data, update_time
+        return None
 
 
 @main_bp.route('/')
 def index():
     """首页 - 畅销书榜单（支持多维度筛选和排序）"""
     categories = current_app.config['CATEGORIES']
-    default_category = next(iter(categories.keys()))
-
-    category = request.args.get('category', default_category)
-    if category not in categories:
-        category = default_category
+    category = _resolve_category(request.args.get('category'))
 
     search_query = request.args.get('search', '').strip()[:100]
     view_mode = request.args.get('view', 'list')
@@ -116,7 +149,9 @@ def index():
     list_published_date = _get_list_published_date(books_data)
 
     if search_query:
-        books_data = filter_books_by_search(books_data, search_query)
+        books_data = filter_books_by_search(
+            books_data, search_query, _get_category_search_index(category, update_time, books_data)
+        )
     if publisher_filter:
         books_data = filter_books_by_publisher(books_data, publisher_filter)
     if weeks_filter:
@@ -147,11 +182,7 @@ def index():
         sort_by=sort_by,
         update_frequency=update_frequency,
         list_published_date=list_published_date,
-        monthly_categories=sorted(
-            category_id
-            for category_id, frequency in current_app.config['NYT_CATEGORY_UPDATE_FREQUENCIES'].items()
-            if frequency == 'monthly'
-        ),
+        monthly_categories=current_app.config['NYT_MONTHLY_CATEGORIES'],
         active_tab='home',
     )
 
@@ -159,13 +190,22 @@ def index():
 @main_bp.route('/cache/images/<filename>')
 def cached_image(filename: str):
     """提供缓存的图片文件（安全验证文件名格式，防止路径遍历攻击）"""
-    if not re.match(r'^[a-f0-9]{32}\.jpg$', filename):
+    # 文件名只含十六进制字符与 .jpg，校验通过即不可能包含路径分隔符
+    if not _is_cache_image_name(filename):
         abort(404)
 
-    safe_filename = secure_filename(filename)
-    cache_dir = current_app.config.get('IMAGE_CACHE_DIR', Path('cache/images'))
-
-    return send_from_directory(cache_dir, safe_filename)
+    accel_prefix = current_app.config.get('IMAGE_ACCEL_REDIRECT_PREFIX')
+    if accel_prefix:
+        # 交给 nginx 的 internal location 以 sendfile 发送，worker 无需读取文件
+        response = make_response('')
+        response.headers['X-Accel-Redirect'] = f'{accel_prefix.rstrip("/")}/{filename}'
+        response.headers['Content-Type'] = 'image/jpeg'
+    else:
+        cache_dir = current_app.config.get('IMAGE_CACHE_DIR', Path('cache/images'))
+        response = send_from_directory(cache_dir, filename, max_age=_IMAGE_MAX_AGE)
+    # 文件名是原图 URL 的哈希，内容不会变化，浏览器与 CDN 可长期缓存且无需重新验证
+    response.headers['Cache-Control'] = f'public, max-age={_IMAGE_MAX_AGE}, immutable'
+    return response
 
 
 @main_bp.route('/award-book/<int:book_id>/cover')
@@ -196,13 +236,30 @@ def award_book_cover(book_id: int):
 @main_bp.route('/awards')
 def awards():
     """图书奖项榜单页面（通过 Service 层，含服务端分页）"""
+    context = _get_awards_context(_parse_awards_params(request.args))
+    return current_app.response_class(stream_adaptive('awards.html', **context, active_tab='awards'))
+
+
+@main_bp.route('/awards.json')
+@api_rate_limit(max_requests=60, window=60)
+def awards_json():
+    """奖项榜单数据（与 /awards 同参数、同缓存），供前端局部刷新/客户端渲染"""
+    context = _get_awards_context(_parse_awards_params(request.args))
+    return APIResponse.success(data=context)
+
+
+def _get_awards_context(params: dict) -> dict:
+    """按规范化后的查询条件缓存 /awards 的上下文；HTML 含每请求的 CSP nonce 与语言/设备差异，仍逐次渲染"""
     from ..services.award_book_service import AwardBookService
 
-    award_service = AwardBookService()
-    params = _parse_awards_params(request.args)
-    context = _load_awards_data(award_service, params)
-    context['active_tab'] = 'awards'
-    return render_adaptive('awards.html', **context)
+    cache_key = 'awards_page:' + repr(tuple(params.values()))
+    context = result_cache.get(cache_key)
+    if context is None:
+        context, complete = _load_awards_data(AwardBookService(), params)
+        # 部分查询失败时不缓存，避免把降级页面固定 5 分钟
+        if complete:
+            result_cache.set(cache_key, context, ttl=300)
+    return context
 
 
 def _parse_awards_params(args) -> dict:
@@ -216,7 +273,7 @@ def _parse_awards_params(args) -> dict:
         view_mode = 'grid'
 
     try:
-        page = max(1, int(args.get('page', '1')))
+        page = min(max(1, int(args.get('page', '1'))), 10000)
     except (ValueError, TypeError):
         page = 1
     try:
@@ -243,103 +300,113 @@ def _parse_awards_params(args) -> dict:
     }
 
 
-def _load_awards_data(award_service, params: dict) -> dict:
-    """加载 awards() 渲染所需的所有数据，返回模板上下文 dict（含分页元信息）"""
+def _award_book_card(row: dict) -> dict:
+    """把 get_award_book_rows 返回的列字典整理为 awards 模板使用的卡片 dict（原地修改）"""
+    raw_title = (row['title'] or '').strip()
+    display_title = AwardBook.pick_display_title(row['title'], row['title_zh'])
+    # title_en: 原始 DB title 供前端 data-en 使用；若原始 title 是 ISBN 脏数据则退回 display_title
+    title_en = display_title or '' if AwardBook._looks_like_isbn(raw_title) else (raw_title or display_title or '')
+
+    # title_zh: 清理后的中文标题；ISBN 脏数据直接清空
+    raw_zh = quick_clean_translation(row['title_zh'], 'title') or ''
+
+    row.update(
+        title=display_title,
+        title_en=title_en,
+        title_zh='' if AwardBook._looks_like_isbn(raw_zh) else raw_zh,
+        description_zh=quick_clean_translation(row['description_zh'], 'description'),
+        award_name=row['award_name'] or '未知奖项',
+    )
+    return row
+
+
+_AWARD_FILTERS_TTL = 3600
+_AWARD_COUNTS_TTL = 300
+
+
+def _award_summary(award) -> dict:
+    """奖项页侧栏与卡片所需的奖项字段"""
+    return {'id': award.id, 'name': award.name, 'country': award.country, 'description': award.description}
+
+
+def _load_awards_data(award_service, params: dict) -> tuple[dict, bool]:
+    """加载 awards() 渲染所需的所有数据，返回 (模板上下文 dict（含分页元信息）, 是否全部查询成功)"""
+    complete = True
     awards_list: list = []
     years: list = []
     categories: list = []
     books_data: list = []
     total_books = 0
 
+    # 奖项列表与筛选项极少变化，跨查询条件共享缓存；结果为空时不缓存，避免固定降级数据
     try:
-        awards_list = award_service.get_all_awards()
+        awards_list = result_cache.get('awards_page:awards')
+        if awards_list is None:
+            awards_list = [_award_summary(award) for award in award_service.get_all_awards()]
+            if awards_list:
+                result_cache.set('awards_page:awards', awards_list, ttl=_AWARD_FILTERS_TTL)
     except Exception as e:
         log_error(ErrorCategory.DB_QUERY, f'奖项列表查询失败: {e}', exc_info=True)
         awards_list = []
+        complete = False
 
     try:
-        years = award_service.get_distinct_years()
-    except Exception as e:
-        log_error(ErrorCategory.DB_QUERY, f'年份列表查询失败: {e}', level='warning')
-        years = []
-
-    try:
-        categories = award_service.get_distinct_categories()
+        filters = result_cache.get('awards_page:filters')
+        if filters is None:
+            filters = award_service.get_distinct_years_and_categories()
+            if filters[0]:
+                result_cache.set('awards_page:filters', filters, ttl=_AWARD_FILTERS_TTL)
+        years, categories = filters
     except Exception as e:
-        log_error(ErrorCategory.DB_QUERY, f'类别列表查询失败: {e}', level='warning')
-        categories = []
+        log_error(ErrorCategory.DB_QUERY, f'年份与类别列表查询失败: {e}', level='warning')
+        years, categories = [], []
+        complete = False
 
     try:
         award_id = None
+        award_missing = False
         if params['selected_award']:
-            award = award_service.get_award_by_name(params['selected_award'])
-            if award:
-                award_id = award.id
-
-        year = int(params['selected_year']) if params['selected_year'] else None
-        books, total_books = award_service.get_award_books(
-            award_id=award_id,
-            year=year,
-            category=params['selected_category'] or None,
-            keyword=params['search_query'] or None,
-            include_displayable_only=True,
-            page=params['page'],
-            limit=params['per_page'],
-        )
-
-        def _is_isbn(text: str) -> bool:
-            """简易 ISBN 检测：10/13 位纯数字（可含连字符/空格）"""
-            if not text:
-                return False
-            c = text.replace('-', '').replace(' ', '')
-            return c.isdigit() and len(c) in (10, 13)
-
-        for book in books:
-            # title_en: 原始 DB title 供前端 data-en 使用；
-            # 若原始 title 是 ISBN 脏数据则退回 display_title
-            raw_title = (book.title or '').strip()
-            title_en = book.display_title or '' if _is_isbn(raw_title) else (raw_title or book.display_title or '')
-
-            # title_zh: 清理后的中文标题；ISBN 脏数据直接清空
-            raw_zh = quick_clean_translation(book.title_zh, 'title')
-            title_zh = '' if _is_isbn(raw_zh or '') else (raw_zh or '')
-
-            books_data.append(
-                {
-                    'id': book.id,
-                    'title': book.display_title,
-                    'title_en': title_en,
-                    'title_zh': title_zh,
-                    'description': book.description,
-                    'description_zh': quick_clean_translation(book.description_zh, 'description'),
-                    'details': book.details,
-                    'cover_local_path': book.cover_local_path,
-                    'cover_original_url': book.cover_original_url,
-                    'isbn13': book.isbn13,
-                    'isbn10': book.isbn10,
-                    'publisher': book.publisher,
-                    'publication_year': book.publication_year,
-                    'year': book.year,
-                    'category': book.category,
-                    'award_name': book.award.name if book.award else '未知奖项',
-                    'buy_links': book.buy_links,
-                }
+            # 奖项列表已整表载入，按名称在内存中查找；仅列表加载失败时才回退查询
+            award_id = {a['name']: a['id'] for a in awards_list}.get(params['selected_award'])
+            if award_id is None and not awards_list:
+                award = award_service.get_award_by_name(params['selected_award'])
+                award_id = award.id if award else None
+            award_missing = award_id is None
+
+        # 指定的奖项不存在时结果必为空，直接跳过图书查询
+        if not award_missing:
+            year = int(params['selected_year']) if params['selected_year'] else None
+            rows, total_books = award_service.get_award_book_rows(
+                award_id=award_id,
+                year=year,
+                category=params['selected_category'] or None,
+                keyword=params['search_query'] or None,
+                include_displayable_only=True,
+                page=params['page'],
+                limit=params['per_page'],
             )
+            books_data = [_award_book_card(row) for row in rows]
 
-        book_counts = award_service.get_book_counts_by_award(displayable_only=True)
-        for award_item in awards_list:
-            award_item.book_count = book_counts.get(award_item.id, 0)
+        # 各奖项计数与筛选条件无关，跨查询共享；没有奖项可标注时不做 GROUP BY
+        if awards_list:
+            book_counts = result_cache.get('awards_page:book_counts')
+            if book_counts is None:
+                book_counts = award_service.get_book_counts_by_award(displayable_only=True)
+                result_cache.set('awards_page:book_counts', book_counts, ttl=_AWARD_COUNTS_TTL)
+            # 缓存中的奖项摘要是共享的，计数写入副本
+            awards_list = [{**award, 'book_count': book_counts.get(award['id'], 0)} for award in awards_list]
 
     except Exception as e:
         log_error(ErrorCategory.DB_QUERY, f'获奖图书数据加载失败: {e}', exc_info=True)
         books_data = []
+        complete = False
         total_books = 0
 
     per_page = params['per_page']
     page = params['page']
     total_pages = max(1, (total_books + per_page - 1) // per_page) if total_books else 1
 
-    return {
+    context = {
         'awards': awards_list,
         'books': books_data,
         'years': years,
@@ -356,6 +423,7 @@ def _load_awards_data(award_service, params: dict) -> dict:
         'has_prev': page > 1,
         'has_next': page < total_pages,
     }
+    return context, complete
 
 
 @main_bp.route('/new-books')
@@ -498,6 +566,7 @@ def favicon():
         current_app.static_folder or current_app.root_path + '/static',
         'favicon.ico',
         mimetype='image/vnd.microsoft.icon',
+        max_age=current_app.config['SEND_FILE_MAX_AGE_DEFAULT'],
     )
 
 
@@ -591,11 +660,10 @@ def new_book_detail(book_id):
 @main_bp.route('/award-book/<int:book_id>')
 def award_book_detail(book_id):
     """获奖图书详情（通过 Service 层）"""
-    from ..models.schemas import AwardBook
     from ..services.award_book_service import AwardBookService
 
     award_service = AwardBookService()
-    book = award_service.get_award_book_by_id(book_id)
+    book = award_service.get_award_book_by_id(book_id, with_award=True)
 
     if book:
         if not book.is_displayable:
@@ -643,11 +711,7 @@ def award_book_detail(book_id):
 def book_detail(book_index):
     """书籍详情页（集成 Google Books API 获取详细信息）"""
     categories = current_app.config['CATEGORIES']
-    default_category = next(iter(categories.keys()))
-
-    category = request.args.get('category', default_category)
-    if category not in categories:
-        category = default_category
+    category = _resolve_category(request.args.get('category'))
 
     try:
         books_data, _ = _get_books_for_category(category)
@@ -658,7 +722,8 @@ def book_detail(book_index):
     if book_index < 0 or book_index >= len(books_data):
         return render_adaptive('error.html', message='书籍不存在', back_url=request.referrer or '/')
 
-    book = books_data[book_index]
+    # 列表可能来自共享缓存，补充详情前先复制，避免改写缓存中的数据
+    book = dict(books_data[book_index])
 
     isbn = book.get('isbn13') or book.get('isbn10')
     if isbn and is_valid_isbn(isbn):
@@ -3,7 +3,7 @@ import logging
 import threading
 import time
 from datetime import UTC, datetime
-from io import StringIO
+from io import BytesIO, TextIOWrapper
 from urllib.parse import quote
 
 from flask import Blueprint, current_app, make_response, request
@@ -394,7 +394,10 @@ def export_csv():
             per_page=500,
         )
 
-        output = StringIO()
+        # csv.writer 直接写入字节缓冲：utf-8-sig 在首次写入时输出 BOM（确保 Excel 识别中文），
+        # 全程只编码一次，不再先拼出完整字符串再整体 encode
+        buffer = BytesIO()
+        output = TextIOWrapper(buffer, encoding='utf-8-sig', newline='', write_through=True)
         writer = csv.writer(output)
         writer.writerow(
             [
@@ -415,31 +418,28 @@ def export_csv():
             ]
         )
 
-        for book in books:
-            writer.writerow(
-                [
-                    _sanitize_csv_field(book.title),
-                    _sanitize_csv_field(book.title_zh or ''),
-                    _sanitize_csv_field(book.author),
-                    _sanitize_csv_field(book.publisher.name if book.publisher else ''),
-                    _sanitize_csv_field(book.category or ''),
-                    book.publication_date.isoformat() if book.publication_date else '',
-                    _sanitize_csv_field(book.isbn13 or ''),
-                    _sanitize_csv_field(book.isbn10 or ''),
-                    _sanitize_csv_field(book.price or ''),
-                    book.page_count or '',
-                    _sanitize_csv_field(book.language or ''),
-                    _sanitize_csv_field(book.description or ''),
-                    _sanitize_csv_field(book.description_zh or ''),
-                    _sanitize_csv_field(book.source_url or ''),
-                ]
-            )
-
-        output.seek(0)
-        csv_content = output.getvalue()
-        response_data = '\ufeff'.encode('utf-8') + csv_content.encode('utf-8')
+        writer.writerows(
+            [
+                _sanitize_csv_field(book.title),
+                _sanitize_csv_field(book.title_zh or ''),
+                _sanitize_csv_field(book.author),
+                _sanitize_csv_field(book.publisher.name if book.publisher else ''),
+                _sanitize_csv_field(book.category or ''),
+                book.publication_date.isoformat() if book.publication_date else '',
+                _sanitize_csv_field(book.isbn13 or ''),
+                _sanitize_csv_field(book.isbn10 or ''),
+                _sanitize_csv_field(book.price or ''),
+                book.page_count or '',
+                _sanitize_csv_field(book.language or ''),
+                _sanitize_csv_field(book.description or ''),
+                _sanitize_csv_field(book.description_zh or ''),
+                _sanitize_csv_field(book.source_url or ''),
+            ]
+            for book in books
+        )
+        output.detach()
 
-        response = make_response(response_data)
+        response = make_response(buffer.getvalue())
         # v0.9.64 L2: RFC 5987 国际化文件名（支持 UTF-8 编码）
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename_ascii = f'NewBooks_{timestamp}.csv'  # ASCII 备用名（旧浏览器）
@@ -1,13 +1,14 @@
 import logging
-import re
 from datetime import datetime
 
 from flask import Blueprint, current_app, request
 
 from ..services.award_book_service import AwardBookService
-from ..utils.api_helpers import PublicAPIResponse, public_rate_limit, validate_isbn
+from ..services.new_book import NewBookService
+from ..services.weekly_report_service import WeeklyReportService
+from ..utils.api_helpers import PublicAPIResponse, public_rate_limit, validate_isbn, validate_search_keyword
 from ..utils.error_handler import ErrorCategory, log_error
-from ..utils.service_helpers import get_book_service
+from ..utils.service_helpers import get_book_service, get_or_create_recommendation_service
 
 logger = logging.getLogger(__name__)
 
@@ -26,10 +27,12 @@ def get_all_bestsellers():
             return PublicAPIResponse.error('Service unavailable', 503)
         categories = current_app.config.get('CATEGORIES', {})
 
-        all_books = {}
-        for cat_id, cat_name in categories.items():
-            books = book_service.get_books_by_category(cat_id)
-            all_books[cat_id] = {'category_name': cat_name, 'books': [book.to_dict() for book in books[:limit]]}
+        # 各分类一次性并发获取，缓存未命中时总耗时取决于最慢的分类而非各分类之和
+        books_by_category = book_service.get_books_by_categories(tuple(categories))
+        all_books = {
+            cat_id: {'category_name': categories[cat_id], 'books': [book.to_dict() for book in books[:limit]]}
+            for cat_id, books in books_by_category.items()
+        }
 
         return PublicAPIResponse.success(
             data={'categories': categories, 'books': all_books, 'last_updated': book_service.get_latest_cache_time()}
@@ -81,7 +84,7 @@ def search_bestsellers():
             return PublicAPIResponse.error('Keyword must be at least 2 characters', 400)
         if len(keyword) > 100:
             return PublicAPIResponse.error('Keyword must be at most 100 characters', 400)
-        if not re.match(r'^[\w\s\-\u4e00-\u9fff]+$', keyword):
+        if not validate_search_keyword(keyword):
             return PublicAPIResponse.error('Invalid keyword format', 400)
 
         limit = min(request.args.get('limit', 20, type=int), 50)
@@ -223,8 +226,6 @@ def get_book_details(isbn: str):
 @public_rate_limit(max_requests=60, window=60)
 def get_weekly_reports():
     try:
-        from ..services.weekly_report_service import WeeklyReportService
-
         limit = min(request.args.get('limit', 10, type=int), 50)
         book_service = get_book_service()
         if not book_service:
@@ -245,8 +246,6 @@ def get_weekly_reports():
 @public_rate_limit(max_requests=60, window=60)
 def get_latest_weekly_report():
     try:
-        from ..services.weekly_report_service import WeeklyReportService
-
         book_service = get_book_service()
         if not book_service:
             return PublicAPIResponse.error('Service unavailable', 503)
@@ -267,8 +266,6 @@ def get_latest_weekly_report():
 @public_rate_limit(max_requests=60, window=60)
 def get_weekly_report_by_date(date: str):
     try:
-        from ..services.weekly_report_service import WeeklyReportService
-
         try:
             report_date = datetime.strptime(date, '%Y-%m-%d').date()
         except ValueError:
@@ -294,8 +291,6 @@ def get_weekly_report_by_date(date: str):
 @public_rate_limit(max_requests=60, window=60)
 def get_new_books():
     try:
-        from ..services.new_book import NewBookService
-
         page = max(request.args.get('page', 1, type=int), 1)
         per_page = min(request.args.get('per_page', 20, type=int), 50)
         category = request.args.get('category')
@@ -321,8 +316,6 @@ def get_new_books():
 @public_rate_limit(max_requests=60, window=60)
 def get_new_books_by_publisher(publisher_name: str):
     try:
-        from ..services.new_book import NewBookService
-
         page = max(request.args.get('page', 1, type=int), 1)
         per_page = min(request.args.get('per_page', 20, type=int), 50)
 
@@ -352,11 +345,9 @@ def get_new_books_by_publisher(publisher_name: str):
 @public_rate_limit(max_requests=60, window=60)
 def get_recommendations():
     try:
-        from ..services.recommendation_service import RecommendationService
-
         limit = min(request.args.get('limit', 10, type=int), 50)
 
-        service = RecommendationService()
+        service = get_or_create_recommendation_service()
         result = service.get_smart_recommendations(limit=limit)
 
         return PublicAPIResponse.success(data=result)
@@ -9,6 +9,7 @@ from .validators import (
     TranslateRequest,
     TranslationCacheClearRequest,
     UserPreferencesUpdate,
+    parse_json_body,
 )
 
 __all__ = [
@@ -22,4 +23,5 @@ __all__ = [
     'TranslateRequest',
     'TranslationCacheClearRequest',
     'UserPreferencesUpdate',
+    'parse_json_body',
 ]
@@ -1,5 +1,9 @@
+from typing import Any
+
 from pydantic import BaseModel, Field, field_validator
 
+from ..utils.api_helpers import validate_isbn, validate_search_keyword
+
 
 class BookSearchRequest(BaseModel):
     keyword: str = Field(min_length=2, max_length=100)
@@ -7,10 +11,8 @@ class BookSearchRequest(BaseModel):
     @field_validator('keyword')
     @classmethod
     def validate_keyword_format(cls, v: str) -> str:
-        import re
-
         v = v.strip()
-        if not re.match(r'^[\w\s\-\u4e00-\u9fff]+$', v):
+        if not validate_search_keyword(v):
             raise ValueError('关键词格式无效')
         return v
 
@@ -21,6 +23,11 @@ class TranslateRequest(BaseModel):
     target_lang: str = Field(default='zh', pattern=r'^[a-z]{2}(-[A-Z]{2})?$')
     field_type: str = Field(default='text')
 
+    @field_validator('text', mode='before')
+    @classmethod
+    def strip_text(cls, v: Any) -> Any:
+        return v.strip() if isinstance(v, str) else v
+
 
 class TranslateBookFieldsRequest(BaseModel):
     title: str = Field(default='')
@@ -71,10 +78,7 @@ class UserPreferencesUpdate(BaseModel):
     def validate_isbns(cls, v: list[str] | None) -> list[str] | None:
         if v is None:
             return v
-        import re
-
-        isbn_pattern = re.compile(r'^\d{10}(\d{3})?$|^\d{3}-\d{1,5}-\d{1,7}-\d{1,7}-\d{1,3}$')
-        valid = [isbn for isbn in v if isbn_pattern.match(isbn.replace('-', ''))]
+        valid = [isbn for isbn in v if validate_isbn(isbn)]
         return valid if valid else None
 
 
@@ -147,6 +151,14 @@ class NewBookSyncQuery(BaseModel):
     max_books: int = Field(default=30, ge=1, le=100)
 
 
+def parse_json_body(model_cls: type[BaseModel], body: bytes | str) -> BaseModel:
+    """把请求体 JSON 直接交给 Pydantic（pydantic-core）解析并校验，不经过 get_json 生成中间 dict。
+
+    空请求体按 {} 处理；解析或校验失败抛 ValidationError，由路由层转换为 400。
+    """
+    return model_cls.model_validate_json(body or b'{}')
+
+
 def parse_query_args(model_cls: type[BaseModel], args) -> BaseModel:
     """v0.9.63 新增：把 Flask request.args 解析为 Pydantic 模型。
 
@@ -11,6 +11,7 @@ from threading import Lock
 from typing import Any
 
 from sqlalchemy import func
+from sqlalchemy.orm import load_only
 
 from ..models.database import db
 from ..models.schemas import APICache
@@ -282,7 +283,18 @@ class APICacheService:
     def get_recent_records(self, limit: int = 20, api_source: str | None = None) -> list[APICache]:
         """获取最近的 API 缓存记录"""
         try:
-            query = APICache.query
+            # 列表只展示元数据，不加载 response_data / error_message 大字段
+            query = APICache.query.options(
+                load_only(
+                    APICache.id,
+                    APICache.api_source,
+                    APICache.request_key,
+                    APICache.status_code,
+                    APICache.usage_count,
+                    APICache.created_at,
+                    APICache.expires_at,
+                )
+            )
             if api_source:
                 query = query.filter_by(api_source=api_source)
             return query.order_by(APICache.last_used_at.desc()).limit(limit).all()
@@ -9,17 +9,55 @@ import json
 import logging
 import time
 from datetime import datetime, timedelta
+from functools import cached_property
+from operator import attrgetter, itemgetter
 from typing import Any
 
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from ..models import db
 from ..models.schemas import Award, AwardBook, SystemConfig
+from ..utils.api_helpers import escape_like
 from ..utils.error_handler import ErrorCategory, log_error
 from .api_client import GoogleBooksClient, ImageCacheService, OpenLibraryClient, WikidataClient
+from .cache_service import MemoryCache
 
 logger = logging.getLogger(__name__)
 
+# 搜索结果与游标分页共用的排序：(year, id) 倒序，id 保证同年内顺序稳定，页码与游标翻页结果一致
+_KEYSET_ORDER = (AwardBook.year.desc(), AwardBook.id.desc())
+
+# 奖项页卡片所需的字段：按列查询，结果行不经过 ORM 实例化与身份映射；award_name 取自 JOIN 的奖项
+_AWARD_CARD_FIELDS = (
+    'id',
+    'title',
+    'title_zh',
+    'description',
+    'description_zh',
+    'details',
+    'cover_local_path',
+    'cover_original_url',
+    'isbn13',
+    'isbn10',
+    'publisher',
+    'publication_year',
+    'year',
+    'category',
+    'buy_links',
+    'award_name',
+)
+_AWARD_CARD_COLUMNS = (
+    *(getattr(AwardBook, name) for name in _AWARD_CARD_FIELDS[:-1]),
+    Award.name.label('award_name'),
+)
+# attrgetter 一次取齐卡片字段，丢弃窗口计数列
+_get_award_card_fields = attrgetter(*_AWARD_CARD_FIELDS)
+
+
+def _award_card_row(row) -> dict[str, Any]:
+    """把带窗口计数的列查询结果行转为卡片字段 dict"""
+    return dict(zip(_AWARD_CARD_FIELDS, _get_award_card_fields(row), strict=True))
+
 
 class AwardBookService:
     """
@@ -54,10 +92,12 @@ class AwardBookService:
         'nobel_literature': '文学',
     }
 
+    # 搜索结果总数缓存时间（秒）
+    SEARCH_COUNT_TTL = 30
+
     def __init__(self, app=None):
         self.app = app
-        self.wikidata_client = WikidataClient(timeout=30)
-        self.openlib_client = OpenLibraryClient(timeout=10)
+        self._count_cache = MemoryCache(default_ttl=self.SEARCH_COUNT_TTL, max_size=512)
 
         # Google Books 客户端需要 api_key 和 base_url
         if app:
@@ -76,6 +116,16 @@ class AwardBookService:
         else:
             self.image_cache = None
 
+    # 外部数据源客户端各自持有带重试的 HTTP 会话，只有数据刷新/补全时才用到；
+    # 延迟到首次访问再创建，路由中按请求构造的服务实例不必为此付出建会话的开销
+    @cached_property
+    def wikidata_client(self) -> WikidataClient:
+        return WikidataClient(timeout=30)
+
+    @cached_property
+    def openlib_client(self) -> OpenLibraryClient:
+        return OpenLibraryClient(timeout=10)
+
     def should_refresh(self, force: bool = False, refresh_interval_days: int = 7) -> bool:
         """
         检查是否需要刷新数据
@@ -226,11 +276,10 @@ class AwardBookService:
             db.session.flush()
             logger.info(f'✅ 创建奖项: {award_name}')
 
-        # 批量预加载该奖项全部 AwardBook，避免循环内单条查询（N+1）
+        # 批量预加载该奖项全部 AwardBook，避免循环内单条查询（N+1）；
+        # 这些书同属一个已在会话中的奖项，无需再 JOIN 奖项列
         existing_books = {
-            book.isbn13: book
-            for book in AwardBook.query.filter_by(award_id=award.id).options(selectinload(AwardBook.award)).all()
-            if book.isbn13
+            book.isbn13: book for book in AwardBook.query.filter_by(award_id=award.id).all() if book.isbn13
         }
 
         # 处理每本图书（基于时间戳的限速，避免阻塞线程）
@@ -496,6 +545,39 @@ class AwardBookService:
             log_error(ErrorCategory.DB_QUERY, f'获取奖项失败: {e}')
             return None
 
+    @staticmethod
+    def _filter_award_books(
+        query,
+        award_id: int | None = None,
+        year: int | None = None,
+        category: str | None = None,
+        keyword: str | None = None,
+        include_displayable_only: bool = False,
+    ):
+        """按奖项/年份/类别/关键词等条件过滤获奖图书查询"""
+        if award_id:
+            query = query.filter_by(award_id=award_id)
+        if year:
+            query = query.filter_by(year=year)
+        if category:
+            query = query.filter_by(category=category)
+        if include_displayable_only:
+            query = query.filter_by(is_displayable=True)
+        if keyword:
+            escaped = escape_like(keyword)
+            query = query.filter(
+                db.or_(
+                    AwardBook.title.ilike(f'%{escaped}%', escape='\\'),
+                    AwardBook.author.ilike(f'%{escaped}%', escape='\\'),
+                )
+            )
+        return query
+
+    @staticmethod
+    def _award_loader(award_id: int | None):
+        """限定单个奖项时 JOIN 取奖项；跨奖项的结果集改用 SELECT IN，避免每行重复奖项列（含长描述）"""
+        return joinedload(AwardBook.award) if award_id else selectinload(AwardBook.award)
+
     def get_award_books(
         self,
         award_id: int | None = None,
@@ -513,42 +595,109 @@ class AwardBookService:
             (books, total) 元组
         """
         try:
-            query = AwardBook.query
+            query = self._filter_award_books(
+                AwardBook.query, award_id, year, category, keyword, include_displayable_only
+            )
 
-            if award_id:
-                query = query.filter_by(award_id=award_id)
-            if year:
-                query = query.filter_by(year=year)
-            if category:
-                query = query.filter_by(category=category)
-            if include_displayable_only:
-                query = query.filter_by(is_displayable=True)
-            if keyword:
-                escaped = keyword.replace('%', r'\%').replace('_', r'\_')
-                query = query.filter(
-                    db.or_(
-                        AwardBook.title.ilike(f'%{escaped}%', escape='\\'),
-                        AwardBook.author.ilike(f'%{escaped}%', escape='\\'),
-                    )
-                )
+            query = query.options(self._award_loader(award_id)).order_by(AwardBook.year.desc(), AwardBook.rank.asc())
+            return self._page_with_total(query, (page - 1) * limit, limit)
+        except Exception as e:
+            log_error(ErrorCategory.DB_QUERY, f'查询获奖图书失败: {e}')
+            return [], 0
 
-            total = query.count()
-            books = (
-                query.options(selectinload(AwardBook.award))
-                .order_by(AwardBook.year.desc(), AwardBook.rank.asc())
-                .offset((page - 1) * limit)
-                .limit(limit)
-                .all()
+    def get_award_book_rows(
+        self,
+        award_id: int | None = None,
+        year: int | None = None,
+        category: str | None = None,
+        keyword: str | None = None,
+        page: int = 1,
+        limit: int = 20,
+        include_displayable_only: bool = False,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        与 get_award_books 条件、排序相同，但只查询卡片所需的列，返回 dict 行（含 award_name）
+
+        Returns:
+            (rows, total) 元组
+        """
+        try:
+            query = self._filter_award_books(
+                db.session.query(*_AWARD_CARD_COLUMNS).select_from(AwardBook),
+                award_id,
+                year,
+                category,
+                keyword,
+                include_displayable_only,
             )
-            return books, total
+            query = query.outerjoin(Award, Award.id == AwardBook.award_id).order_by(
+                AwardBook.year.desc(), AwardBook.rank.asc()
+            )
+            return self._page_with_total(query, (page - 1) * limit, limit, item=_award_card_row)
         except Exception as e:
-            log_error(ErrorCategory.DB_QUERY, f'查询获奖图书失败: {e}')
+            log_error(ErrorCategory.DB_QUERY, f'查询获奖图书卡片失败: {e}')
             return [], 0
 
-    def get_award_book_by_id(self, book_id: int) -> AwardBook | None:
-        """根据 ID 获取获奖图书"""
+    def get_award_books_after(
+        self,
+        cursor: tuple[int, int] | None = None,
+        award_id: int | None = None,
+        year: int | None = None,
+        category: str | None = None,
+        keyword: str | None = None,
+        limit: int = 20,
+        include_displayable_only: bool = False,
+    ) -> tuple[list[AwardBook], tuple[int, int] | None]:
+        """
+        游标（keyset）分页查询获奖图书，按 (year, id) 倒序
+
+        不执行 count()，也不使用 OFFSET，翻页耗时与页深无关。
+
+        Args:
+            cursor: 上一页最后一本书的 (year, id)，为 None 时从第一页开始
+
+        Returns:
+            (books, next_cursor) 元组，没有下一页时 next_cursor 为 None
+        """
         try:
-            return db.session.get(AwardBook, book_id)
+            query = self._filter_award_books(
+                AwardBook.query, award_id, year, category, keyword, include_displayable_only
+            )
+            return self._keyset_page(query.options(self._award_loader(award_id)), cursor, limit)
+        except Exception as e:
+            log_error(ErrorCategory.DB_QUERY, f'游标查询获奖图书失败: {e}')
+            return [], None
+
+    @staticmethod
+    def _keyset_page(
+        query, cursor: tuple[int, int] | None, limit: int
+    ) -> tuple[list[AwardBook], tuple[int, int] | None]:
+        """按 (year, id) 倒序取 cursor 之后的一页，返回 (books, next_cursor)"""
+        if cursor:
+            last_year, last_id = cursor
+            query = query.filter(
+                db.or_(
+                    AwardBook.year < last_year,
+                    db.and_(AwardBook.year == last_year, AwardBook.id < last_id),
+                )
+            )
+
+        # 多取一条用于判断是否还有下一页
+        rows = query.order_by(*_KEYSET_ORDER).limit(limit + 1).all()
+        books = rows[:limit]
+        next_cursor = (books[-1].year, books[-1].id) if len(rows) > limit else None
+        return books, next_cursor
+
+    def get_award_book_by_id(self, book_id: int, with_award: bool = False) -> AwardBook | None:
+        """根据 ID 获取获奖图书
+
+        Args:
+            book_id: 图书 ID
+            with_award: 是否用 JOIN 一并取回所属奖项（详情页读取 book.award.name，避免再次懒加载）
+        """
+        try:
+            options = [joinedload(AwardBook.award)] if with_award else None
+            return db.session.get(AwardBook, book_id, options=options)
         except Exception as e:
             log_error(ErrorCategory.DB_QUERY, f'获取获奖图书失败: {e}')
             return None
@@ -592,29 +741,95 @@ class AwardBookService:
             return False
 
     def search_award_books(self, keyword: str, page: int = 1, limit: int = 20) -> tuple[list[AwardBook], int]:
-        """搜索获奖图书（标题/作者/中文标题）"""
+        """
+        搜索获奖图书（标题/作者/中文标题）
+
+        总数按关键词缓存 SEARCH_COUNT_TTL 秒，翻页时不再重复统计；未命中时与当前页
+        同一条 SQL 取得（窗口计数）。当前页未取满时总数可由偏移量直接推出并刷新缓存。
+        """
         try:
-            escaped = keyword.replace('%', r'\%').replace('_', r'\_')
-            query = AwardBook.query.filter(
-                db.or_(
-                    AwardBook.title.ilike(f'%{escaped}%', escape='\\'),
-                    AwardBook.author.ilike(f'%{escaped}%', escape='\\'),
-                    AwardBook.title_zh.ilike(f'%{escaped}%', escape='\\'),
-                )
-            )
-            total = query.count()
-            books = (
-                query.options(selectinload(AwardBook.award))
-                .order_by(AwardBook.year.desc())
-                .offset((page - 1) * limit)
-                .limit(limit)
-                .all()
-            )
+            query = self._search_query(keyword).order_by(*_KEYSET_ORDER)
+            offset = (page - 1) * limit
+            cache_key = f'search:count:{keyword}'
+
+            total = self._count_cache.get(cache_key)
+            if total is None:
+                books, total = self._page_with_total(query, offset, limit)
+            else:
+                books = query.offset(offset).limit(limit).all()
+                if 0 < len(books) < limit:
+                    total = offset + len(books)
+            self._count_cache.set(cache_key, total)
             return books, total
         except Exception as e:
             log_error(ErrorCategory.DB_QUERY, f'搜索获奖图书失败: {e}')
             return [], 0
 
+    def search_award_books_page(self, keyword: str, page: int = 1, limit: int = 20) -> tuple[list[AwardBook], bool]:
+        """
+        搜索获奖图书的一页，不统计总数
+
+        多取一条（LIMIT + 1）判断是否还有下一页，供只需"下一页"导航的调用方跳过 COUNT。
+
+        Returns:
+            (books, has_more) 元组
+        """
+        try:
+            rows = (
+                self._search_query(keyword).order_by(*_KEYSET_ORDER).offset((page - 1) * limit).limit(limit + 1).all()
+            )
+            return rows[:limit], len(rows) > limit
+        except Exception as e:
+            log_error(ErrorCategory.DB_QUERY, f'搜索获奖图书失败: {e}')
+            return [], False
+
+    def search_award_books_after(
+        self, keyword: str, cursor: tuple[int, int] | None = None, limit: int = 20
+    ) -> tuple[list[AwardBook], tuple[int, int] | None]:
+        """
+        游标（keyset）分页搜索获奖图书，按 (year, id) 倒序
+
+        不执行 count()，也不使用 OFFSET，翻页耗时与页深无关。
+
+        Returns:
+            (books, next_cursor) 元组，没有下一页时 next_cursor 为 None
+        """
+        try:
+            return self._keyset_page(self._search_query(keyword), cursor, limit)
+        except Exception as e:
+            log_error(ErrorCategory.DB_QUERY, f'游标搜索获奖图书失败: {e}')
+            return [], None
+
+    def _search_query(self, keyword: str):
+        """搜索基础查询；结果只经 AwardBook.to_dict 序列化，不读取 award 关系，无需 JOIN awards 表"""
+        return AwardBook.query.filter(self._search_condition(keyword))
+
+    @staticmethod
+    def _search_condition(keyword: str):
+        """
+        构建搜索条件：标题/作者/中文标题的大小写不敏感子串匹配（与奖项页关键词筛选语义一致）
+
+        PostgreSQL 下由 title/author/title_zh 的 pg_trgm 三元组索引支撑 ILIKE '%kw%'。
+        """
+        escaped = escape_like(keyword)
+        return db.or_(
+            AwardBook.title.ilike(f'%{escaped}%', escape='\\'),
+            AwardBook.author.ilike(f'%{escaped}%', escape='\\'),
+            AwardBook.title_zh.ilike(f'%{escaped}%', escape='\\'),
+        )
+
+    @staticmethod
+    def _page_with_total(query, offset: int, limit: int, item=itemgetter(0)) -> tuple[list, int]:
+        """一条 SQL 同时取当前页与总数：COUNT(*) OVER () 在 LIMIT/OFFSET 之前对全部匹配行计数
+
+        item 从每个结果行取出返回的元素，默认取查询实体本身。
+        """
+        rows = query.add_columns(db.func.count().over()).offset(offset).limit(limit).all()
+        if rows:
+            return [item(row) for row in rows], rows[0][-1]
+        # 页码越界时没有行可携带窗口计数，总数需单独统计
+        return [], query.count() if offset else 0
+
     def get_distinct_years(self, award_id: int | None = None) -> list[int]:
         """获取不重复的年份列表（可按奖项过滤）"""
         try:
@@ -639,12 +854,24 @@ class AwardBookService:
             log_error(ErrorCategory.DB_QUERY, f'获取类别列表失败: {e}')
             return []
 
+    def get_distinct_years_and_categories(self, award_id: int | None = None) -> tuple[list[int], list[str]]:
+        """一次 DISTINCT (year, category) 查询同时得到年份与类别筛选项（年份倒序、类别正序）"""
+        try:
+            query = db.session.query(AwardBook.year, AwardBook.category).distinct()
+            if award_id:
+                query = query.filter_by(award_id=award_id)
+            pairs = query.all()
+            years = sorted({year for year, _ in pairs if year}, reverse=True)
+            categories = sorted({category for _, category in pairs if category})
+            return years, categories
+        except Exception as e:
+            log_error(ErrorCategory.DB_QUERY, f'获取年份与类别列表失败: {e}')
+            return [], []
+
     def get_book_counts_by_award(self, displayable_only: bool = False) -> dict[int, int]:
         """获取每个奖项的图书计数"""
         try:
-            from sqlalchemy import func
-
-            query = db.session.query(AwardBook.award_id, func.count(AwardBook.id)).group_by(AwardBook.award_id)
+            query = db.session.query(AwardBook.award_id, db.func.count(AwardBook.id)).group_by(AwardBook.award_id)
             if displayable_only:
                 query = query.filter(AwardBook.is_displayable)
             return dict(query.all())
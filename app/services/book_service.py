@@ -1,7 +1,7 @@
 import logging
 import threading
 import weakref
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC
 from pathlib import Path
@@ -49,6 +49,8 @@ class BookService:
         self._translation_thread_active = False
         self._on_data_refreshed_callbacks: weakref.WeakSet[Callable[[], None]] = weakref.WeakSet()
         self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='bookrank-fetch')
+        # 分类级并发使用独立线程池，避免与 _executor 中的补充信息任务互相等待而死锁
+        self._category_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='bookrank-category')
         self._isbn_index: dict[str, dict[str, Any]] = {}  # ISBN -> book_data 反向索引
         # 跟踪每个分类贡献给 _isbn_index 的 ISBN 列表，便于缓存刷新时清理失效条目
         self._isbn_index_by_category: dict[str, set[str]] = {}
@@ -58,10 +60,13 @@ class BookService:
         """注册数据刷新后的回调函数"""
         self._on_data_refreshed_callbacks.add(callback)
 
+    @staticmethod
+    def _books_cache_key(category_id: str) -> str:
+        return f'books_{category_id}'
+
     def get_cache_time(self, category_id: str) -> str | None:
         """获取指定分类的缓存更新时间（公开方法替代直接访问 _cache）"""
-        cache_key = f'books_{category_id}'
-        return self._cache.get_cache_time(cache_key)
+        return self._cache.get_cache_time(self._books_cache_key(category_id))
 
     @property
     def cache(self) -> object:
@@ -90,8 +95,7 @@ class BookService:
 
         # 2. 遍历缓存并构建索引
         for category_id in self._categories:
-            cache_key = f'books_{category_id}'
-            cached_data = self._cache.get(cache_key)
+            cached_data = self._cache.get(self._books_cache_key(category_id))
             if not cached_data:
                 continue
             with self._isbn_index_lock:
@@ -173,6 +177,14 @@ class BookService:
             logger.warning(f'Returning stale cached books for {category_id}')
         return books
 
+    def _get_cached_books(self, category_id: str) -> list[Book] | None:
+        """读取一次分类缓存；未命中（或缓存为空）时返回 None"""
+        cached_data = self._cache.get(self._books_cache_key(category_id))
+        if not cached_data:
+            return None
+        logger.info(f'Returning cached books for {category_id}')
+        return self._books_from_cache_data(cached_data, category_id)
+
     def get_books_by_category(
         self,
         category_id: str,
@@ -192,16 +204,22 @@ class BookService:
         Returns:
             图书列表
         """
-        cache_key = f'books_{category_id}'
-
         # 尝试从缓存获取
         if not force_refresh:
-            cached_data = self._cache.get(cache_key)
-            if cached_data:
-                logger.info(f'Returning cached books for {category_id}')
-                return self._books_from_cache_data(cached_data, category_id)
+            cached_books = self._get_cached_books(category_id)
+            if cached_books is not None:
+                return cached_books
+        return self._fetch_category_books(category_id, force_refresh, auto_translate, notify_refresh)
 
-        # 从API获取
+    def _fetch_category_books(
+        self,
+        category_id: str,
+        force_refresh: bool = False,
+        auto_translate: bool = True,
+        notify_refresh: bool = True,
+    ) -> list[Book]:
+        """从 NYT API 获取分类图书并写入缓存；失败时回退到过期缓存"""
+        cache_key = self._books_cache_key(category_id)
         try:
             api_data = self._nyt_client.fetch_books(category_id, force_refresh=force_refresh)
             if isinstance(api_data, dict) and api_data.get('error'):
@@ -249,6 +267,45 @@ class BookService:
                 return stale_books
             return []
 
+    def get_books_by_categories(self, category_ids: Sequence[str]) -> dict[str, list[Book]]:
+        """
+        并发获取多个分类的图书列表
+
+        已缓存的分类在当前线程一次读出；仅缓存未命中的分类需分别请求 NYT API，
+        并发后总耗时取决于最慢的分类而非各分类之和。
+
+        Args:
+            category_ids: 分类ID列表
+
+        Returns:
+            分类ID -> 图书列表，顺序与 category_ids 一致
+        """
+        cached: dict[str, list[Book]] = {}
+        missing: list[str] = []
+        for category_id in category_ids:
+            cached_books = self._get_cached_books(category_id)
+            if cached_books is not None:
+                cached[category_id] = cached_books
+            else:
+                missing.append(category_id)
+
+        # 未命中的分类已确认不在缓存中，直接请求 API，不再重复读缓存
+        if len(missing) <= 1:
+            fetched = {category_id: self._fetch_category_books(category_id) for category_id in missing}
+        else:
+            futures = {
+                category_id: self._category_executor.submit(
+                    self._run_with_context, lambda category_id=category_id: self._fetch_category_books(category_id)
+                )
+                for category_id in missing
+            }
+            fetched = {category_id: future.result() for category_id, future in futures.items()}
+
+        return {
+            category_id: cached[category_id] if category_id in cached else fetched[category_id]
+            for category_id in category_ids
+        }
+
     def _process_api_response(self, api_data: dict[str, Any], category_id: str) -> list[Book]:
         """
         处理API响应数据
@@ -721,7 +778,7 @@ class BookService:
         latest_time = None
 
         for category_id in self._categories:
-            cache_time = self._cache.get_cache_time(f'books_{category_id}')
+            cache_time = self._cache.get_cache_time(self._books_cache_key(category_id))
             if cache_time:
                 from datetime import datetime
 
@@ -73,17 +73,18 @@ class GoogleBooksClient:
         if not isbn:
             return {}
 
-        self._validate_api_key()
-
         cache_service = self._get_cache_service()
         cache_key = f'isbn_{isbn}'
 
+        # 先查缓存再验证 Key：命中时不发起任何 HTTP 请求；
+        # 空结果 {} 是"未收录"的负缓存，同样直接返回
         if cache_service:
             cached = cache_service.get('google_books', cache_key)
-            if cached:
+            if cached is not None:
                 logger.info('返回Google Books缓存数据: ISBN %s', isbn)
                 return cached
 
+        self._validate_api_key()
         params = self._build_params({'q': f'isbn:{isbn}'})
 
         try:
@@ -121,17 +122,17 @@ class GoogleBooksClient:
         if not title:
             return {}
 
-        self._validate_api_key()
-
         cache_key = f'title_{title.lower()}_{author.lower() if author else "none"}'
         cache_service = self._get_cache_service()
 
         if cache_service:
             cached = cache_service.get('google_books', cache_key)
-            if cached:
+            if cached is not None:
                 logger.info("返回Google Books缓存搜索结果: '%s'", title)
                 return cached
 
+        self._validate_api_key()
+
         query = f'intitle:{title}'
         if author:
             query += f' inauthor:{author}'
@@ -8,14 +8,141 @@ AI 推荐服务
 """
 
 import logging
+import re
 from collections import Counter
 from typing import Any
 
+from sqlalchemy.orm import load_only
+
 from ..models.schemas import AwardBook, BookMetadata, UserCategory, UserViewedBook, db
 from ..utils.error_handler import ErrorCategory, log_error
 
 logger = logging.getLogger(__name__)
 
+# 分词正则与停用词表（覆盖常见英语高频词，减少推荐噪音），模块加载时构建一次
+_WORD_RE = re.compile(r'\b\w{3,}\b')
+_STOP_WORDS = frozenset(
+    {
+        'the',
+        'a',
+        'an',
+        'and',
+        'or',
+        'but',
+        'in',
+        'on',
+        'at',
+        'to',
+        'for',
+        'of',
+        'with',
+        'by',
+        'is',
+        'are',
+        'was',
+        'were',
+        'be',
+        'been',
+        'being',
+        'have',
+        'has',
+        'had',
+        'do',
+        'does',
+        'did',
+        'will',
+        'would',
+        'shall',
+        'should',
+        'may',
+        'might',
+        'can',
+        'not',
+        'no',
+        'nor',
+        'so',
+        'if',
+        'then',
+        'than',
+        'that',
+        'this',
+        'these',
+        'those',
+        'it',
+        'its',
+        'he',
+        'she',
+        'they',
+        'them',
+        'his',
+        'her',
+        'their',
+        'my',
+        'your',
+        'our',
+        'we',
+        'from',
+        'into',
+        'about',
+        'between',
+        'through',
+        'after',
+        'before',
+        'above',
+        'below',
+        'up',
+        'down',
+        'out',
+        'off',
+        'over',
+        'under',
+        'again',
+        'further',
+        'once',
+        'here',
+        'there',
+        'when',
+        'where',
+        'why',
+        'how',
+        'all',
+        'each',
+        'every',
+        'both',
+        'few',
+        'more',
+        'most',
+        'other',
+        'some',
+        'such',
+        'only',
+        'own',
+        'same',
+        'also',
+        'just',
+        'now',
+    }
+)
+
+# 推荐候选只需 _format_award_book 用到的列，跳过 description/details 等大文本列
+_CANDIDATE_COLUMNS = load_only(
+    AwardBook.id,
+    AwardBook.title,
+    AwardBook.title_zh,
+    AwardBook.author,
+    AwardBook.publisher,
+    AwardBook.year,
+    AwardBook.category,
+    AwardBook.rank,
+    AwardBook.cover_original_url,
+    AwardBook.isbn13,
+)
+
+
+def _candidate_query():
+    """推荐候选查询（仅加载格式化所需列）"""
+    return AwardBook.query.options(_CANDIDATE_COLUMNS)
+
 
 class RecommendationService:
     """AI 图书推荐服务"""
@@ -58,10 +185,12 @@ class RecommendationService:
             # 基于兴趣推荐
             recommendations = self._recommend_by_interests(interests, limit)
 
-            # 如果推荐结果不足，补充热门图书
+            # 如果推荐结果不足，只补足缺口数量的热门图书（已推荐的排除在 SQL 中，避免重复后再截断）
             if len(recommendations) < limit:
-                popular = self._get_popular_recommendations(limit - len(recommendations))
-                recommendations.extend(popular)
+                popular = self._get_popular_recommendations(
+                    limit - len(recommendations), exclude_ids={r['id'] for r in recommendations}
+                )
+                recommendations.extend(popular['recommendations'])
 
             return {
                 'recommendations': recommendations,
@@ -144,115 +273,8 @@ class RecommendationService:
         if not text:
             return []
 
-        # 简单分词：按空格和标点分割
-        import re
-
-        words = re.findall(r'\b\w{2,}\b', text.lower())
-
-        # 过滤停用词（覆盖常见英语高频词，减少推荐噪音）
-        stop_words = {
-            'the',
-            'a',
-            'an',
-            'and',
-            'or',
-            'but',
-            'in',
-            'on',
-            'at',
-            'to',
-            'for',
-            'of',
-            'with',
-            'by',
-            'is',
-            'are',
-            'was',
-            'were',
-            'be',
-            'been',
-            'being',
-            'have',
-            'has',
-            'had',
-            'do',
-            'does',
-            'did',
-            'will',
-            'would',
-            'shall',
-            'should',
-            'may',
-            'might',
-            'can',
-            'not',
-            'no',
-            'nor',
-            'so',
-            'if',
-            'then',
-            'than',
-            'that',
-            'this',
-            'these',
-            'those',
-            'it',
-            'its',
-            'he',
-            'she',
-            'they',
-            'them',
-            'his',
-            'her',
-            'their',
-            'my',
-            'your',
-            'our',
-            'we',
-            'from',
-            'into',
-            'about',
-            'between',
-            'through',
-            'after',
-            'before',
-            'above',
-            'below',
-            'up',
-            'down',
-            'out',
-            'off',
-            'over',
-            'under',
-            'again',
-            'further',
-            'once',
-            'here',
-            'there',
-            'when',
-            'where',
-            'why',
-            'how',
-            'all',
-            'each',
-            'every',
-            'both',
-            'few',
-            'more',
-            'most',
-            'other',
-            'some',
-            'such',
-            'only',
-            'own',
-            'same',
-            'also',
-            'just',
-            'now',
-        }
-        words = [w for w in words if w not in stop_words and len(w) > 2]
-
-        return words
+        # 简单分词：按空格和标点分割，仅保留 3 个字符以上的词并过滤停用词
+        return [w for w in _WORD_RE.findall(text.lower()) if w not in _STOP_WORDS]
 
     def _recommend_by_interests(self, interests: dict[str, Any], limit: int) -> list[dict]:
         """
@@ -269,7 +291,7 @@ class RecommendationService:
 
         # 从获奖图书中推荐
         if interests.get('authors') or interests.get('keywords'):
-            query = AwardBook.query.filter_by(is_displayable=True)
+            query = _candidate_query().filter_by(is_displayable=True)
 
             # 构建搜索条件
             conditions = []
@@ -329,23 +351,22 @@ class RecommendationService:
 
         return '，'.join(reasons) + '，为您推荐以下图书'
 
-    def _get_popular_recommendations(self, limit: int) -> dict[str, Any]:
+    def _get_popular_recommendations(self, limit: int, exclude_ids: set[int] | None = None) -> dict[str, Any]:
         """
         获取热门推荐（无个性化数据时的降级方案）
 
         Args:
             limit: 返回数量限制
+            exclude_ids: 需排除的图书ID（已推荐过的）
 
         Returns:
             推荐结果字典
         """
         # 获取最近几年的热门获奖图书
-        books = (
-            AwardBook.query.filter_by(is_displayable=True)
-            .order_by(AwardBook.year.desc(), AwardBook.rank.asc())
-            .limit(limit)
-            .all()
-        )
+        query = _candidate_query().filter_by(is_displayable=True)
+        if exclude_ids:
+            query = query.filter(AwardBook.id.notin_(exclude_ids))
+        books = query.order_by(AwardBook.year.desc(), AwardBook.rank.asc()).limit(limit).all()
 
         recommendations = [self._format_award_book(book) for book in books]
 
@@ -419,7 +440,7 @@ class RecommendationService:
             conditions.append(AwardBook.year.between(target_book.year - 2, target_book.year + 2))
 
         # 排除目标图书本身
-        query = AwardBook.query.filter(
+        query = _candidate_query().filter(
             AwardBook.id != target_book.id, AwardBook.is_displayable.is_(True), db.or_(*conditions)
         )
 
@@ -436,7 +457,7 @@ class RecommendationService:
 
     def _recommend_by_award(self, award_id: int, category: str | None, limit: int) -> dict[str, Any]:
         """基于特定奖项推荐"""
-        query = AwardBook.query.filter_by(award_id=award_id, is_displayable=True)
+        query = _candidate_query().filter_by(award_id=award_id, is_displayable=True)
 
         if category:
             query = query.filter_by(category=category)
@@ -450,7 +471,8 @@ class RecommendationService:
     def _recommend_by_category(self, category: str, limit: int) -> dict[str, Any]:
         """基于分类推荐"""
         books = (
-            AwardBook.query.filter_by(category=category, is_displayable=True)
+            _candidate_query()
+            .filter_by(category=category, is_displayable=True)
             .order_by(AwardBook.year.desc(), AwardBook.rank.asc())
             .limit(limit)
             .all()
@@ -9,16 +9,33 @@
 
 import logging
 import re
-from typing import Any
+from collections.abc import Iterator
+from itertools import islice
+from typing import Any, cast
 
 from sqlalchemy import func, or_
+from sqlalchemy.orm import QueryableAttribute, joinedload
 
-from ..models.new_book import NewBook
-from ..models.schemas import AwardBook, SearchHistory, db
+from ..models.new_book import NewBook, Publisher
+from ..models.schemas import Award, AwardBook, SearchHistory, db
+from ..utils.api_helpers import escape_like
 from ..utils.error_handler import ErrorCategory, log_error
 
 logger = logging.getLogger(__name__)
 
+# 关键词清洗：移除中英文、数字、空白、连字符以外的字符，并压缩连续空白
+_KEYWORD_DISALLOWED_RE = re.compile(r'[^\w\s\u4e00-\u9fff\-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 格式化结果只读取奖项/出版社名称：随主查询 JOIN 取回，且只加载名称列（跳过描述等长文本）
+# 模型未以 Mapped[...] 声明，显式标注为 ORM 属性供加载选项使用
+_AWARD_NAME_ONLY = joinedload(cast('QueryableAttribute[Any]', AwardBook.award)).load_only(
+    cast('QueryableAttribute[Any]', Award.name)
+)
+_PUBLISHER_NAME_ONLY = joinedload(cast('QueryableAttribute[Any]', NewBook.publisher)).load_only(
+    cast('QueryableAttribute[Any]', Publisher.name)
+)
+
 
 class SmartSearchService:
     """智能搜索服务"""
@@ -78,7 +95,11 @@ class SmartSearchService:
 
             award_total = award_query.count()
             award_books = (
-                award_query.order_by(AwardBook.year.desc(), AwardBook.rank.asc()).offset(offset).limit(limit).all()
+                award_query.options(_AWARD_NAME_ONLY)
+                .order_by(AwardBook.year.desc(), AwardBook.rank.asc())
+                .offset(offset)
+                .limit(limit)
+                .all()
             )
             award_results = [self._format_book(b) for b in award_books]
 
@@ -86,7 +107,8 @@ class SmartSearchService:
             new_book_query = self._apply_new_book_search_conditions(new_book_query, keyword, search_type)
             new_book_total = new_book_query.count()
             new_book_books = (
-                new_book_query.order_by(NewBook.publication_date.desc().nullslast())  # type: ignore[union-attr,attr-defined]
+                new_book_query.options(_PUBLISHER_NAME_ONLY)
+                .order_by(NewBook.publication_date.desc().nullslast())  # type: ignore[union-attr,attr-defined]
                 .offset(offset)
                 .limit(limit)
                 .all()
@@ -128,35 +150,35 @@ class SmartSearchService:
         keyword = keyword.strip()
 
         # 移除特殊字符（保留中英文、数字、空格、连字符）
-        keyword = re.sub(r'[^\w\s\u4e00-\u9fff\-]', '', keyword)
+        keyword = _KEYWORD_DISALLOWED_RE.sub('', keyword)
 
         # 压缩多个空格为单个
-        keyword = re.sub(r'\s+', ' ', keyword)
+        keyword = _WHITESPACE_RE.sub(' ', keyword)
 
         return keyword[:100]  # 限制长度
 
     def _apply_award_search_conditions(self, query, keyword: str, search_type: str):
-        escaped_keyword = keyword.replace('%', r'\%').replace('_', r'\_')
+        escaped_keyword = escape_like(keyword)
         conditions = []
         if search_type in ('all', 'title'):
-            conditions.append(AwardBook.title.ilike(f'%{escaped_keyword}%'))
-            conditions.append(AwardBook.title_zh.ilike(f'%{escaped_keyword}%'))
+            conditions.append(AwardBook.title.ilike(f'%{escaped_keyword}%', escape='\\'))
+            conditions.append(AwardBook.title_zh.ilike(f'%{escaped_keyword}%', escape='\\'))
         if search_type in ('all', 'author'):
-            conditions.append(AwardBook.author.ilike(f'%{escaped_keyword}%'))
+            conditions.append(AwardBook.author.ilike(f'%{escaped_keyword}%', escape='\\'))
         if search_type in ('all', 'publisher'):
-            conditions.append(AwardBook.publisher.ilike(f'%{escaped_keyword}%'))
+            conditions.append(AwardBook.publisher.ilike(f'%{escaped_keyword}%', escape='\\'))
         return query.filter(or_(*conditions)) if conditions else query
 
     def _apply_new_book_search_conditions(self, query, keyword: str, search_type: str):
-        escaped_keyword = keyword.replace('%', r'\%').replace('_', r'\_')
+        escaped_keyword = escape_like(keyword)
         conditions = []
         if search_type in ('all', 'title'):
-            conditions.append(NewBook.title.ilike(f'%{escaped_keyword}%'))  # type: ignore[attr-defined]
-            conditions.append(NewBook.title_zh.ilike(f'%{escaped_keyword}%'))  # type: ignore[union-attr,attr-defined]
+            conditions.append(NewBook.title.ilike(f'%{escaped_keyword}%', escape='\\'))  # type: ignore[attr-defined]
+            conditions.append(NewBook.title_zh.ilike(f'%{escaped_keyword}%', escape='\\'))  # type: ignore[union-attr,attr-defined]
         if search_type in ('all', 'author'):
-            conditions.append(NewBook.author.ilike(f'%{escaped_keyword}%'))  # type: ignore[attr-defined]
+            conditions.append(NewBook.author.ilike(f'%{escaped_keyword}%', escape='\\'))  # type: ignore[attr-defined]
         if search_type in ('all', 'publisher'):
-            conditions.append(NewBook.isbn13.ilike(f'%{escaped_keyword}%'))  # type: ignore[union-attr,attr-defined]
+            conditions.append(NewBook.isbn13.ilike(f'%{escaped_keyword}%', escape='\\'))  # type: ignore[union-attr,attr-defined]
         return query.filter(or_(*conditions)) if conditions else query
 
     def _format_book(self, book: AwardBook) -> dict:
@@ -280,67 +302,37 @@ class SmartSearchService:
             # 限制返回数量
             limit = min(max(1, limit), 20)
 
-            suggestions = []
+            # 取满 limit 条即停止，后续类别的查询不会执行
+            suggestions = list(islice(self._iter_suggestions(prefix, limit), limit))
 
-            # 1. 从书名中获取建议
-            title_suggestions = (
-                AwardBook.query.filter(
-                    AwardBook.is_displayable,
-                    or_(AwardBook.title.ilike(f'{prefix}%'), AwardBook.title_zh.ilike(f'{prefix}%')),
-                )
-                .with_entities(AwardBook.title)
+            return {'suggestions': suggestions, 'prefix': prefix}
+
+        except Exception as e:
+            log_error(ErrorCategory.API_CALL, f'获取搜索建议失败: {e}')
+            return {'suggestions': [], 'prefix': prefix, 'error': str(e)}
+
+    def _iter_suggestions(self, prefix: str, batch_size: int) -> Iterator[dict[str, str]]:
+        """惰性产出搜索建议（书名 → 作者 → 出版社，按文本去重），取够数量后后续类别不再查询"""
+        pattern = f'{prefix}%'
+        sources = (
+            ('title', AwardBook.title, or_(AwardBook.title.ilike(pattern), AwardBook.title_zh.ilike(pattern))),
+            ('author', AwardBook.author, AwardBook.author.ilike(pattern)),
+            ('publisher', AwardBook.publisher, AwardBook.publisher.ilike(pattern)),
+        )
+        seen = set()
+        for kind, column, condition in sources:
+            rows = (
+                AwardBook.query.filter(AwardBook.is_displayable, condition)
+                .with_entities(column)
                 .distinct()
-                .limit(limit)
+                .limit(batch_size)
                 .all()
             )
-
-            for (title,) in title_suggestions:
-                suggestions.append({'text': title, 'type': 'title'})
-
-            # 2. 从作者中获取建议
-            if len(suggestions) < limit:
-                author_suggestions = (
-                    AwardBook.query.filter(AwardBook.is_displayable, AwardBook.author.ilike(f'{prefix}%'))
-                    .with_entities(AwardBook.author)
-                    .distinct()
-                    .limit(limit)
-                    .all()
-                )
-
-                for (author,) in author_suggestions:
-                    if len(suggestions) >= limit:
-                        break
-                    suggestions.append({'text': author, 'type': 'author'})
-
-            # 3. 从出版社中获取建议
-            if len(suggestions) < limit:
-                publisher_suggestions = (
-                    AwardBook.query.filter(AwardBook.is_displayable, AwardBook.publisher.ilike(f'{prefix}%'))
-                    .with_entities(AwardBook.publisher)
-                    .distinct()
-                    .limit(limit)
-                    .all()
-                )
-
-                for (publisher,) in publisher_suggestions:
-                    if len(suggestions) >= limit:
-                        break
-                    suggestions.append({'text': publisher, 'type': 'publisher'})
-
-            # 去重（基于文本）
-            seen = set()
-            unique_suggestions = []
-            for s in suggestions:
-                text_lower = s['text'].lower()
+            for (text,) in rows:
+                text_lower = text.lower()
                 if text_lower not in seen:
                     seen.add(text_lower)
-                    unique_suggestions.append(s)
-
-            return {'suggestions': unique_suggestions[:limit], 'prefix': prefix}
-
-        except Exception as e:
-            log_error(ErrorCategory.API_CALL, f'获取搜索建议失败: {e}')
-            return {'suggestions': [], 'prefix': prefix, 'error': str(e)}
+                    yield {'text': text, 'type': kind}
 
     # ==================== 热门搜索 ====================
 
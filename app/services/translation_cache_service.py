@@ -12,6 +12,7 @@ from sqlalchemy.exc import IntegrityError
 
 from ..models.database import db
 from ..models.schemas import TranslationCache
+from ..utils.api_helpers import escape_like
 from ..utils.error_handler import ErrorCategory, log_error
 
 logger = logging.getLogger(__name__)
@@ -235,6 +236,47 @@ class TranslationCacheService:
 
         return query.order_by(TranslationCache.last_used_at.desc()).limit(limit).all()
 
+    def get_recent_previews(
+        self,
+        limit: int = 50,
+        source_lang: str | None = None,
+        target_lang: str | None = None,
+        preview_length: int = 100,
+    ) -> list[Any]:
+        """
+        获取最近的缓存记录摘要（原文/译文在 SQL 中截断，避免把长文本整列读回应用层）
+
+        文本列多取 1 个字符，调用方据此判断是否被截断。
+
+        Args:
+            limit: 返回数量限制
+            source_lang: 源语言筛选
+            target_lang: 目标语言筛选
+            preview_length: 摘要长度
+
+        Returns:
+            Row 列表，字段同 TranslationCache（不含 translation_model 等未用列）
+        """
+        probe_length = preview_length + 1
+        query = db.session.query(
+            TranslationCache.id,
+            func.substr(TranslationCache.source_text, 1, probe_length).label('source_text'),
+            func.substr(TranslationCache.translated_text, 1, probe_length).label('translated_text'),
+            TranslationCache.source_lang,
+            TranslationCache.target_lang,
+            TranslationCache.usage_count,
+            TranslationCache.created_at,
+            TranslationCache.last_used_at,
+        )
+
+        if source_lang:
+            query = query.filter(TranslationCache.source_lang == source_lang)
+
+        if target_lang:
+            query = query.filter(TranslationCache.target_lang == target_lang)
+
+        return query.order_by(TranslationCache.last_used_at.desc()).limit(limit).all()
+
     def search(
         self, keyword: str, limit: int = 50, source_lang: str | None = None, target_lang: str | None = None
     ) -> list[TranslationCache]:
@@ -250,10 +292,13 @@ class TranslationCacheService:
         Returns:
             匹配的缓存记录列表
         """
-        safe_keyword = keyword.replace('%', '\\%').replace('_', '\\_')
+        safe_keyword = escape_like(keyword)
         pattern = f'%{safe_keyword}%'
         query = TranslationCache.query.filter(
-            or_(TranslationCache.source_text.ilike(pattern), TranslationCache.translated_text.ilike(pattern))
+            or_(
+                TranslationCache.source_text.ilike(pattern, escape='\\'),
+                TranslationCache.translated_text.ilike(pattern, escape='\\'),
+            )
         )
 
         if source_lang:
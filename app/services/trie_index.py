@@ -0,0 +1,344 @@
+"""
+搜索建议前缀树
+
+进程内 Trie 索引，替代逐次按键触发的 LIKE 'prefix%' 查询：
+1. 键为小写化的书名、中文书名、作者、出版社
+2. 每个节点缓存其子树内排名前 K 的建议，查询只需沿前缀下行，耗时 O(L + K)
+3. 单分支链压缩为一条边（基数树），书名独有的长尾只占一个节点
+4. 首次查询时从数据库全量构建，之后由 AwardBook 的 ORM 事件增量维护
+"""
+
+import logging
+import threading
+import time
+from bisect import insort
+from collections.abc import Iterator
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, inspect
+
+from ..models.schemas import AwardBook
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import InstanceState
+
+logger = logging.getLogger(__name__)
+
+# 建议类型优先级：书名 > 作者 > 出版社（与原 SQL 查询的先后顺序一致）
+_TYPE_PRIORITY = {'title': 0, 'author': 1, 'publisher': 2}
+
+# 参与建议的文本字段，任一变更都会使已有条目失效
+_TEXT_FIELDS = ('title', 'title_zh', 'author', 'publisher')
+
+# 前缀最大长度（与 SmartSearchService._sanitize_keyword 的截断长度一致）
+_MAX_PREFIX_LENGTH = 100
+
+# 条目结构：(排序键, 小写文本, 响应载荷)，排序键 = (类型优先级, -权重, 插入序号)
+# 载荷 {'text', 'type'} 在插入时一次性构建，查询直接返回引用，调用方只读不改
+_Entry = tuple[tuple[int, int, int], str, dict[str, str]]
+
+
+def normalize_prefix(prefix: str) -> str:
+    """前缀规范化：去空白、小写、截断"""
+    return prefix.strip().lower()[:_MAX_PREFIX_LENGTH]
+
+
+class _TrieNode:
+    __slots__ = ('children', 'label', 'terminal', 'top')
+
+    def __init__(
+        self, label: str = '', children: dict | None = None, top: list | None = None, terminal: list | None = None
+    ) -> None:
+        # label 为父节点到本节点的边上的字符串，创建后不再修改（分裂时整体替换节点，保证并发读取一致）
+        self.label = label
+        self.children: dict[str, _TrieNode] = {} if children is None else children
+        self.top: list[_Entry] = [] if top is None else top
+        # 恰好在本节点结束的键对应的条目；中间节点为 None，省去空列表的内存
+        self.terminal: list[_Entry] | None = terminal
+
+
+class SuggestionTrie:
+    """搜索建议前缀树（应用级单例，挂到 app.extensions['suggestion_trie']）"""
+
+    def __init__(self, top_k: int = 20, ttl: int = 600):
+        """
+        初始化前缀树
+
+        Args:
+            top_k: 每个节点保留的建议数量上限
+            ttl: 全量重建间隔（秒），兜底修正增量维护无法覆盖的删除与回滚
+        """
+        self._top_k = top_k
+        self._ttl = ttl
+        self._root = _TrieNode()
+        self._seq = 0
+        self._generation = 0
+        self._version = 0
+        self._built_at = 0.0
+        self._lock = threading.RLock()
+
+    @property
+    def needs_rebuild(self) -> bool:
+        """是否需要从数据库全量重建"""
+        return not self._built_at or time.monotonic() - self._built_at > self._ttl
+
+    @property
+    def generation(self) -> int:
+        """全量重建代数，每次替换根节点后递增；旧代的节点引用不应再复用"""
+        return self._generation
+
+    @property
+    def version(self) -> int:
+        """内容版本，每次插入或重建后递增；据此判断此前不存在的前缀是否可能已出现"""
+        return self._version
+
+    def mark_stale(self) -> None:
+        """标记为失效，下次查询时全量重建"""
+        self._built_at = 0.0
+
+    def insert(self, key: str | None, text: str | None, kind: str = 'title', weight: int = 0) -> None:
+        """
+        插入一条建议
+
+        Args:
+            key: 用于前缀匹配的字符串
+            text: 返回给前端的建议文本
+            kind: 建议类型（title/author/publisher）
+            weight: 权重，越大越靠前
+        """
+        with self._lock:
+            self._insert_into(self._root, key, text, kind, weight)
+            self._version += 1
+
+    def add_book(self, title: str | None, title_zh: str | None, author: str | None, publisher: str | None) -> None:
+        """插入一本书的全部建议键（中文书名命中时返回英文书名）"""
+        with self._lock:
+            self._add_book_into(self._root, title, title_zh, author, publisher)
+            self._version += 1
+
+    def build(self, rows: Any) -> None:
+        """
+        由 (title, title_zh, author, publisher) 行全量构建
+
+        新树构建完成后整体替换根节点，构建期间的查询仍读取旧树。
+        """
+        with self._lock:
+            root = _TrieNode()
+            for title, title_zh, author, publisher in rows:
+                self._add_book_into(root, title, title_zh, author, publisher)
+            self._root = root
+            self._generation += 1
+            self._version += 1
+            self._built_at = time.monotonic()
+
+    def ensure_loaded(self) -> None:
+        """失效或过期时从数据库加载可展示图书并重建"""
+        if not self.needs_rebuild:
+            return
+        with self._lock:
+            if not self.needs_rebuild:
+                return
+            rows = (
+                AwardBook.query.filter(AwardBook.is_displayable)
+                .with_entities(AwardBook.title, AwardBook.title_zh, AwardBook.author, AwardBook.publisher)
+                .order_by(AwardBook.id)
+                .all()
+            )
+            self.build(rows)
+            logger.info(f'搜索建议前缀树已重建: {len(rows)} 本图书')
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[dict[str, str]]:
+        """
+        获取前缀下的建议
+
+        Args:
+            prefix: 用户输入的前缀（大小写不敏感）
+            limit: 返回建议数量
+
+        Returns:
+            [{'text': ..., 'type': ...}] 列表
+        """
+        key = normalize_prefix(prefix)
+        if not key:
+            return []
+        return self.suggest_from(None, key, limit)[0]
+
+    def suggest_from(
+        self, start: _TrieNode | None, suffix: str, limit: int = 10
+    ) -> tuple[list[dict[str, str]], _TrieNode | None, int]:
+        """
+        从指定节点继续下行获取建议（连续按键时跳过已走过的公共前缀）
+
+        Args:
+            start: 起始节点，None 表示根节点
+            suffix: 相对起始节点的剩余前缀（已规范化）
+            limit: 返回建议数量
+
+        Returns:
+            (建议列表, 锚点节点, 锚点消耗的 suffix 长度)。锚点是路径完全落在前缀内的最深节点，
+            可作为下次查询的起点；前缀不存在时锚点为 None
+        """
+        node = anchor = start or self._root
+        consumed = i = 0
+        while i < len(suffix):
+            child = node.children.get(suffix[i])
+            if child is None:
+                return [], None, 0
+            label = child.label
+            # 比较交给 C 实现的 str.startswith，不在 Python 层逐字符循环或切片
+            if not (suffix.startswith(label, i) or label.startswith(suffix[i:])):
+                return [], None, 0
+            i += len(label)
+            node = child
+            if i <= len(suffix):
+                anchor, consumed = node, i
+        if limit <= self._top_k:
+            return [entry[2] for entry in node.top[:limit]], anchor, consumed
+        return list(islice(self._iter_node(node), limit)), anchor, consumed
+
+    def _iter_node(self, node: _TrieNode) -> Iterator[dict[str, str]]:
+        """
+        惰性枚举节点子树内的建议
+
+        先按排名产出节点缓存的前 K 条；子树条目超过 K 时，再以显式栈先序遍历
+        （按前缀字典序）补充其余条目。生成器在调用方停止取值时即停止，不会展开整棵子树。
+        """
+        top = node.top
+        yield from (entry[2] for entry in top)
+        if len(top) < self._top_k:
+            # 子树内不同文本不足 K 条，前 K 列表即为全集
+            return
+        seen = {entry[1] for entry in top}
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for _, lowered, payload in current.terminal or ():
+                if lowered not in seen:
+                    seen.add(lowered)
+                    yield payload
+            children = current.children
+            stack.extend(children[ch] for ch in sorted(children, reverse=True))
+
+    def _add_book_into(
+        self, root: _TrieNode, title: str | None, title_zh: str | None, author: str | None, publisher: str | None
+    ) -> None:
+        self._insert_into(root, title, title, 'title')
+        self._insert_into(root, title_zh, title, 'title')
+        self._insert_into(root, author, author, 'author')
+        self._insert_into(root, publisher, publisher, 'publisher')
+
+    def _insert_into(self, root: _TrieNode, key: str | None, text: str | None, kind: str, weight: int = 0) -> None:
+        key = (key or '').strip().lower()
+        if not key or not text:
+            return
+        self._seq += 1
+        lowered = text.lower()
+        # 纯小写文本复用同一字符串对象，避免每个条目多存一份副本
+        entry = (
+            (_TYPE_PRIORITY.get(kind, len(_TYPE_PRIORITY)), -weight, self._seq),
+            lowered if lowered != text else text,
+            {'text': text, 'type': kind},
+        )
+        node = root
+        i = 0
+        while i < len(key):
+            child = node.children.get(key[i])
+            if child is None:
+                # 剩余部分整体作为一条边挂一个叶节点
+                node.children[key[i]] = _TrieNode(key[i:], top=[entry], terminal=[entry])
+                return
+            label = child.label
+            j = 1
+            limit = min(len(label), len(key) - i)
+            while j < limit and label[j] == key[i + j]:
+                j += 1
+            if j < len(label):
+                child = self._split(node, child, j)
+            node = child
+            self._offer(node, entry)
+            i += j
+        # 键恰好结束于已有节点
+        self._add_terminal(node, entry)
+
+    @staticmethod
+    def _add_terminal(node: _TrieNode, entry: _Entry) -> None:
+        terminal = node.terminal
+        if terminal is None:
+            node.terminal = [entry]
+            return
+        for i, existing in enumerate(terminal):
+            if existing[1] == entry[1]:
+                if existing[0] > entry[0]:
+                    terminal[i] = entry
+                return
+        terminal.append(entry)
+
+    @staticmethod
+    def _split(parent: _TrieNode, child: _TrieNode, at: int) -> _TrieNode:
+        """在边的 at 处分裂：新建中间节点与下半段节点后一次性替换父节点引用"""
+        label = child.label
+        lower = _TrieNode(label[at:], child.children, child.top, child.terminal)
+        middle = _TrieNode(label[:at], {label[at]: lower}, list(child.top))
+        parent.children[label[0]] = middle
+        return middle
+
+    def _offer(self, node: _TrieNode, entry: _Entry) -> None:
+        """将条目并入节点的前 K 列表（按文本去重，保留排名更高者）"""
+        top = node.top
+        for i, existing in enumerate(top):
+            if existing[1] == entry[1]:
+                if existing[0] <= entry[0]:
+                    return
+                del top[i]
+                break
+        if len(top) >= self._top_k and entry[0] >= top[-1][0]:
+            return
+        insort(top, entry)
+        del top[self._top_k :]
+
+
+def _current_trie() -> SuggestionTrie | None:
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('suggestion_trie')
+
+
+def _on_award_book_inserted(mapper: Any, connection: Any, target: AwardBook) -> None:
+    trie = _current_trie()
+    if trie is None or trie.needs_rebuild or not target.is_displayable:
+        return
+    trie.add_book(target.title, target.title_zh, target.author, target.publisher)
+
+
+def _on_award_book_updated(mapper: Any, connection: Any, target: AwardBook) -> None:
+    trie = _current_trie()
+    if trie is None or trie.needs_rebuild:
+        return
+    state: InstanceState[Any] = inspect(target)
+    text_changed = any(state.attrs[name].history.has_changes() for name in _TEXT_FIELDS)
+    if not text_changed and not state.attrs.is_displayable.history.has_changes():
+        return
+    if target.is_displayable and not text_changed:
+        trie.add_book(target.title, target.title_zh, target.author, target.publisher)
+    else:
+        # 前 K 列表无法精确删除旧条目，交给下次查询全量重建
+        trie.mark_stale()
+
+
+def _on_award_book_deleted(mapper: Any, connection: Any, target: AwardBook) -> None:
+    trie = _current_trie()
+    if trie is not None:
+        trie.mark_stale()
+
+
+def register_trie_listeners() -> None:
+    """注册 AwardBook 的 ORM 事件，增量维护前缀树（幂等）"""
+    for name, handler in (
+        ('after_insert', _on_award_book_inserted),
+        ('after_update', _on_award_book_updated),
+        ('after_delete', _on_award_book_deleted),
+    ):
+        if not event.contains(AwardBook, name, handler):
+            event.listen(AwardBook, name, handler)
@@ -1,47 +1,137 @@
 import logging
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+
 from ..models.database import db
 from ..models.schemas import BookMetadata, SearchHistory, UserCategory, UserFavorite, UserPreference, UserViewedBook
 from ..utils.error_handler import ErrorCategory, log_error
 
 logger = logging.getLogger(__name__)
 
+# 支持 INSERT ... ON CONFLICT 的数据库方言
+_UPSERT_DIALECTS = frozenset({'sqlite', 'postgresql'})
+
+
+def _viewed_books_upsert(dialect: str, rows: list[dict[str, Any]]) -> postgresql.Insert | sqlite.Insert:
+    """构造浏览记录的 INSERT ... ON CONFLICT DO UPDATE 语句"""
+    stmt: postgresql.Insert | sqlite.Insert
+    if dialect == 'postgresql':
+        stmt = postgresql.insert(UserViewedBook).values(rows)
+    else:
+        stmt = sqlite.insert(UserViewedBook).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=['session_id', 'isbn'],
+        set_={'viewed_at': stmt.excluded.viewed_at},
+    )
+
 
 class UserService:
     """用户相关数据库操作服务"""
 
-    def save_user_categories(self, session_id: str, category_ids: list[str]) -> None:
+    def _get_or_create_preference(self, session_id: str) -> UserPreference:
+        preference = db.session.get(UserPreference, session_id)
+        if not preference:
+            preference = UserPreference(session_id=session_id)
+            db.session.add(preference)
+            # 先落库偏好记录，保证后续批量插入满足外键约束
+            db.session.flush()
+        return preference
+
+    def _replace_user_categories(self, session_id: str, category_ids: Sequence[str]) -> None:
+        # 只写差异：每次浏览图书列表都会保存分类偏好，集合不变时不产生任何 DELETE/INSERT
+        wanted = dict.fromkeys(category_ids)
+        existing = {cat_id for (cat_id,) in db.session.query(UserCategory.category_id).filter_by(session_id=session_id)}
+        stale = existing.difference(wanted)
+        if stale:
+            UserCategory.query.filter(
+                UserCategory.session_id == session_id, UserCategory.category_id.in_(stale)
+            ).delete()
+
+        # 批量插入：ORM bulk INSERT 一次执行多行，绕过逐行 add 的身份映射开销
+        rows = [{'session_id': session_id, 'category_id': cat_id} for cat_id in wanted if cat_id not in existing]
+        if rows:
+            db.session.execute(insert(UserCategory), rows)
+
+    def _upsert_viewed_books(self, session_id: str, isbns: list[str]) -> None:
+        now = datetime.now(UTC)
+        rows = [{'session_id': session_id, 'isbn': isbn, 'viewed_at': now} for isbn in dict.fromkeys(isbns)]
+        if not rows:
+            return
+        dialect = db.engine.dialect.name
+        if dialect in _UPSERT_DIALECTS:
+            # 单条 INSERT ... ON CONFLICT DO UPDATE 完成插入与刷新
+            db.session.execute(_viewed_books_upsert(dialect, rows))
+        else:
+            # 其他数据库：一次 IN 查询取出已存在的记录，一条 UPDATE 刷新其浏览时间，只批量插入新记录
+            existing = {
+                isbn
+                for (isbn,) in db.session.query(UserViewedBook.isbn).filter(
+                    UserViewedBook.session_id == session_id,
+                    UserViewedBook.isbn.in_([row['isbn'] for row in rows]),
+                )
+            }
+            if existing:
+                UserViewedBook.query.filter(
+                    UserViewedBook.session_id == session_id, UserViewedBook.isbn.in_(existing)
+                ).update({'viewed_at': now}, synchronize_session=False)
+            new_rows = [row for row in rows if row['isbn'] not in existing]
+            if new_rows:
+                db.session.execute(insert(UserViewedBook), new_rows)
+
+    def save_user_categories(self, session_id: str, category_ids: Sequence[str]) -> None:
         """保存用户分类偏好"""
         try:
-            preference = db.session.get(UserPreference, session_id)
-            if not preference:
-                preference = UserPreference(session_id=session_id)
-                db.session.add(preference)
-
-            UserCategory.query.filter_by(session_id=session_id).delete()
-
-            for cat_id in category_ids:
-                db.session.add(UserCategory(session_id=session_id, category_id=cat_id))
-
+            self._get_or_create_preference(session_id)
+            self._replace_user_categories(session_id, category_ids)
             db.session.commit()
         except Exception as e:
             log_error(ErrorCategory.DB_QUERY, f'Failed to save user categories: {e}')
             db.session.rollback()
 
     def save_viewed_books(self, session_id: str, isbns: list[str]) -> None:
-        """保存用户浏览记录（自动去重）"""
+        """保存用户浏览记录（自动去重，已存在的记录刷新浏览时间）"""
         try:
-            for isbn in isbns:
-                existing = UserViewedBook.query.filter_by(session_id=session_id, isbn=isbn).first()
-                if not existing:
-                    db.session.add(UserViewedBook(session_id=session_id, isbn=isbn))
+            self._upsert_viewed_books(session_id, isbns)
             db.session.commit()
         except Exception as e:
             log_error(ErrorCategory.DB_QUERY, f'Failed to save viewed books: {e}')
             db.session.rollback()
 
+    def save_preferences(
+        self,
+        session_id: str,
+        view_mode: str | None = None,
+        category_ids: list[str] | None = None,
+        isbns: list[str] | None = None,
+    ) -> None:
+        """
+        在一个事务内保存用户偏好、分类偏好与浏览记录
+
+        偏好记录只查询一次，全部变更一次提交。
+
+        Args:
+            session_id: 会话ID
+            view_mode: 视图模式（grid/list），为空时不修改
+            category_ids: 已校验的偏好分类，为空时不修改
+            isbns: 已校验的浏览 ISBN，为空时不修改
+        """
+        try:
+            preference = self._get_or_create_preference(session_id)
+            if view_mode in ['grid', 'list']:
+                preference.view_mode = view_mode
+            if category_ids:
+                self._replace_user_categories(session_id, category_ids)
+            if isbns:
+                self._upsert_viewed_books(session_id, isbns)
+            db.session.commit()
+        except Exception as e:
+            log_error(ErrorCategory.DB_QUERY, f'Failed to save preferences: {e}')
+            db.session.rollback()
+
     def save_search_history(self, session_id: str, keyword: str, result_count: int) -> None:
         """保存搜索历史"""
         try:
@@ -58,23 +148,6 @@ class UserService:
             return preference.to_dict()
         return {}
 
-    def update_preferences(self, session_id: str, data: dict[str, Any]) -> None:
-        """更新用户偏好"""
-        try:
-            preference = db.session.get(UserPreference, session_id)
-            if not preference:
-                preference = UserPreference(session_id=session_id)
-                db.session.add(preference)
-
-            view_mode = data.get('view_mode')
-            if view_mode in ['grid', 'list']:
-                preference.view_mode = view_mode
-
-            db.session.commit()
-        except Exception as e:
-            log_error(ErrorCategory.DB_QUERY, f'Failed to update preferences: {e}')
-            db.session.rollback()
-
     def get_search_history(self, session_id: str, limit: int = 5) -> list[dict[str, Any]]:
         """获取搜索历史"""
         history = (
@@ -25,6 +25,7 @@ from .services import (
     NYTApiClient,
 )
 from .utils import RateLimiter
+from .utils.cache import result_cache
 from .utils.error_handler import ErrorCategory, log_error
 from .utils.service_helpers import register_service
 
@@ -87,6 +88,15 @@ def _init_recommendation_and_search_services(app, cfg):
     except Exception as e:
         log_error(ErrorCategory.UNKNOWN, f'智能搜索服务初始化失败: {e}', level='warning')
 
+    try:
+        from .services.trie_index import SuggestionTrie, register_trie_listeners
+
+        register_service(app, 'suggestion_trie', SuggestionTrie(ttl=SmartSearchService.SUGGESTION_CACHE_TTL))
+        register_trie_listeners()
+        app.logger.info('搜索建议前缀树初始化成功（首次查询时加载）')
+    except Exception as e:
+        log_error(ErrorCategory.UNKNOWN, f'搜索建议前缀树初始化失败: {e}', level='warning')
+
 
 def _init_nyt_client(cfg, app):
     """初始化 NYT API 客户端"""
@@ -449,6 +459,7 @@ def _deferred_init_task(app):
 
         with app.app_context():
             init_sample_award_books(app)
+            result_cache.clear()
             logger.info('预置获奖图书补种完成')
     except Exception as e:
         log_error(ErrorCategory.UNKNOWN, f'预置获奖图书补种跳过: {e}', level='warning')
@@ -727,6 +738,8 @@ def _award_refresh_task(app):
         if result.get('status') == 'skipped':
             app.logger.info(f'获奖图书刷新跳过: {result.get("message", "未达到刷新间隔")}')
         else:
+            # 获奖数据已变化，丢弃缓存的奖项列表、筛选条件与计数
+            result_cache.clear()
             app.logger.info(
                 f'获奖图书刷新完成: 新增 {result.get("new_books", 0)} 本, '
                 f'更新 {result.get("updated_books", 0)} 本, '
@@ -4,11 +4,13 @@ from .api_helpers import (
     api_rate_limit,
     clean_translation_text,
     csrf_protect,
+    escape_like,
     get_csrf_token,
     public_rate_limit,
     quick_clean_translation,
     validate_isbn,
     validate_pagination,
+    validate_search_keyword,
 )
 from .exceptions import (
     APIException,
@@ -58,6 +60,7 @@ __all__ = [
     'api_rate_limit',
     'clean_translation_text',
     'csrf_protect',
+    'escape_like',
     'get_book_service',
     'get_cache_service',
     'get_csrf_token',
@@ -76,4 +79,5 @@ __all__ = [
     'safe_service_call',
     'validate_isbn',
     'validate_pagination',
+    'validate_search_keyword',
 ]
@@ -2,16 +2,14 @@ import logging
 import re
 import secrets
 from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
-from functools import wraps
+from datetime import UTC, datetime
+from functools import lru_cache, wraps
 from typing import Any
 
-from flask import current_app, jsonify, request
+from flask import current_app, jsonify, request, session
+from itsdangerous import BadData, URLSafeTimedSerializer
 from werkzeug.wrappers import Response
 
-from ..models.database import db
-from ..models.schemas import CSRFToken
-from .error_handler import ErrorCategory, log_error
 from .exceptions import (
     APIRateLimitException,
     BookRankException,
@@ -25,15 +23,15 @@ _logger = logging.getLogger(__name__)
 
 _CSRF_TOKEN_TTL = 3600
 
+# ISBN 分隔符删除表（连字符 + 全部 Unicode 空白，与正则 [\s\-] 等价），str.translate 一次 C 调用完成清洗
+_ISBN_SEPARATORS = dict.fromkeys([ord('-'), *(c for c in range(0x3001) if chr(c).isspace())])
 
-def _cleanup_expired_csrf_tokens() -> None:
-    try:
-        cutoff = datetime.now(UTC) - timedelta(seconds=_CSRF_TOKEN_TTL)
-        CSRFToken.query.filter(CSRFToken.created_at < cutoff).delete()
-        db.session.commit()
-    except Exception as e:
-        log_error(ErrorCategory.DB_QUERY, f'清理过期CSRF token失败: {e}')
-        db.session.rollback()
+# 搜索关键词字符集：中英文、数字、空白、连字符。纯 ASCII 输入（多数查询）走 re.ASCII 版本，
+# 省去 Unicode \w 的逐字符类别查表；\x1c-\x1f 在 Unicode 模式下属于 \s，显式补上以保持结果一致
+_KEYWORD_RE = re.compile(r'^[\w\s\-\u4e00-\u9fff]+$')
+_KEYWORD_ASCII_RE = re.compile(r'^[\w\s\x1c-\x1f\-]+$', re.ASCII)
+# LIKE 通配符转义表，配合 ilike(..., escape='\\') 使用
+_LIKE_ESCAPE = str.maketrans({'\\': r'\\', '%': r'\%', '_': r'\_'})
 
 
 class APIResponse:
@@ -130,23 +128,34 @@ def handle_api_errors(f: Callable[..., Any]) -> Callable[..., Any]:
     return wrapped
 
 
+@lru_cache(maxsize=4096)
 def validate_isbn(value: str | None) -> bool:
-    """验证ISBN格式（ISBN-10 或 ISBN-13，严格校验978/979前缀）"""
+    """验证ISBN格式（ISBN-10 或 ISBN-13，严格校验978/979前缀；热门 ISBN 反复校验，结果按值缓存）"""
     if not value:
         return False
-    clean = re.sub(r'[\s\-]', '', value)
-    if len(clean) == 13 and clean.startswith(('978', '979')) and clean.isdigit():
-        return True
-    if len(clean) == 10:
-        prefix = clean[:9]
-        suffix = clean[9]
-        if prefix.isdigit() and (suffix.isdigit() or suffix.upper() == 'X'):
-            return True
+    clean = value.translate(_ISBN_SEPARATORS)
+    length = len(clean)
+    if length == 13:
+        return clean.startswith(('978', '979')) and clean.isdigit()
+    if length == 10:
+        return clean[:9].isdigit() and (clean[9].isdigit() or clean[9] in 'Xx')
     return False
 
 
+def validate_search_keyword(keyword: str) -> bool:
+    """验证搜索关键词只包含中英文、数字、空白与连字符"""
+    pattern = _KEYWORD_ASCII_RE if keyword.isascii() else _KEYWORD_RE
+    return pattern.match(keyword) is not None
+
+
+def escape_like(keyword: str) -> str:
+    """转义 LIKE 通配符（% _ 及转义符 \\ 本身），单次 translate 完成"""
+    return keyword.translate(_LIKE_ESCAPE)
+
+
+@lru_cache(maxsize=256)
 def validate_pagination(page: int, limit: int, max_limit: int = 50) -> tuple[int, int]:
-    """验证并规范化分页参数"""
+    """验证并规范化分页参数（纯函数，常见组合极少，结果按参数缓存）"""
     page = min(max(1, page), 10000)
     limit = min(max(1, limit), max_limit)
     return page, limit
@@ -156,16 +165,18 @@ def api_rate_limit(max_requests: int = 60, window: int = 60) -> Callable[..., An
     """API限流装饰器"""
 
     def decorator(f: Callable[..., Any]) -> Callable[..., Any]:
+        # 装饰时解析限流器，避免每个请求重复拼接键并查表
+        limiter = get_rate_limiter(max_requests, window)
+
         @wraps(f)
         def wrapped(*args: Any, **kwargs: Any) -> Any:
             if current_app.config.get('TESTING'):
                 return f(*args, **kwargs)
 
-            limiter = get_rate_limiter(max_requests, window)
             client_id = request.remote_addr or 'unknown'
 
-            if not limiter.is_allowed(client_id):
-                retry_after = limiter.get_retry_after(client_id)
+            retry_after = limiter.acquire(client_id)
+            if retry_after:
                 return APIResponse.error(f'Rate limit exceeded. Retry after {retry_after}s.', 429)
 
             return f(*args, **kwargs)
@@ -179,16 +190,18 @@ def public_rate_limit(max_requests: int = 60, window: int = 60) -> Callable[...,
     """公开API限流装饰器"""
 
     def decorator(f: Callable[..., Any]) -> Callable[..., Any]:
+        # 装饰时解析限流器，避免每个请求重复拼接键并查表
+        limiter = get_rate_limiter(max_requests, window)
+
         @wraps(f)
         def wrapped(*args: Any, **kwargs: Any) -> Any:
             if current_app.config.get('TESTING'):
                 return f(*args, **kwargs)
 
-            limiter = get_rate_limiter(max_requests, window)
             client_id = request.remote_addr or 'unknown'
 
-            if not limiter.is_allowed(client_id):
-                retry_after = limiter.get_retry_after(client_id)
+            retry_after = limiter.acquire(client_id)
+            if retry_after:
                 return PublicAPIResponse.error(f'Rate limit exceeded. Retry after {retry_after}s.', 429)
 
             return f(*args, **kwargs)
@@ -198,41 +211,41 @@ def public_rate_limit(max_requests: int = 60, window: int = 60) -> Callable[...,
     return decorator
 
 
+def _get_csrf_signer() -> URLSafeTimedSerializer:
+    """获取应用级 CSRF 签名器（应用初始化时创建，缺失时按当前密钥补建）"""
+    signer = current_app.extensions.get('csrf_signer')
+    if signer is None:
+        signer = URLSafeTimedSerializer(current_app.secret_key, salt='csrf')
+        current_app.extensions['csrf_signer'] = signer
+    return signer
+
+
+def _get_csrf_session_id() -> str:
+    """获取或生成当前会话ID（与 API 蓝图使用同一个 session 键）"""
+    if 'session_id' not in session:
+        session['session_id'] = secrets.token_hex(16)
+    return session['session_id']
+
+
 def get_csrf_token() -> str:
-    token = secrets.token_hex(32)
-    try:
-        db.session.add(CSRFToken(token=token))
-        db.session.commit()
-        token_count = CSRFToken.query.count()
-        if token_count % 100 == 0:
-            _cleanup_expired_csrf_tokens()
-    except Exception as e:
-        log_error(ErrorCategory.DB_QUERY, f'CSRF token 创建失败: {e}')
-        db.session.rollback()
-    return token
+    """签发绑定当前会话的 CSRF 令牌（无状态签名，不写数据库）"""
+    return _get_csrf_signer().dumps(_get_csrf_session_id())
 
 
 def validate_csrf_token() -> bool:
     token = request.headers.get('X-CSRF-Token') or request.form.get('csrf_token')
     if not token:
         return False
+    session_id = session.get('session_id')
+    if not session_id:
+        return False
     try:
-        record = db.session.get(CSRFToken, token)
-        if record is None:
-            return False
-        if record.created_at.tzinfo is None:
-            created_at_utc = record.created_at.replace(tzinfo=UTC)
-        else:
-            created_at_utc = record.created_at
-        if datetime.now(UTC) - created_at_utc > timedelta(seconds=_CSRF_TOKEN_TTL):
-            db.session.delete(record)
-            db.session.commit()
-            return False
-        return True
-    except Exception as e:
-        log_error(ErrorCategory.DB_QUERY, f'CSRF token 验证失败: {e}')
-        db.session.rollback()
+        token_session_id = _get_csrf_signer().loads(token, max_age=_CSRF_TOKEN_TTL)
+    except BadData:
+        return False
+    if not isinstance(token_session_id, str):
         return False
+    return secrets.compare_digest(token_session_id, session_id)
 
 
 def csrf_protect(f: Callable[..., Any]) -> Callable[..., Any]:
@@ -242,25 +255,19 @@ def csrf_protect(f: Callable[..., Any]) -> Callable[..., Any]:
         if current_app.config.get('TESTING'):
             return f(*args, **kwargs)
 
-        if request.method in ['POST', 'PUT', 'DELETE', 'PATCH']:
-            token = request.headers.get('X-CSRF-Token') or request.form.get('csrf_token')
-            if not validate_csrf_token():
-                _logger.warning(f'CSRF验证失败: {request.remote_addr}')
-                return APIResponse.error('CSRF token invalid', 403)
-            if token:
-                try:
-                    record = db.session.get(CSRFToken, token)
-                    if record:
-                        db.session.delete(record)
-                        db.session.commit()
-                except Exception as e:
-                    log_error(ErrorCategory.DB_QUERY, f'CSRF token 删除失败: {e}')
-                    db.session.rollback()
+        if request.method in ['POST', 'PUT', 'DELETE', 'PATCH'] and not validate_csrf_token():
+            _logger.warning(f'CSRF验证失败: {request.remote_addr}')
+            return APIResponse.error('CSRF token invalid', 403)
         return f(*args, **kwargs)
 
     return wrapped
 
 
+# 译者后缀残留（"xxx译" / "xxx[译]" / "xxx(译)"），每条译文都会检测一次
+_TRANSLATOR_SUFFIX_RE = re.compile(r'[\s]*(?:译|\[译\]|\(译\))\s*$')
+# 清理时依次去除的译者标记
+_TRANSLATOR_MARK_RES = (re.compile(r'[\s]*译$'), re.compile(r'[\s]*\[译\]$'), re.compile(r'[\s]*\(译\)$'))
+
 _DIRTY_MARKERS = (
     '书名：',
     '作者：',
@@ -296,22 +303,25 @@ _FIELD_LABELS_MAP = {
     },
 }
 
-_FIELD_PREFIX_PATTERNS = [
-    r'(?:^|\s)书名[：:]\s*',
-    r'(?:^|\s)作者[：:]\s*',
-    r'(?:^|\s)简介[：:]\s*',
-    r'(?:^|\s)描述[：:]\s*',
-    r'(?:^|\s)详情[：:]\s*',
-    r'(?:^|\s)出版社[：:]\s*',
-    r'(?:^|\s)Title[：:]\s*',
-    r'(?:^|\s)Author[：:]\s*',
-    r'(?:^|\s)Description[：:]\s*',
-    r'(?:^|\s)Summary[：:]\s*',
-    r'(?:^|\s)Details[：:]\s*',
-    r'(?:^|\s)Publisher[：:]\s*',
-    r'(?:^|\s)Book Title[：:]\s*',
-    r'(?:^|\s)Translated Title[：:]\s*',
-]
+_FIELD_PREFIX_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:^|\s)书名[：:]\s*',
+        r'(?:^|\s)作者[：:]\s*',
+        r'(?:^|\s)简介[：:]\s*',
+        r'(?:^|\s)描述[：:]\s*',
+        r'(?:^|\s)详情[：:]\s*',
+        r'(?:^|\s)出版社[：:]\s*',
+        r'(?:^|\s)Title[：:]\s*',
+        r'(?:^|\s)Author[：:]\s*',
+        r'(?:^|\s)Description[：:]\s*',
+        r'(?:^|\s)Summary[：:]\s*',
+        r'(?:^|\s)Details[：:]\s*',
+        r'(?:^|\s)Publisher[：:]\s*',
+        r'(?:^|\s)Book Title[：:]\s*',
+        r'(?:^|\s)Translated Title[：:]\s*',
+    )
+)
 
 
 def _extract_field_content(text: str, field_type: str) -> str:
@@ -339,6 +349,13 @@ def _extract_field_content(text: str, field_type: str) -> str:
     return text[start_pos:end_pos].strip()
 
 
+_LATIN_LETTER_RE = re.compile(r'[a-zA-Z]')
+_BOOK_MARK_RE = re.compile(r'《([^》\n]+)》')
+_MIDDLE_DOT_RE = re.compile(r'\s*·\s*')
+_TRAILING_TRANSLATOR_RE = re.compile(r'\s+[\u4e00-\u9fff]{1,4}(?:·[\u4e00-\u9fff]{1,4})*译?\s*$')
+_DESCRIPTION_START_RE = re.compile(r'[。，；](?:这本书|作者|该书|本书)')
+
+
 def _add_book_title_marks(text: str) -> str:
     """给纯中文书名添加《》（仅在标题上下文中使用）"""
     if not text:
@@ -346,7 +363,7 @@ def _add_book_title_marks(text: str) -> str:
     text = text.strip()
     if text.startswith('《') and text.endswith('》'):
         return text
-    if re.search(r'[a-zA-Z]', text):
+    if _LATIN_LETTER_RE.search(text):
         return text
     return f'《{text}》'
 
@@ -365,7 +382,7 @@ def _clean_title_text(text: str) -> str:
         return text
     text = text.strip()
 
-    book_match = re.search(r'《([^》\n]+)》', text)
+    book_match = _BOOK_MARK_RE.search(text)
     if book_match:
         return book_match.group(1).strip()
 
@@ -377,43 +394,49 @@ def _clean_title_text(text: str) -> str:
                 return first_line
 
     if '·' in text:
-        parts = re.split(r'\s*·\s*', text.replace('\n', ' '))
+        parts = _MIDDLE_DOT_RE.split(text.replace('\n', ' '))
         candidates = [p.strip() for p in parts if '·' not in p and len(p.strip()) <= 20]
         if candidates:
             return candidates[0]
 
     text_flat = text.replace('\n', ' ').strip()
-    text_flat = re.sub(r'\s+[\u4e00-\u9fff]{1,4}(?:·[\u4e00-\u9fff]{1,4})*译?\s*$', '', text_flat).strip()
+    text_flat = _TRAILING_TRANSLATOR_RE.sub('', text_flat).strip()
 
-    desc_match = re.search(r'[。，；](?:这本书|作者|该书|本书)', text_flat)
+    desc_match = _DESCRIPTION_START_RE.search(text_flat)
     if desc_match and desc_match.start() > 2:
         text_flat = text_flat[: desc_match.start()].strip()
 
     return text_flat
 
 
-def _strip_markdown(text: str) -> str:
-    """清除Markdown格式标记（粗体、斜体、代码、标题、链接等）"""
-    if not text:
-        return text
+_MARKDOWN_RULES = (
     # 粗体 **text** 或 __text__
-    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
-    text = re.sub(r'__(.*?)__', r'\1', text)
+    (re.compile(r'\*\*(.*?)\*\*'), r'\1'),
+    (re.compile(r'__(.*?)__'), r'\1'),
     # 斜体 *text* 或 _text_（避免误删下划线命名）
-    text = re.sub(r'(?<!\w)\*([^\*]+?)\*(?!\w)', r'\1', text)
-    text = re.sub(r'(?<!\w)_([^_]+?)_(?!\w)', r'\1', text)
+    (re.compile(r'(?<!\w)\*([^\*]+?)\*(?!\w)'), r'\1'),
+    (re.compile(r'(?<!\w)_([^_]+?)_(?!\w)'), r'\1'),
     # 行内代码 `text`
-    text = re.sub(r'`([^`]+?)`', r'\1', text)
+    (re.compile(r'`([^`]+?)`'), r'\1'),
     # 标题 # text
-    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+    (re.compile(r'^#{1,6}\s+', re.MULTILINE), ''),
     # 链接 [text](url) -> text
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+    (re.compile(r'\[([^\]]+)\]\([^\)]+\)'), r'\1'),
     # 图片 ![text](url) -> 空
-    text = re.sub(r'!\[([^\]]*)\]\([^\)]+\)', '', text)
+    (re.compile(r'!\[([^\]]*)\]\([^\)]+\)'), ''),
     # 水平线 --- 或 ***
-    text = re.sub(r'^[\-\*_]{3,}\s*$', '', text, flags=re.MULTILINE)
+    (re.compile(r'^[\-\*_]{3,}\s*$', re.MULTILINE), ''),
     # 引用 > text
-    text = re.sub(r'^>\s+', '', text, flags=re.MULTILINE)
+    (re.compile(r'^>\s+', re.MULTILINE), ''),
+)
+
+
+def _strip_markdown(text: str) -> str:
+    """清除Markdown格式标记（粗体、斜体、代码、标题、链接等）"""
+    if not text:
+        return text
+    for pattern, repl in _MARKDOWN_RULES:
+        text = pattern.sub(repl, text)
     return text.strip()
 
 
@@ -432,14 +455,13 @@ def clean_translation_text(text: str, field_type: str = 'text') -> str:
     # 清除残留的单个星号（兜底）
     text = text.replace('*', '')
     # 清除末尾的"译"字后缀（GLM模型翻译标记残留，如"希望升起译"）
-    text = re.sub(r'[\s]*译$', '', text)
-    text = re.sub(r'[\s]*\[译\]$', '', text)
-    text = re.sub(r'[\s]*\(译\)$', '', text)
+    for pattern in _TRANSLATOR_MARK_RES:
+        text = pattern.sub('', text)
     # 提取字段内容
     if field_type in _FIELD_LABELS_MAP:
         text = _extract_field_content(text, field_type)
     for pattern in _FIELD_PREFIX_PATTERNS:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        text = pattern.sub('', text)
     # 统一引号
     text = text.replace('\u201c', '\u201c').replace('\u201d', '\u201d')
     text = text.replace('\u2018', '\u2018').replace('\u2019', '\u2019')
@@ -456,6 +478,6 @@ def quick_clean_translation(text: str, field_type: str = 'text') -> str:
         return text
     if any(marker in text for marker in _DIRTY_MARKERS):
         return clean_translation_text(text, field_type)
-    if re.search(r'[\s]*(?:译|\[译\]|\(译\))\s*$', text):
+    if _TRANSLATOR_SUFFIX_RE.search(text):
         return clean_translation_text(text, field_type)
     return text
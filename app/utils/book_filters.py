@@ -9,16 +9,55 @@ def get_category_update_frequency(category_id: str) -> str:
     return current_app.config['NYT_CATEGORY_UPDATE_FREQUENCIES'].get(category_id, 'weekly')
 
 
-def filter_books_by_search(books_data: list, search_query: str) -> list:
+def build_search_keys(books_data: list) -> list[str]:
+    """预先计算每本书的小写检索串，可随书籍列表一起缓存复用
+
+    书名与作者拼成一个串只做一次 casefold()；\\0 分隔，避免跨字段误匹配。
+    casefold 比 lower 更彻底（如 ß → ss），大小写无关匹配对非 ASCII 书名同样成立
+    """
+    return [f'{b.get("title") or ""}\0{b.get("author") or ""}'.casefold() for b in books_data]
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class BookSearchIndex:
+    """书籍列表的三元组倒排索引
+
+    随分类书籍列表一起构建并缓存：查询词不短于 3 个字符时，
+    先对各三元组的倒排表求交集得到候选，再逐个做子串校验；
+    更短的查询回退到对预计算检索串的线性扫描。
+    """
+
+    def __init__(self, books_data: list):
+        self.keys = build_search_keys(books_data)
+        self._postings: dict[str, set[int]] = {}
+        for position, key in enumerate(self.keys):
+            for gram in _trigrams(key):
+                self._postings.setdefault(gram, set()).add(position)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def match(self, search_query: str) -> list[int]:
+        """返回命中书籍的下标，保持原列表顺序"""
+        query = search_query.casefold()
+        if len(query) < 3:
+            return [position for position, key in enumerate(self.keys) if query in key]
+        postings = sorted((self._postings.get(gram, set()) for gram in _trigrams(query)), key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        return [position for position in sorted(candidates) if query in self.keys[position]]
+
+
+def filter_books_by_search(books_data: list, search_query: str, search_index: BookSearchIndex | None = None) -> list:
     if not search_query or not books_data:
         return books_data
 
-    search_lower = search_query.lower()
-    return [
-        b
-        for b in books_data
-        if search_lower in b.get('title', '').lower() or search_lower in b.get('author', '').lower()
-    ]
+    if search_index is None:
+        search_folded = search_query.casefold()
+        return [b for b, key in zip(books_data, build_search_keys(books_data), strict=True) if search_folded in key]
+    return [books_data[position] for position in search_index.match(search_query)]
 
 
 def filter_books_by_publisher(books_data: list, publisher: str) -> list:
@@ -0,0 +1,10 @@
+"""
+路由层共享的结果缓存
+
+页面路由与 API 路由共用同一个进程内缓存，管理接口清空时两边同时失效。
+"""
+
+from ..services.cache_service import MemoryCache
+
+# 接口结果缓存：短时间内复用已序列化的列表数据，避免热点分类/奖项每次重建
+result_cache = MemoryCache(default_ttl=60, max_size=256)
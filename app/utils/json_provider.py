@@ -0,0 +1,66 @@
+"""
+基于 orjson 的 Flask JSON Provider
+
+jsonify / request.get_json 统一走 orjson 的 C 实现；
+datetime、Decimal 等类型仍交给 Flask 默认规则处理，保证输出格式不变。
+"""
+
+from typing import Any
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from flask.wrappers import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 为可选加速依赖
+    # 仅 init_json_provider 会看到 None；ORJSONProvider 只在 orjson 可用时注册
+    orjson = None  # type: ignore[assignment]
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """使用 orjson 序列化/反序列化的 JSON Provider"""
+
+    _app: Flask
+
+    def dumps_bytes(self, obj: Any, **kwargs: Any) -> bytes:
+        """序列化为 UTF-8 字节，供响应体直接使用
+
+        先按纯字符串键快速序列化；OPT_NON_STR_KEYS 会使编码耗时翻倍，
+        仅在遇到非字符串键报错时才带上该选项重试。
+        """
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        default = kwargs.get('default', self.default)
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except orjson.JSONEncodeError:
+            return orjson.dumps(obj, default=default, option=option | orjson.OPT_NON_STR_KEYS)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self.dumps_bytes(obj, **kwargs).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """jsonify 入口：orjson 字节直接作为响应体，省去 decode 再 encode 的往返"""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            response=self.dumps_bytes(obj, indent=indent) + b'\n',
+            mimetype=self.mimetype,
+        )
+
+
+def init_json_provider(app: Any) -> None:
+    """已安装 orjson 时替换应用的 JSON Provider，否则保留 Flask 默认实现"""
+    if orjson is None:
+        app.logger.info('orjson 未安装，使用 Flask 默认 JSON 序列化')
+        return
+    app.json = ORJSONProvider(app)
+    # Flask 3 不再读取 JSON_SORT_KEYS 配置，需显式同步到 Provider，避免每次响应都排序键
+    app.json.sort_keys = app.config.get('JSON_SORT_KEYS', app.json.sort_keys)
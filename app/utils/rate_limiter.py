@@ -1,6 +1,6 @@
 import logging
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from threading import Lock
 
 logger = logging.getLogger(__name__)
@@ -53,7 +53,8 @@ class IPRateLimiter:
     def __init__(self, max_requests: int = 60, window_seconds: int = 60):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._requests: dict[str, list[float]] = defaultdict(list)
+        # 每个客户端的请求时间戳按时间递增，deque 从左端淘汰过期项，无需每次重建列表
+        self._requests: dict[str, deque[float]] = defaultdict(deque)
         self._lock = Lock()
         self._last_cleanup: float = 0.0
 
@@ -67,25 +68,39 @@ class IPRateLimiter:
         Returns:
             是否允许请求
         """
+        return self.acquire(client_id) == 0
+
+    def acquire(self, client_id: str) -> int:
+        """
+        检查并记录一次请求，同一次加锁内完成窗口淘汰、计数与重试时间计算
+
+        Args:
+            client_id: 客户端标识（通常是 IP 地址）
+
+        Returns:
+            允许时返回 0（已计入窗口）；超限时返回需等待的秒数
+        """
         with self._lock:
             now = time.time()
 
-            self._requests[client_id] = [t for t in self._requests[client_id] if now - t < self.window_seconds]
+            timestamps = self._requests[client_id]
+            while timestamps and now - timestamps[0] >= self.window_seconds:
+                timestamps.popleft()
 
-            if len(self._requests[client_id]) >= self.max_requests:
+            if len(timestamps) >= self.max_requests:
                 logger.warning(f'Rate limit exceeded for {client_id}')
-                return False
+                return int(self.window_seconds - (now - timestamps[0])) + 1
 
-            self._requests[client_id].append(now)
+            timestamps.append(now)
 
             # 每 60 秒清理一次过期条目，避免 O(n*m) 的实时清理
             if now - self._last_cleanup > 60:
                 self._last_cleanup = now
-                expired = [k for k, v in self._requests.items() if not v or (now - max(v)) > self.window_seconds * 2]
+                expired = [k for k, v in self._requests.items() if not v or (now - v[-1]) > self.window_seconds * 2]
                 for k in expired:
                     del self._requests[k]
 
-            return True
+            return 0
 
     def get_retry_after(self, client_id: str) -> int:
         """获取指定客户端需要等待的秒数"""
@@ -98,7 +113,7 @@ class IPRateLimiter:
                 return 0
 
             now = time.time()
-            oldest = min(requests)
+            oldest = requests[0]
             wait_time = int(self.window_seconds - (now - oldest)) + 1
             return max(0, wait_time)
 
@@ -107,7 +122,7 @@ class IPRateLimiter:
         with self._lock:
             now = time.time()
             expired_clients = [
-                client_id for client_id, times in self._requests.items() if not times or (now - max(times)) > max_age
+                client_id for client_id, times in self._requests.items() if not times or (now - times[-1]) > max_age
             ]
             for client_id in expired_clients:
                 del self._requests[client_id]
@@ -64,7 +64,7 @@ def get_smart_search_service() -> Any | None:
 
 
 def _get_or_create_service(name: str, factory_path: str):
-    """获取已注册服务；若未注册则按当前 CATEGORIES 兜底创建"""
+    """获取已注册服务；若未注册则按当前 CATEGORIES 创建一次并注册为单例（服务无请求级状态，可跨线程共享）"""
     svc = get_service(name)
     if svc is not None:
         return svc
@@ -72,16 +72,17 @@ def _get_or_create_service(name: str, factory_path: str):
     module = __import__(module_path, fromlist=[class_name])
     factory = getattr(module, class_name)
     categories = current_app.config.get('CATEGORIES', {})
-    return factory(categories)
+    # setdefault 保证并发首次访问时所有线程拿到同一个实例
+    return current_app.extensions.setdefault(name, factory(categories))
 
 
 def get_or_create_recommendation_service() -> Any:
-    """获取已注册的 RecommendationService；若未注册则按当前 CATEGORIES 兜底创建"""
+    """获取已注册的 RecommendationService；若未注册则按当前 CATEGORIES 创建并注册"""
     return _get_or_create_service('recommendation_service', 'app.services.recommendation_service.RecommendationService')
 
 
 def get_or_create_smart_search_service() -> Any:
-    """获取已注册的 SmartSearchService；若未注册则按当前 CATEGORIES 兜底创建"""
+    """获取已注册的 SmartSearchService；若未注册则按当前 CATEGORIES 创建并注册"""
     return _get_or_create_service('smart_search_service', 'app.services.smart_search_service.SmartSearchService')
 
 
@@ -115,17 +116,20 @@ def db_transaction() -> Generator[Session]:
 
 
 def get_or_create_google_books_client() -> GoogleBooksClient:
-    """获取 GoogleBooksClient，若未初始化则创建兜底实例"""
+    """获取 GoogleBooksClient，若未初始化则创建兜底实例并注册为单例（复用连接池）"""
     client = get_google_books_client()
     if client:
         return client
-    from ..config import Config
-    from ..services.google_books_client import GoogleBooksClient
-
-    return GoogleBooksClient(
-        api_key=Config.GOOGLE_API_KEY,
-        base_url='https://www.googleapis.com/books/v1/volumes',
-    )
+    client = get_service('google_books_client')
+    if client is None:
+        from ..config import Config
+
+        client = GoogleBooksClient(
+            api_key=Config.GOOGLE_API_KEY,
+            base_url='https://www.googleapis.com/books/v1/volumes',
+        )
+        register_service(current_app, 'google_books_client', client)
+    return client
 
 
 def get_google_books_client() -> GoogleBooksClient | None:
@@ -4,8 +4,10 @@
 实现渐进式迁移：未做移动版的页面仍可正常访问桌面版。
 """
 
-from flask import render_template
-from jinja2 import TemplateNotFound
+from collections.abc import Iterator
+
+from flask import current_app, render_template, stream_template
+from jinja2 import Template, TemplateNotFound
 
 from app.utils.device_detect import is_mobile
 
@@ -27,3 +29,50 @@ def render_adaptive(template_name: str, **context) -> str:
         except TemplateNotFound:
             pass  # 移动模板未实现，回退桌面版
     return render_template(template_name, **context)
+
+
+# 流式渲染时合并 Jinja 输出片段的目标块大小，避免逐个小片段写入 socket
+_STREAM_CHUNK_SIZE = 8192
+
+
+def _select_adaptive_template(template_name: str) -> Template:
+    """按设备类型选出模板对象；在开始流式输出前完成查找，缺失模板不会中断已发送的响应"""
+    env = current_app.jinja_env
+    if is_mobile():
+        try:
+            return env.get_template(f'mobile/{template_name}')
+        except TemplateNotFound:
+            pass
+    return env.get_template(template_name)
+
+
+def _coalesce(fragments: Iterator[str], size: int = _STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """把 Jinja 逐段产出的小字符串合并成约 size 字符的块"""
+    buffer: list[str] = []
+    buffered = 0
+    for fragment in fragments:
+        buffer.append(fragment)
+        buffered += len(fragment)
+        if buffered >= size:
+            yield ''.join(buffer)
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def stream_adaptive(template_name: str, **context) -> Iterator[str]:
+    """render_adaptive 的流式版本，用于图书列表较长的页面。
+
+    Jinja 边渲染边输出，浏览器可提前拿到 <head> 开始加载 CSS/图片，
+    服务端也无需在内存中拼出完整 HTML。上下文需在调用前准备完毕。
+
+    Args:
+        template_name: 桌面模板名（如 'awards.html'）
+        **context: 传递给模板的上下文变量
+
+    Returns:
+        HTML 片段迭代器，可直接作为 response_class 的响应体
+    """
+    # stream_template 通过 stream_with_context 保持请求上下文直到输出结束
+    return _coalesce(stream_template(_select_adaptive_template(template_name), **context))
@@ -0,0 +1,26 @@
+"""Add composite filter indexes on award_books
+
+Revision ID: add_award_books_composite_indexes
+Revises: add_award_books_trgm_indexes
+Create Date: 2026-10-16 00:00:00.000000
+
+说明：(award_id, year, rank) 匹配按奖项筛选、按 year DESC, rank ASC 排序的列表查询；
+(award_id, category) 匹配不带年份的奖项 + 类别筛选。所有数据库均创建。
+"""
+
+from alembic import op
+
+revision = 'add_award_books_composite_indexes'
+down_revision = 'add_award_books_trgm_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('idx_award_books_award_year_rank', 'award_books', ['award_id', 'year', 'rank'], if_not_exists=True)
+    op.create_index('idx_award_books_award_category', 'award_books', ['award_id', 'category'], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('idx_award_books_award_category', table_name='award_books', if_exists=True)
+    op.drop_index('idx_award_books_award_year_rank', table_name='award_books', if_exists=True)
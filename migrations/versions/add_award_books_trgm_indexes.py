@@ -0,0 +1,35 @@
+"""Add trigram indexes on award_books text columns
+
+Revision ID: add_award_books_trgm_indexes
+Revises: create_all_missing_tables
+Create Date: 2026-10-16 00:00:00.000000
+
+说明：仅 PostgreSQL 生效，启用 pg_trgm 扩展并为 title/author/title_zh 建立 GIN 三元组索引，
+使获奖图书搜索与关键词筛选的 ILIKE '%kw%' 子串匹配可以走索引。SQLite 等其他数据库跳过。
+"""
+
+from alembic import op
+
+revision = 'add_award_books_trgm_indexes'
+down_revision = 'create_all_missing_tables'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ('title', 'author', 'title_zh')
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in _COLUMNS:
+        op.execute(
+            f'CREATE INDEX IF NOT EXISTS idx_award_books_{column}_trgm ON award_books USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for column in _COLUMNS:
+        op.execute(f'DROP INDEX IF EXISTS idx_award_books_{column}_trgm')
@@ -6,8 +6,11 @@ pytest 测试配置文件
 
 import os
 import sys
+from contextlib import contextmanager
 
 import pytest
+from flask.testing import FlaskClient
+from sqlalchemy import event
 
 # 确保项目根目录在 Python 路径中
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -54,6 +57,27 @@ def client(app):
     return app.test_client()
 
 
+class BufferedFlaskClient(FlaskClient):
+    """默认缓冲响应体的测试客户端，流式响应在返回前即被完整消费并关闭"""
+
+    def open(self, *args, **kwargs):
+        kwargs.setdefault('buffered', True)
+        return super().open(*args, **kwargs)
+
+
+@pytest.fixture
+def buffered_client(app):
+    """
+    流式页面（/awards）专用的测试客户端
+
+    未消费的流式响应会把请求上下文遗留到后续测试，缓冲后由客户端负责关闭。
+
+    Returns:
+        BufferedFlaskClient 实例
+    """
+    return BufferedFlaskClient(app, app.response_class, use_cookies=True)
+
+
 @pytest.fixture(scope='function')
 def db(app):
     """
@@ -78,6 +102,9 @@ def db(app):
         _db.session.remove()
         _db.drop_all()
 
+    # 数据表随测试重建，进程内搜索建议前缀树需同步失效
+    app.extensions['suggestion_trie'].mark_stale()
+
 
 @pytest.fixture(scope='function')
 def session(app, db):
@@ -132,6 +159,16 @@ def _restore_testing_flag(app):
     app.config['TESTING'] = True
 
 
+@pytest.fixture(autouse=True)
+def _clear_result_cache():
+    """清空路由结果缓存，避免模块级缓存把上一个用例的数据带入下一个用例"""
+    from app.utils.cache import result_cache
+
+    result_cache.clear()
+    yield
+    result_cache.clear()
+
+
 @pytest.fixture
 def mock_books_data():
     """
@@ -331,3 +368,34 @@ def clear_auth_failures():
     admin_auth._auth_failures.clear()
     yield
     admin_auth._auth_failures.clear()
+
+
+@pytest.fixture
+def capture_statements(db):
+    """
+    记录 with 块内发往数据库的 SQL 语句
+
+    用法::
+
+        with capture_statements() as statements:
+            service.query(...)
+        assert len(statements) == 1
+
+    Returns:
+        返回上下文管理器的工厂函数，上下文产出按执行顺序排列的语句列表
+    """
+
+    @contextmanager
+    def _capture():
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', _record)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', _record)
+
+    return _capture
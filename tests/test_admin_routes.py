@@ -12,6 +12,7 @@
 - GET|POST /api/admin/translations/cleanup
 - GET  /api/admin/errors
 - POST /api/admin/errors/clear
+- POST /api/admin/awards/seed
 """
 
 import json
@@ -136,10 +137,11 @@ class TestSyncAwardCovers:
             data = json.loads(response.data)
             assert data['success'] is True
 
-    def test_sync_exception(self, client, admin_headers):
+    def test_sync_exception(self, app, client, admin_headers):
+        app.extensions.pop('google_books_client', None)
         with (
             patch('app.utils.service_helpers.get_google_books_client', return_value=None),
-            patch('app.services.google_books_client.GoogleBooksClient', side_effect=RuntimeError('连接失败')),
+            patch('app.utils.service_helpers.GoogleBooksClient', side_effect=RuntimeError('连接失败')),
             patch('app.routes.admin.log_error'),
         ):
             response = client.post(
@@ -202,10 +204,11 @@ class TestGetAwardCoversStatus:
             data = json.loads(response.data)
             assert data['success'] is True
 
-    def test_get_status_exception(self, client, admin_headers):
+    def test_get_status_exception(self, app, client, admin_headers):
+        app.extensions.pop('google_books_client', None)
         with (
             patch('app.utils.service_helpers.get_google_books_client', return_value=None),
-            patch('app.services.google_books_client.GoogleBooksClient', side_effect=RuntimeError('错误')),
+            patch('app.utils.service_helpers.GoogleBooksClient', side_effect=RuntimeError('错误')),
             patch('app.routes.admin.log_error'),
         ):
             response = client.get('/api/admin/award-covers/status', headers=admin_headers)
@@ -1222,3 +1225,32 @@ class TestGetNewBooksLastSync:
     def test_without_auth_rejected(self, client):
         response = client.get('/api/admin/new-books/last-sync')
         assert response.status_code == 403
+
+
+# ==================== 获奖图书补种 ====================
+
+
+class TestSeedAwardBooks:
+    """POST /api/admin/awards/seed"""
+
+    def test_seeded_year_visible_immediately(self, client, admin_headers, db, sample_award_book, sample_award):
+        from app.models.schemas import AwardBook
+
+        years = client.get('/awards.json').get_json()['data']['years']
+        assert 2031 not in years
+
+        def fake_seed(app):
+            db.session.add(AwardBook(award_id=sample_award, title='补种图书', author='补种作者', year=2031))
+            db.session.commit()
+
+        with patch('app.initialization.sample_award_books.init_sample_award_books', side_effect=fake_seed):
+            response = client.post('/api/admin/awards/seed', headers=admin_headers)
+
+        assert response.status_code == 200
+        assert response.get_json()['data']['total_awards'] == 2
+        years = client.get('/awards.json').get_json()['data']['years']
+        assert 2031 in years
+
+    def test_without_auth_rejected(self, client):
+        response = client.post('/api/admin/awards/seed')
+        assert response.status_code == 403
@@ -7,6 +7,7 @@
 import pytest
 
 from app.models.schemas import Award, AwardBook
+from app.services.award_book_service import AwardBookService
 
 
 def _seed_test_data(db):
@@ -70,6 +71,28 @@ class TestAwardsAPI:
         assert data['success'] is True
         assert 'books' in data['data']
 
+    def test_get_award_books_reuses_joined_award(self, client_with_award_data, app):
+        """当前页有图书时奖项取自 joinedload 结果，不再单独查询"""
+        from unittest.mock import patch
+
+        with app.app_context():
+            award = Award.query.first()
+        with patch.object(AwardBookService, 'get_award_by_id') as mock_get_award:
+            response = client_with_award_data.get(f'/api/awards/{award.id}/books?limit=7')
+            mock_get_award.assert_not_called()
+        data = response.get_json()['data']
+        assert data['award']['id'] == award.id
+        assert len(data['books']) == 2
+
+    def test_get_awards_served_from_cache(self, client_with_award_data, app, db):
+        """奖项列表命中结果缓存时不再查询数据库"""
+        client = client_with_award_data
+        first = client.get('/api/awards').get_json()
+        db.session.add(Award(name='Later Award', description='added after caching', country='UK'))
+        db.session.commit()
+        second = client.get('/api/awards').get_json()
+        assert second['data']['awards'] == first['data']['awards']
+
     def test_get_award_books_not_found(self, client):
         """测试获取不存在奖项的图书列表"""
         response = client.get('/api/awards/99999/books')
@@ -122,6 +145,28 @@ class TestAwardsAPI:
         assert data['success'] is True
         assert 'books' in data['data']
 
+    def test_search_award_books_without_exact_total(self, client_with_award_data):
+        """exact_total=0 时返回 has_more，不统计总数"""
+        from unittest.mock import patch
+
+        client = client_with_award_data
+        with patch('sqlalchemy.orm.Query.count') as mock_count:
+            response = client.get('/api/award-books/search?keyword=Test&limit=1&exact_total=0')
+            last = client.get('/api/award-books/search?keyword=Test&limit=1&page=2&exact_total=0')
+            mock_count.assert_not_called()
+        data = response.get_json()['data']
+        assert len(data['books']) == 1
+        assert data['pagination'] == {'page': 1, 'limit': 1, 'has_more': True}
+        assert last.get_json()['data']['pagination']['has_more'] is False
+
+    def test_search_award_books_exact_total_by_default(self, client_with_award_data):
+        """默认仍返回 total/pages，并附带 has_more"""
+        response = client_with_award_data.get('/api/award-books/search?keyword=Test&limit=1')
+        pagination = response.get_json()['data']['pagination']
+        assert pagination['total'] == 2
+        assert pagination['pages'] == 2
+        assert pagination['has_more'] is True
+
     def test_search_award_books_empty_keyword(self, client):
         """测试搜索获奖图书时空关键词"""
         response = client.get('/api/award-books/search?keyword=')
@@ -145,6 +190,71 @@ class TestAwardsPagination:
         assert 'pagination' in data['data']
         assert data['data']['pagination']['limit'] == 1
 
+    def test_cursor_pagination(self, client_with_award_data):
+        """传入 cursor 时使用游标分页，逐页取完全部图书"""
+        client = client_with_award_data
+        first = client.get('/api/award-books?cursor=&limit=1').get_json()['data']
+        assert first['pagination']['has_more'] is True
+        assert 'total' not in first['pagination']
+
+        cursor = first['pagination']['next_cursor']
+        second = client.get(f'/api/award-books?cursor={cursor}&limit=1').get_json()['data']
+        assert second['pagination']['has_more'] is False
+        assert second['pagination']['next_cursor'] is None
+        assert first['books'][0]['id'] != second['books'][0]['id']
+
+    def test_cursor_pagination_for_award(self, client_with_award_data, app):
+        client = client_with_award_data
+        with app.app_context():
+            award = Award.query.first()
+        response = client.get(f'/api/awards/{award.id}/books?cursor=&limit=5')
+        data = response.get_json()['data']
+        assert len(data['books']) == 2
+        assert data['pagination']['has_more'] is False
+
+    def test_invalid_cursor(self, client_with_award_data):
+        response = client_with_award_data.get('/api/award-books?cursor=not-a-cursor')
+        assert response.status_code == 400
+
+    def test_service_value_error_is_not_reported_as_bad_cursor(self, client_with_award_data):
+        """只有游标解析失败才返回 400，其余 ValueError 按内部错误处理"""
+        from unittest.mock import patch
+
+        with patch.object(AwardBookService, 'get_award_books_after', side_effect=ValueError('boom')):
+            response = client_with_award_data.get('/api/award-books?cursor=&limit=1')
+        assert response.status_code == 500
+
+    def test_search_cursor_pagination(self, client_with_award_data):
+        """搜索传入 cursor 时走游标分页，不执行 count()"""
+        from unittest.mock import patch
+
+        client = client_with_award_data
+        with patch('sqlalchemy.orm.Query.count') as mock_count:
+            first = client.get('/api/award-books/search?keyword=Test&cursor=&limit=1').get_json()['data']
+            cursor = first['pagination']['next_cursor']
+            second = client.get(f'/api/award-books/search?keyword=Test&cursor={cursor}&limit=1').get_json()['data']
+            mock_count.assert_not_called()
+        assert first['pagination']['has_more'] is True
+        assert 'page' not in first['pagination']
+        assert second['pagination'] == {'limit': 1, 'next_cursor': None, 'has_more': False}
+        assert first['books'][0]['id'] != second['books'][0]['id']
+
+    def test_search_invalid_cursor(self, client_with_award_data):
+        response = client_with_award_data.get('/api/award-books/search?keyword=Test&cursor=not-a-cursor')
+        assert response.status_code == 400
+
+    def test_search_page_and_cursor_modes_share_order(self, client_with_award_data, db):
+        """同年图书按 id 倒序：页码分页与游标分页的结果顺序一致"""
+        award = Award.query.first()
+        db.session.add(AwardBook(award_id=award.id, title='Test Book 3', author='Author Three', year=2024, rank=3))
+        db.session.commit()
+
+        client = client_with_award_data
+        paged = client.get('/api/award-books/search?keyword=Test&page=1&limit=5').get_json()['data']
+        keyset = client.get('/api/award-books/search?keyword=Test&cursor=&limit=5').get_json()['data']
+        assert [b['title'] for b in paged['books']] == ['Test Book 3', 'Test Book 1', 'Test Book 2']
+        assert [b['id'] for b in paged['books']] == [b['id'] for b in keyset['books']]
+
     def test_pagination_default(self, client_with_award_data):
         """测试默认分页参数"""
         client = client_with_award_data
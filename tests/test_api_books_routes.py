@@ -1,7 +1,14 @@
 """API Books 路由测试"""
 
+import csv
 import json
-from unittest.mock import MagicMock
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from flask import has_app_context
+
+from app.routes.api import record_in_background, validate_category
+from app.routes.api.books import _csv_escape
 
 
 class TestGetBooks:
@@ -30,15 +37,96 @@ class TestGetBooks:
 
     def test_all_category(self, client, app):
         mock_service = MagicMock()
-        mock_service.get_books_by_category.return_value = []
+        mock_service.get_books_by_categories.side_effect = lambda ids: {cat_id: [] for cat_id in ids}
         mock_service.get_latest_cache_time.return_value = None
 
         with app.app_context():
             app.extensions['book_service'] = mock_service
             response = client.get('/api/books/all')
             assert response.status_code == 200
+            category_ids = tuple(app.config['CATEGORIES'])
+            mock_service.get_books_by_categories.assert_called_once_with(category_ids)
+            assert set(response.get_json()['data']['books']) == set(category_ids)
+            del app.extensions['book_service']
+
+    def test_result_cached_until_data_refresh(self, client, app):
+        mock_service = MagicMock()
+        mock_service.get_books_by_category.return_value = []
+        mock_service.get_latest_cache_time.return_value = '2024-01-01 00:00:00'
+
+        with app.app_context():
+            app.extensions['book_service'] = mock_service
+            client.get('/api/books/hardcover-fiction')
+            client.get('/api/books/hardcover-fiction')
+            assert mock_service.get_books_by_category.call_count == 1
+
+            mock_service.get_latest_cache_time.return_value = '2024-01-02 00:00:00'
+            response = client.get('/api/books/hardcover-fiction')
+            assert response.status_code == 200
+            assert response.get_json()['data']['latest_update'] == '2024-01-02 00:00:00'
+            assert mock_service.get_books_by_category.call_count == 2
+            del app.extensions['book_service']
+
+    def test_cache_hit_reuses_serialized_body(self, client, app):
+        mock_service = MagicMock()
+        mock_service.get_books_by_category.return_value = []
+        mock_service.get_latest_cache_time.return_value = '2024-01-03 00:00:00'
+
+        with app.app_context():
+            app.extensions['book_service'] = mock_service
+            first = client.get('/api/books/hardcover-fiction')
+            with patch('app.routes.api.APIResponse.success') as mock_success:
+                second = client.get('/api/books/hardcover-fiction')
+                mock_success.assert_not_called()
+            assert second.status_code == 200
+            assert second.get_data() == first.get_data()
+            del app.extensions['book_service']
+
+    def test_category_preference_saved_without_session_digest(self, client, app):
+        mock_service = MagicMock()
+        mock_service.get_books_by_category.return_value = []
+        mock_service.get_latest_cache_time.return_value = None
+
+        with app.app_context(), patch('app.routes.api.books.record_in_background') as mock_record:
+            app.extensions['book_service'] = mock_service
+            client.get('/api/books/hardcover-fiction')
+            client.get('/api/books/hardcover-nonfiction')
+            assert mock_record.call_count == 2
+            assert mock_record.call_args.args[2] == ('hardcover-nonfiction',)
             del app.extensions['book_service']
 
+        with client.session_transaction() as sess:
+            assert 'category_digest' not in sess
+
+
+class TestValidateCategory:
+    """测试分类校验"""
+
+    def test_valid_categories_cached_as_frozenset(self, app):
+        valid = app.extensions['valid_categories']
+        assert isinstance(valid, frozenset)
+        assert valid == set(app.config['CATEGORIES']) | {'all'}
+
+    def test_category_ids_snapshot_preserves_order(self, app):
+        assert app.extensions['category_ids'] == tuple(app.config['CATEGORIES'])
+
+    def test_invalid_path_values_rejected_before_view(self, client, app):
+        mock_service = MagicMock()
+        with app.app_context():
+            app.extensions['book_service'] = mock_service
+            for url in ('/api/books/nope', '/api/export/nope', '/api/book-details/123'):
+                response = client.get(url)
+                assert response.status_code == 400
+                assert response.get_json()['success'] is False
+            assert not mock_service.method_calls
+            del app.extensions['book_service']
+
+    def test_membership(self, app):
+        with app.app_context():
+            assert validate_category('all') is True
+            assert validate_category(next(iter(app.config['CATEGORIES']))) is True
+            assert validate_category('invalid-category') is False
+
 
 class TestSearchBooks:
     """测试 /api/search"""
@@ -82,6 +170,14 @@ class TestSearchHistory:
         response = client.get('/api/search/history?limit=10')
         assert response.status_code in (200, 500)
 
+    def test_new_visitor_gets_no_session_id(self, app):
+        """只读接口不为新访客生成会话ID"""
+        client = app.test_client()
+        response = client.get('/api/search/history')
+        assert response.get_json()['data'] == {'history': []}
+        with client.session_transaction() as sess:
+            assert 'session_id' not in sess
+
 
 class TestUserPreferences:
     """测试 /api/user/preferences"""
@@ -90,6 +186,13 @@ class TestUserPreferences:
         response = client.get('/api/user/preferences')
         assert response.status_code in (200, 500)
 
+    def test_get_preferences_new_visitor(self, app):
+        client = app.test_client()
+        response = client.get('/api/user/preferences')
+        assert response.get_json()['data'] == {'preferences': {}}
+        with client.session_transaction() as sess:
+            assert 'session_id' not in sess
+
     def test_post_preferences(self, client):
         response = client.post(
             '/api/user/preferences',
@@ -131,6 +234,61 @@ class TestExportCSV:
             assert 'text/csv' in response.headers.get('Content-Type', '')
             del app.extensions['book_service']
 
+    def test_export_streams_rows_with_bom(self, client, app):
+        book = MagicMock(
+            category_name='精装小说',
+            title='Book, One',
+            author='Author',
+            publisher='Pub',
+            rank=1,
+            rank_last_week='2',
+            weeks_on_list=3,
+            publication_dt='2024-01-01',
+            page_count='300',
+            language='en',
+            isbn13='9780000000001',
+            price='9.99',
+        )
+        mock_service = MagicMock()
+        mock_service.get_books_by_category.return_value = [book]
+
+        with app.app_context():
+            app.extensions['book_service'] = mock_service
+            response = client.get('/api/export/hardcover-fiction')
+            assert response.is_streamed
+            body = response.get_data()
+            assert body.startswith(b'\xef\xbb\xbf')
+            lines = body[3:].decode('utf-8').splitlines()
+            assert lines[0].startswith('分类,书名')
+            assert lines[1].startswith('精装小说,"Book, One",Author')
+            del app.extensions['book_service']
+
+    def test_export_all_loads_categories_lazily(self, client, app):
+        mock_service = MagicMock()
+        mock_service.get_books_by_category.return_value = []
+
+        with app.app_context():
+            app.extensions['book_service'] = mock_service
+            response = client.get('/api/export/all', buffered=False)
+            chunks = response.response
+            # 响应返回时尚未加载任何分类，首块只有表头
+            assert mock_service.get_books_by_category.call_count == 0
+            assert next(iter(chunks)).startswith(b'\xef\xbb\xbf')
+            response.get_data()
+            assert mock_service.get_books_by_category.call_count == len(app.config['CATEGORIES'])
+            response.close()
+            del app.extensions['book_service']
+
+
+class TestCsvEscape:
+    """测试 CSV 字段转义与 csv.writer 输出一致"""
+
+    def test_matches_csv_writer(self):
+        row = ['plain', 'Book, One', 'say "hi"', 'line\nbreak', 'cr\rhere', '', None, 12, '中文']
+        buf = StringIO()
+        csv.writer(buf).writerow(row)
+        assert ','.join(map(_csv_escape, row)) + '\r\n' == buf.getvalue()
+
 
 class TestBookDetails:
     """测试 /api/book-details/<isbn>"""
@@ -138,3 +296,27 @@ class TestBookDetails:
     def test_invalid_isbn(self, client):
         response = client.get('/api/book-details/invalid-isbn')
         assert response.status_code == 400
+
+
+class TestRecordInBackground:
+    """测试统计写入的后台提交"""
+
+    def test_runs_inline_when_testing(self, app):
+        func = MagicMock()
+        with app.test_request_context():
+            record_in_background(func, 'sid', ['hardcover-fiction'])
+        func.assert_called_once_with('sid', ['hardcover-fiction'])
+
+    def test_submits_task_with_app_context(self, app):
+        seen = []
+        app.config['TESTING'] = False
+        try:
+            with app.test_request_context():
+                with patch('app.routes.api.submit_background_task') as mock_submit:
+                    record_in_background(lambda *args: seen.append((args, has_app_context())), 'sid', 'kw', 3)
+            assert seen == []
+            task = mock_submit.call_args.args[0]
+            task()
+        finally:
+            app.config['TESTING'] = True
+        assert seen == [(('sid', 'kw', 3), True)]
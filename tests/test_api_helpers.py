@@ -7,9 +7,11 @@ from app.utils.api_helpers import (
     APIResponse,
     PublicAPIResponse,
     clean_translation_text,
+    escape_like,
     handle_api_errors,
     validate_isbn,
     validate_pagination,
+    validate_search_keyword,
 )
 from app.utils.exceptions import (
     APIRateLimitException,
@@ -37,11 +39,47 @@ class TestValidateIsbn:
         assert validate_isbn('978-3-16-148410-0') is True
         assert validate_isbn('0-306-40615-2') is True
 
+    def test_isbn_with_whitespace(self):
+        assert validate_isbn(' 978 3 16 148410 0\n') is True
+        assert validate_isbn('0306406152\u3000') is True
+        assert validate_isbn('0306\t40615X') is True
+
     def test_invalid_format(self):
         assert validate_isbn('123456789') is False  # too short
         assert validate_isbn('abcdefghij') is False  # letters
         assert validate_isbn('12345678901234') is False  # too long
 
+    def test_repeated_calls_hit_cache(self):
+        validate_isbn.cache_clear()
+        assert validate_isbn('9783161484100') is True
+        assert validate_isbn('9783161484100') is True
+        assert validate_isbn.cache_info().hits == 1
+
+
+class TestValidateSearchKeyword:
+    def test_ascii_keywords(self):
+        assert validate_search_keyword('harry potter') is True
+        assert validate_search_keyword('self-help_2024') is True
+        assert validate_search_keyword('c++') is False
+        assert validate_search_keyword('a;b') is False
+
+    def test_unicode_keywords(self):
+        assert validate_search_keyword('三体 问题') is True
+        assert validate_search_keyword('café') is True
+        assert validate_search_keyword('三体!') is False
+
+    def test_ascii_fast_path_matches_unicode_whitespace(self):
+        # Unicode 模式下 \x1c-\x1f 属于 \s，ASCII 快速路径须保持一致
+        assert validate_search_keyword('ab\x1fcd') is True
+        assert validate_search_keyword('ab\tcd\n') is True
+
+
+class TestEscapeLike:
+    def test_escapes_wildcards_and_backslash(self):
+        assert escape_like('100%_done') == r'100\%\_done'
+        assert escape_like('a\\b') == r'a\\b'
+        assert escape_like('plain') == 'plain'
+
 
 class TestValidatePagination:
     def test_defaults(self):
@@ -66,6 +104,12 @@ class TestValidatePagination:
         page, limit = validate_pagination(1, 200, max_limit=100)
         assert limit == 100
 
+    def test_repeated_calls_hit_cache(self):
+        validate_pagination.cache_clear()
+        assert validate_pagination(2, 30) == (2, 30)
+        assert validate_pagination(2, 30) == (2, 30)
+        assert validate_pagination.cache_info().hits == 1
+
 
 class TestAPIResponse:
     @pytest.fixture
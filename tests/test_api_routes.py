@@ -4,6 +4,8 @@ API路由测试
 测试API路由的核心功能，包括健康检查、获取图书列表、搜索图书、翻译功能等
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from app import create_app
@@ -340,3 +342,104 @@ class TestApiRoutes:
         assert response.status_code == 200
         data = response.get_json()
         assert data['success'] is True
+
+
+class TestCachedSuccessResponses:
+    """热门类端点序列化结果缓存测试"""
+
+    _POPULAR = {'searches': [{'keyword': 'dune', 'count': 3, 'last_searched': None}], 'total': 1}
+
+    def test_popular_searches_served_from_cache(self, client):
+        """第二次请求直接返回缓存字节，不再调用服务"""
+        with patch(
+            'app.services.smart_search_service.SmartSearchService.get_popular_searches', return_value=self._POPULAR
+        ) as mock_popular:
+            first = client.get('/api/search/popular?limit=5')
+            second = client.get('/api/search/popular?limit=5')
+
+        assert mock_popular.call_count == 1
+        assert second.status_code == 200
+        assert second.mimetype == 'application/json'
+        assert second.get_data() == first.get_data()
+        assert second.get_json()['data'] == self._POPULAR
+
+    def test_cache_key_includes_limit(self, client):
+        """不同 limit 分别缓存"""
+        with patch(
+            'app.services.smart_search_service.SmartSearchService.get_popular_searches', return_value=self._POPULAR
+        ) as mock_popular:
+            client.get('/api/search/popular?limit=5')
+            client.get('/api/search/popular?limit=6')
+
+        assert mock_popular.call_count == 2
+
+    def test_error_result_not_cached(self, client):
+        """降级结果不写缓存"""
+        degraded = {'searches': [], 'total': 0, 'error': 'db down'}
+        with patch(
+            'app.services.smart_search_service.SmartSearchService.get_popular_searches', return_value=degraded
+        ) as mock_popular:
+            client.get('/api/search/popular')
+            client.get('/api/search/popular')
+
+        assert mock_popular.call_count == 2
+
+    def test_popular_recommendations_cached(self, client):
+        """热门推荐策略按 limit 缓存"""
+        result = {'recommendations': [], 'total': 0, 'strategy': 'popular'}
+        with patch(
+            'app.services.recommendation_service.RecommendationService._get_popular_recommendations',
+            return_value=result,
+        ) as mock_popular:
+            client.get('/api/recommendations?strategy=popular&limit=4')
+            response = client.get('/api/recommendations?strategy=popular&limit=4')
+
+        assert mock_popular.call_count == 1
+        assert response.get_json()['data'] == result
+
+
+class TestSmartSearchHistory:
+    """智能搜索历史写入测试"""
+
+    def test_history_recorded_off_request_path(self, client):
+        """搜索历史交给 record_in_background，而非在请求内同步写入"""
+        with patch('app.routes.api.recommendations.record_in_background') as mock_record:
+            response = client.get('/api/search/smart?keyword=dune')
+
+        assert response.status_code == 200
+        func, _session_id, keyword, total = mock_record.call_args.args
+        assert func.__name__ == 'save_search_history'
+        assert (keyword, total) == ('dune', 0)
+
+    def test_no_history_without_keyword(self, client):
+        with patch('app.routes.api.recommendations.record_in_background') as mock_record:
+            client.get('/api/search/smart')
+        mock_record.assert_not_called()
+
+
+class TestRecommendationStrategies:
+    """推荐策略分发测试"""
+
+    _SERVICE = 'app.services.recommendation_service.RecommendationService'
+
+    @pytest.mark.parametrize(
+        ('strategy', 'method'),
+        [
+            ('personalized', 'get_personalized_recommendations'),
+            ('smart', 'get_smart_recommendations'),
+            ('bogus', 'get_personalized_recommendations'),
+        ],
+    )
+    def test_dispatches_session_strategies(self, client, strategy, method):
+        with patch(f'{self._SERVICE}.{method}', return_value={'recommendations': []}) as mock_method:
+            response = client.get(f'/api/recommendations?strategy={strategy}&limit=3')
+
+        assert response.status_code == 200
+        session_id, limit = mock_method.call_args.args
+        assert session_id and limit == 3
+
+    def test_similarity_reads_request_args(self, client):
+        with patch(f'{self._SERVICE}.get_similarity_recommendations', return_value={}) as mock_method:
+            client.get('/api/recommendations?strategy=similarity&book_id=7&category=fiction')
+
+        mock_method.assert_called_once_with(book_id=7, isbn=None, award_id=None, category='fiction', limit=10)
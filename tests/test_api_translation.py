@@ -41,7 +41,7 @@ def _stub_translation_service(monkeypatch):
             return {'total': 0, 'hits': 0, 'misses': 0}
 
     monkeypatch.setattr(
-        'app.services.zhipu_translation_service.get_translation_service',
+        'app.routes.api.translation.get_translation_service',
         lambda: FakeTranslator(),
     )
 
@@ -67,6 +67,20 @@ class TestTranslationAPI:
         response = client.post('/api/translate', json={'text': 'x' * 10001}, headers={'X-CSRF-Token': csrf_token})
         assert response.status_code == 400
 
+    def test_translate_whitespace_text(self, client, csrf_token):
+        """测试仅含空白的文本按缺少文本处理"""
+        response = client.post('/api/translate', json={'text': '   '}, headers={'X-CSRF-Token': csrf_token})
+        assert response.status_code == 400
+        assert '缺少要翻译的文本' in response.get_json()['message']
+
+    def test_translate_invalid_lang(self, client, csrf_token):
+        """测试非法语言代码"""
+        response = client.post(
+            '/api/translate', json={'text': 'Hello', 'source_lang': 'english'}, headers={'X-CSRF-Token': csrf_token}
+        )
+        assert response.status_code == 400
+        assert response.get_json()['message'] == '请求参数无效'
+
     def test_translate_book_fields_empty(self, client, csrf_token):
         """测试翻译图书字段时请求体为空"""
         response = client.post('/api/translate/book-fields', json={}, headers={'X-CSRF-Token': csrf_token})
@@ -94,6 +108,29 @@ class TestTranslationAPI:
             data = response.get_json()
             assert data['success'] is True
 
+    def test_translate_cache_recent_truncates_long_text(self, app, db, client):
+        """长原文只返回前 100 个字符并补省略号"""
+        from app.models.schemas import TranslationCache
+
+        with app.app_context():
+            db.session.add(
+                TranslationCache(
+                    source_hash='h' * 64,
+                    source_text='a' * 300,
+                    source_lang='en',
+                    target_lang='zh',
+                    translated_text='译文',
+                )
+            )
+            db.session.commit()
+
+        response = client.get('/api/translate/cache/recent?limit=5', headers=ADMIN_HEADERS)
+        assert response.status_code in (200, 429)
+        if response.status_code == 200:
+            record = response.get_json()['data']['records'][0]
+            assert record['source_text'] == 'a' * 100 + '...'
+            assert record['translated_text'] == '译文'
+
 
 @pytest.mark.usefixtures('db')
 class TestTranslateAwardBookDisplayTitle:
@@ -147,7 +184,7 @@ class TestTranslateAwardBookDisplayTitle:
 
         monkeypatch.setattr(service_helpers, 'get_book_service', _fake_book_service)
         monkeypatch.setattr(
-            'app.services.zhipu_translation_service.get_translation_service',
+            'app.routes.api.translation.get_translation_service',
             lambda: CapturingTranslator(),
         )
 
@@ -203,7 +240,7 @@ class TestTranslateAwardBookDisplayTitle:
 
         monkeypatch.setattr(service_helpers, 'get_book_service', lambda: None)
         monkeypatch.setattr(
-            'app.services.zhipu_translation_service.get_translation_service',
+            'app.routes.api.translation.get_translation_service',
             lambda: CapturingTranslator(),
         )
 
@@ -235,7 +272,7 @@ class TestCSRFProtection:
                 return '你好'
 
         monkeypatch.setattr(
-            'app.services.zhipu_translation_service.get_translation_service',
+            'app.routes.api.translation.get_translation_service',
             lambda: FakeTranslationService(),
         )
 
@@ -154,6 +154,24 @@ class TestSecurityHeaders:
         assert "script-src 'self' 'nonce-" in csp
         assert "style-src 'self' 'nonce-" in csp
 
+    def test_static_files_cached_and_conditional(self, client):
+        response = client.get('/static/robots.txt')
+        assert response.status_code == 200
+        assert response.headers['Cache-Control'] == 'public, max-age=2592000, immutable'
+        assert response.headers.get('Expires')
+        etag = response.headers['ETag']
+        response.close()
+
+        revalidated = client.get('/static/robots.txt', headers={'If-None-Match': etag})
+        assert revalidated.status_code == 304
+        assert revalidated.get_data() == b''
+
+    def test_favicon_has_max_age(self, client):
+        response = client.get('/favicon.ico')
+        assert response.status_code == 200
+        assert 'max-age=2592000' in response.headers['Cache-Control']
+        response.close()
+
 
 class TestGetLocale:
     """测试语言选择器"""
@@ -41,6 +41,15 @@ def sample_award_book(app, db, sample_award):
         return book.id
 
 
+class TestExternalClients:
+    def test_clients_created_on_first_access(self):
+        with patch('app.services.award_book_service.WikidataClient') as mock_wikidata:
+            service = AwardBookService()
+            mock_wikidata.assert_not_called()
+            assert service.wikidata_client is service.wikidata_client
+            mock_wikidata.assert_called_once_with(timeout=30)
+
+
 class TestShouldRefresh:
     """测试 should_refresh"""
 
@@ -134,6 +143,27 @@ class TestGetAwardByName:
 class TestGetAwardBooks:
     """测试 get_award_books"""
 
+    def test_unfiltered_award_loaded_by_select_in(self, app, db, award_service, sample_award_book, capture_statements):
+        with app.app_context():
+            with capture_statements() as statements:
+                books, _total = award_service.get_award_books()
+            assert len(statements) == 2
+            assert 'JOIN' not in statements[0]
+            assert ' IN (' in statements[1]
+            with capture_statements() as later:
+                assert books[0].award.name
+            assert later == []
+
+    def test_single_award_loaded_by_join(
+        self, app, db, award_service, sample_award, sample_award_book, capture_statements
+    ):
+        with app.app_context():
+            with capture_statements() as statements:
+                books, _total = award_service.get_award_books(award_id=sample_award)
+            assert len(statements) == 1
+            assert 'JOIN' in statements[0]
+            assert books[0].award.name == '星云奖'
+
     def test_with_data(self, app, db, award_service, sample_award_book):
         with app.app_context():
             _books, total = award_service.get_award_books()
@@ -164,6 +194,42 @@ class TestGetAwardBooks:
             _books, total = award_service.get_award_books(page=1, limit=5)
             assert total >= 1
 
+    def test_award_eager_loaded(self, app, db, award_service, sample_award_book):
+        from sqlalchemy import inspect
+
+        with app.app_context():
+            books, _total = award_service.get_award_books()
+            assert books
+            assert 'award' not in inspect(books[0]).unloaded
+
+
+class TestGetAwardBooksAfter:
+    """测试 get_award_books_after 游标分页"""
+
+    def test_walks_all_pages_in_year_id_order(self, app, db, award_service, sample_award):
+        from app.models.schemas import AwardBook
+
+        with app.app_context():
+            db.session.add_all(
+                [AwardBook(award_id=sample_award, title=f'Book {i}', author='A', year=2020 + i % 3) for i in range(5)]
+            )
+            db.session.commit()
+
+            seen, cursor = [], None
+            while True:
+                books, cursor = award_service.get_award_books_after(cursor=cursor, limit=2)
+                seen.extend((b.year, b.id) for b in books)
+                if cursor is None:
+                    break
+            assert len(seen) == 5
+            assert seen == sorted(seen, reverse=True)
+
+    def test_filters_apply(self, app, db, award_service, sample_award_book):
+        with app.app_context():
+            books, cursor = award_service.get_award_books_after(year=1999)
+            assert books == []
+            assert cursor is None
+
 
 class TestGetAwardBookById:
     """测试 get_award_book_by_id"""
@@ -178,6 +244,17 @@ class TestGetAwardBookById:
             book = award_service.get_award_book_by_id(99999)
             assert book is None
 
+    def test_with_award_joins_in_one_query(self, app, db, award_service, sample_award_book, capture_statements):
+        with app.app_context():
+            db.session.expunge_all()
+            with capture_statements() as statements:
+                book = award_service.get_award_book_by_id(sample_award_book, with_award=True)
+            assert len(statements) == 1
+            assert 'JOIN awards' in statements[0]
+            with capture_statements() as later:
+                assert book.award.name == '星云奖'
+            assert later == []
+
 
 class TestSearchAwardBooks:
     """测试 search_award_books"""
@@ -192,6 +269,103 @@ class TestSearchAwardBooks:
             _books, total = award_service.search_award_books('ZZZZNONEXISTENT')
             assert total == 0
 
+    def test_keyword_matches_substring_case_insensitive(self, app, db, award_service, sample_award):
+        with app.app_context():
+            db.session.add_all(
+                [
+                    AwardBook(award_id=sample_award, title='The Three-Body Problem', author='Liu Cixin', year=2015),
+                    AwardBook(award_id=sample_award, title='Other Book', author='Someone', title_zh='三体', year=2015),
+                    AwardBook(award_id=sample_award, title='100 Percent', author='Writer', year=2016),
+                ]
+            )
+            db.session.commit()
+
+            # 词中子串（非词首前缀）同样命中
+            books, total = award_service.search_award_books('ODY')
+            assert total == 1
+            assert books[0].title == 'The Three-Body Problem'
+            # 中文标题子串
+            books, _total = award_service.search_award_books('三')
+            assert [book.title for book in books] == ['Other Book']
+            # LIKE 通配符按字面匹配
+            _books, total = award_service.search_award_books('100%')
+            assert total == 0
+
+    def test_search_agrees_with_keyword_filter(self, app, db, award_service, sample_award):
+        with app.app_context():
+            db.session.add_all(
+                [
+                    AwardBook(award_id=sample_award, title='Network Effect', author='Martha Wells', year=2021),
+                    AwardBook(award_id=sample_award, title='Artificial Condition', author='Martha Wells', year=2019),
+                    AwardBook(award_id=sample_award, title='Piranesi', author='Susanna Clarke', year=2021),
+                ]
+            )
+            db.session.commit()
+
+            for keyword in ('work', 'WELLS', 'tion', 'anna'):
+                searched, _total = award_service.search_award_books(keyword)
+                filtered, _total = award_service.get_award_books(keyword=keyword)
+                assert {book.id for book in searched} == {book.id for book in filtered}
+
+    def test_does_not_join_award_relationship(self, app, db, award_service, sample_award_book):
+        from sqlalchemy import inspect
+
+        with app.app_context():
+            db.session.expunge_all()
+            books, _total = award_service.search_award_books('Network')
+            assert books
+            assert all('award' in inspect(book).unloaded for book in books)
+
+    def test_partial_page_skips_count(self, app, db, award_service, sample_award_book):
+        with app.app_context(), patch('sqlalchemy.orm.Query.count') as mock_count:
+            books, total = award_service.search_award_books('Network')
+            assert total == len(books) >= 1
+            mock_count.assert_not_called()
+
+    def test_full_page_count_is_cached(self, app, db, award_service, sample_award):
+        with app.app_context():
+            for i in range(3):
+                db.session.add(AwardBook(award_id=sample_award, year=2020 + i, title=f'Cached {i}', author='Author'))
+            db.session.commit()
+
+            _books, total = award_service.search_award_books('Cached', page=1, limit=2)
+            assert total == 3
+            with patch('sqlalchemy.orm.Query.count') as mock_count:
+                books, total = award_service.search_award_books('Cached', page=2, limit=2)
+                assert len(books) == 1
+                assert total == 3
+                _books, total = award_service.search_award_books('Cached', page=3, limit=2)
+                assert total == 3
+                mock_count.assert_not_called()
+
+    def test_count_comes_from_window_function(self, app, db, award_service, sample_award):
+        with app.app_context():
+            for i in range(5):
+                db.session.add(AwardBook(award_id=sample_award, year=2020 + i, title=f'Window {i}', author='Author'))
+            db.session.commit()
+
+            with patch('sqlalchemy.orm.Query.count') as mock_count:
+                books, total = award_service.search_award_books('Window', page=1, limit=2)
+                assert [b.title for b in books] == ['Window 4', 'Window 3']
+                assert total == 5
+                books, total = award_service.get_award_books(award_id=sample_award, page=2, limit=2)
+                assert len(books) == 2
+                assert total == 5
+                mock_count.assert_not_called()
+
+            # 页码越界时回退单独统计
+            assert award_service.get_award_books(award_id=sample_award, page=9, limit=2) == ([], 5)
+
+    def test_like_wildcards_match_literally(self, app, db, award_service, sample_award):
+        with app.app_context():
+            for title in ('100% Book', '100 Book', 'a_b', 'axb', 'c\\d'):
+                db.session.add(AwardBook(award_id=sample_award, year=2024, title=title, author='Author'))
+            db.session.commit()
+
+            assert [b.title for b in award_service.search_award_books('100%')[0]] == ['100% Book']
+            assert [b.title for b in award_service.search_award_books('a_b')[0]] == ['a_b']
+            assert [b.title for b in award_service.search_award_books('c\\d')[0]] == ['c\\d']
+
 
 class TestGetDistinctYears:
     """测试 get_distinct_years"""
@@ -235,6 +409,27 @@ class TestGetDistinctCategories:
             assert None not in categories
 
 
+class TestGetDistinctYearsAndCategories:
+    """测试 get_distinct_years_and_categories"""
+
+    def test_matches_separate_queries(self, app, db, award_service, sample_award, sample_award_book):
+        with app.app_context():
+            db.session.add_all(
+                [
+                    AwardBook(award_id=sample_award, title='A', author='X', year=2022, category='最佳中篇小说'),
+                    AwardBook(award_id=sample_award, title='B', author='Y', year=2023),
+                ]
+            )
+            db.session.commit()
+            years, categories = award_service.get_distinct_years_and_categories()
+            assert years == award_service.get_distinct_years() == [2024, 2023, 2022]
+            assert categories == award_service.get_distinct_categories() == ['最佳中篇小说', '最佳长篇小说']
+
+    def test_filter_by_award(self, app, db, award_service, sample_award_book):
+        with app.app_context():
+            assert award_service.get_distinct_years_and_categories(award_id=99999) == ([], [])
+
+
 class TestGetBookCountsByAward:
     """测试 get_book_counts_by_award"""
 
@@ -248,6 +443,71 @@ class TestGetBookCountsByAward:
             counts = award_service.get_book_counts_by_award(displayable_only=True)
             assert sample_award in counts
 
+    def test_single_grouped_query_for_all_awards(self, app, db, award_service, sample_award, capture_statements):
+        from app.models.schemas import Award, AwardBook
+
+        with app.app_context():
+            other = Award(name='雨果奖', name_en='Hugo Award')
+            db.session.add(other)
+            db.session.flush()
+            db.session.add_all(
+                [
+                    AwardBook(award_id=sample_award, title='A', author='X', year=2024, is_displayable=True),
+                    AwardBook(award_id=sample_award, title='B', author='Y', year=2024, is_displayable=False),
+                    AwardBook(award_id=other.id, title='C', author='Z', year=2024, is_displayable=True),
+                ]
+            )
+            db.session.commit()
+
+            with capture_statements() as statements:
+                counts = award_service.get_book_counts_by_award()
+                displayable = award_service.get_book_counts_by_award(displayable_only=True)
+
+            assert len(statements) == 2
+            assert all('GROUP BY' in s for s in statements)
+            assert counts[sample_award] == 2 and counts[other.id] == 1
+            assert displayable[sample_award] == 1 and displayable[other.id] == 1
+
+
+class TestGetAwardBookRows:
+    """测试 get_award_book_rows"""
+
+    def test_rows_are_plain_dicts_with_award_name(self, app, db, award_service, sample_award, sample_award_book):
+        with app.app_context():
+            rows, total = award_service.get_award_book_rows(award_id=sample_award, limit=100)
+            assert total == len(rows)
+            row = next(row for row in rows if row['id'] == sample_award_book)
+            assert type(row) is dict
+            assert row['award_name'] == '星云奖'
+            assert row['title'] == 'Network Effect'
+
+    def test_matches_get_award_books(self, app, db, award_service, sample_award, sample_award_book):
+        with app.app_context():
+            books, total = award_service.get_award_books(keyword='wells', year=2024, page=1, limit=5)
+            rows, row_total = award_service.get_award_book_rows(keyword='wells', year=2024, page=1, limit=5)
+            assert row_total == total == 1
+            assert [row['id'] for row in rows] == [book.id for book in books]
+
+    def test_keyword_filtered_in_sql(self, app, db, award_service, sample_award, sample_award_book, capture_statements):
+        with app.app_context():
+            db.session.add(
+                AwardBook(award_id=sample_award, year=2024, title='Other', author='Someone', is_displayable=True)
+            )
+            db.session.commit()
+            with capture_statements() as statements:
+                rows, total = award_service.get_award_book_rows(keyword='WELLS', include_displayable_only=True)
+            assert [row['title'] for row in rows] == ['Network Effect']
+            assert total == 1
+            assert len(statements) == 1
+            assert 'LIKE' in statements[0].upper()
+
+    def test_page_out_of_range_keeps_total(self, app, db, award_service, sample_award, sample_award_book):
+        with app.app_context():
+            _, expected_total = award_service.get_award_book_rows(page=1, limit=10)
+            rows, total = award_service.get_award_book_rows(page=1000, limit=10)
+            assert rows == []
+            assert total == expected_total
+
 
 class TestFindAwardBookByISBN:
     """测试 find_award_book_by_isbn"""
@@ -328,10 +328,10 @@ class TestProcessAwardBooks:
     """测试 _process_award_books"""
 
     @patch('app.services.award_book_service.time.sleep')
-    def test_process_award_books_uses_bulk_lookup(self, mock_sleep, app, db, award_service, sample_award):
+    def test_process_award_books_uses_bulk_lookup(
+        self, mock_sleep, app, db, award_service, sample_award, capture_statements
+    ):
         """测试 _process_award_books 对 N 本新获奖图书只发起一次 AwardBook 存在性查询"""
-        from sqlalchemy import event
-
         with app.app_context():
             award = db.session.get(Award, sample_award)
             # 预先插入 3 本已存在的图书，让批量加载有数据可查询
@@ -362,18 +362,9 @@ class TestProcessAwardBooks:
                 for i in range(1, 6)
             ]
 
-            select_count = 0
-
-            def _count_selects(conn, cursor, statement, parameters, context, executemany):
-                nonlocal select_count
-                if statement.lstrip().upper().startswith('SELECT'):
-                    select_count += 1
-
-            event.listen(db.engine, 'before_cursor_execute', _count_selects)
-            try:
+            with capture_statements() as statements:
                 result = award_service._process_award_books('nebula', books_data)
-            finally:
-                event.remove(db.engine, 'before_cursor_execute', _count_selects)
+            select_count = sum(1 for s in statements if s.lstrip().upper().startswith('SELECT'))
 
             assert result['new'] == 5
             # 关键断言：5 本新书中未出现每本一次 AwardBook 单条查询（旧逻辑约 1+5=6 次 SELECT）
@@ -672,7 +663,7 @@ class TestQueryMethodsExceptionPaths:
     def test_get_award_books_db_error(self, app, db, award_service):
         with app.app_context(), patch.object(AwardBook, 'query') as mock_query:
             mock_query.filter_by.return_value.filter_by.return_value = mock_query
-            mock_query.count.side_effect = Exception('DB错误')
+            mock_query.options.side_effect = Exception('DB错误')
             result = award_service.get_award_books()
             assert result == ([], 0)
 
@@ -684,7 +675,7 @@ class TestQueryMethodsExceptionPaths:
 
     def test_search_award_books_db_error(self, app, db, award_service):
         with app.app_context(), patch.object(AwardBook, 'query') as mock_query:
-            mock_query.filter.return_value.count.side_effect = Exception('DB错误')
+            mock_query.filter.side_effect = Exception('DB错误')
             result = award_service.search_award_books('test')
             assert result == ([], 0)
 
@@ -417,6 +417,49 @@ class TestBookService:
         assert metadata.description_zh == '测试描述'
         assert metadata.details_zh == '测试详情'
 
+    def test_get_books_by_categories_fetches_each_category(self, book_service):
+        category_ids = ['hardcover-fiction', 'hardcover-nonfiction', 'trade-fiction-paperback']
+        with patch.object(book_service, '_fetch_category_books', side_effect=lambda cat_id: [cat_id]) as mock_get:
+            result = book_service.get_books_by_categories(category_ids)
+
+        assert list(result.keys()) == category_ids
+        assert result == {cat_id: [cat_id] for cat_id in category_ids}
+        assert mock_get.call_count == 3
+
+    def test_get_books_by_categories_reads_warm_cache_inline(self, book_service):
+        cached = [
+            book.to_dict() for book in book_service.get_books_by_category('hardcover-fiction', auto_translate=False)
+        ]
+        book_service._cache.get.side_effect = lambda key: cached if key == 'books_hardcover-fiction' else None
+        with (
+            patch.object(book_service._category_executor, 'submit') as mock_submit,
+            patch.object(book_service, '_fetch_category_books', return_value=[]) as mock_get,
+        ):
+            result = book_service.get_books_by_categories(['hardcover-fiction', 'hardcover-nonfiction'])
+
+        assert list(result) == ['hardcover-fiction', 'hardcover-nonfiction']
+        assert [book.title for book in result['hardcover-fiction']] == ['Test Book Title']
+        assert result['hardcover-nonfiction'] == []
+        # 仅剩一个未命中分类，直接在当前线程获取，不经线程池
+        mock_get.assert_called_once_with('hardcover-nonfiction')
+        mock_submit.assert_not_called()
+
+    def test_get_books_by_categories_reads_cache_once_per_category(self, book_service):
+        book_service._cache.get.return_value = None
+        book_service._cache.get.reset_mock()
+        with patch.object(book_service, '_fetch_category_books', return_value=[]):
+            book_service.get_books_by_categories(['hardcover-fiction', 'hardcover-nonfiction'])
+
+        assert [c.args[0] for c in book_service._cache.get.call_args_list] == [
+            'books_hardcover-fiction',
+            'books_hardcover-nonfiction',
+        ]
+
+    def test_get_books_by_categories_propagates_errors(self, book_service):
+        with patch.object(book_service, '_fetch_category_books', side_effect=APIException('boom')):
+            with pytest.raises(APIException):
+                book_service.get_books_by_categories(['hardcover-fiction', 'hardcover-nonfiction'])
+
     def test_save_book_translation_invalid_isbn(self, book_service):
         """测试保存图书翻译时ISBN无效的情况"""
         # 执行测试
@@ -476,10 +519,8 @@ class TestBookService:
         # 验证结果
         assert cache_time == '暂无数据'
 
-    def test_save_book_metadata_batch_uses_single_select(self, book_service, db, app):
+    def test_save_book_metadata_batch_uses_single_select(self, book_service, db, app, capture_statements):
         """测试批量保存元数据只发起一次 SELECT 查询（避免 N+1）"""
-        from sqlalchemy import event
-
         books = [
             Book(
                 id='9780000001001',
@@ -507,27 +548,15 @@ class TestBookService:
             for i in range(1, 6)
         ]
 
-        select_count = 0
-
-        def _count_selects(conn, cursor, statement, parameters, context, executemany):
-            nonlocal select_count
-            if statement.lstrip().upper().startswith('SELECT'):
-                select_count += 1
-
-        with app.app_context():
-            event.listen(db.engine, 'before_cursor_execute', _count_selects)
-            try:
-                saved = book_service.save_book_metadata_batch(books)
-            finally:
-                event.remove(db.engine, 'before_cursor_execute', _count_selects)
+        with app.app_context(), capture_statements() as statements:
+            saved = book_service.save_book_metadata_batch(books)
+        select_count = sum(1 for s in statements if s.lstrip().upper().startswith('SELECT'))
 
         assert saved == 5
         assert select_count == 1  # 一次 IN 查询
 
-    def test_save_book_metadata_loop_uses_multiple_selects(self, book_service, db, app):
+    def test_save_book_metadata_loop_uses_multiple_selects(self, book_service, db, app, capture_statements):
         """测试逐条保存元数据会产生多次 SELECT 查询（对照组，说明 N+1）"""
-        from sqlalchemy import event
-
         books = [
             Book(
                 id='9780000002001',
@@ -555,20 +584,10 @@ class TestBookService:
             for i in range(1, 6)
         ]
 
-        select_count = 0
-
-        def _count_selects(conn, cursor, statement, parameters, context, executemany):
-            nonlocal select_count
-            if statement.lstrip().upper().startswith('SELECT'):
-                select_count += 1
-
-        with app.app_context():
-            event.listen(db.engine, 'before_cursor_execute', _count_selects)
-            try:
-                for book in books:
-                    book_service.save_book_metadata(book)
-            finally:
-                event.remove(db.engine, 'before_cursor_execute', _count_selects)
+        with app.app_context(), capture_statements() as statements:
+            for book in books:
+                book_service.save_book_metadata(book)
+        select_count = sum(1 for s in statements if s.lstrip().upper().startswith('SELECT'))
 
         assert select_count == 5  # 每本书一次 SELECT
 
@@ -99,12 +99,14 @@ class TestAddFavorite:
         assert '收藏中' in data2['message']
 
     def test_no_session(self, client, db, csrf_token):
+        # 签发 CSRF 令牌会建立会话，需在取得令牌后再清空
+        token = csrf_token()
         _set_session(client, None)
         response = client.post(
             '/api/favorites',
             data=json.dumps({'isbn': '9780063021426'}),
             content_type='application/json',
-            headers={'X-CSRF-Token': csrf_token()},
+            headers={'X-CSRF-Token': token},
         )
         data = json.loads(response.data)
         assert data['success'] is False
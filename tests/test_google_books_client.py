@@ -106,6 +106,16 @@ class TestFetchBookDetails:
         result = client_no_key.fetch_book_details('9780743273565')
         assert result == {'title': 'Cached Book'}
 
+    def test_cache_hit_skips_key_validation(self, client_with_key):
+        mock_cache_service = MagicMock()
+        mock_cache_service.get.return_value = {}
+        client_with_key._api_cache = mock_cache_service
+
+        # 负缓存（未收录）同样命中，且不发起 Key 验证请求
+        assert client_with_key.fetch_book_details('9780000000000') == {}
+        client_with_key._session.get.assert_not_called()
+        assert client_with_key._key_validated is False
+
     def test_api_success(self, client_no_key):
         mock_cache_service = MagicMock()
         mock_cache_service.get.return_value = None
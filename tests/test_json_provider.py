@@ -0,0 +1,78 @@
+"""ORJSONProvider 测试"""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+
+from flask import jsonify, request
+
+from app.utils.json_provider import ORJSONProvider
+
+
+class TestORJSONProvider:
+    def test_app_uses_orjson_provider(self, app):
+        assert isinstance(app.json, ORJSONProvider)
+
+    def test_dumps_matches_default_formats(self, app):
+        dt = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+        result = app.json.loads(app.json.dumps({'when': dt, 'price': Decimal('9.99'), 1: '一'}))
+        assert result == {'when': 'Tue, 02 Jan 2024 03:04:05 GMT', 'price': '9.99', '1': '一'}
+
+    def test_jsonify_response(self, app):
+        with app.test_request_context():
+            response = jsonify({'b': 1, 'a': '中文'})
+            assert response.mimetype == 'application/json'
+            assert response.get_json() == {'b': 1, 'a': '中文'}
+
+    def test_request_json_round_trip(self, app):
+        with app.test_request_context(data='{"k": [1, 2]}', content_type='application/json'):
+            assert request.get_json() == {'k': [1, 2]}
+        with app.test_request_context(data='{bad json', content_type='application/json'):
+            assert request.get_json(silent=True) is None
+
+    def test_jsonify_body_is_compact_utf8(self, app):
+        original = app.json.compact
+        app.json.compact = True
+        try:
+            with app.test_request_context():
+                response = jsonify({'data': {'title': '中文'}, 'success': True})
+                assert response.get_data() == '{"data":{"title":"中文"},"success":true}\n'.encode()
+        finally:
+            app.json.compact = original
+
+    def test_jsonify_indents_when_not_compact(self, app):
+        original = app.json.compact
+        app.json.compact = False
+        try:
+            with app.test_request_context():
+                assert b'\n  "a": 1' in jsonify({'a': 1}).get_data()
+        finally:
+            app.json.compact = original
+
+    def test_sort_keys_follows_config(self, app):
+        assert app.json.sort_keys is app.config['JSON_SORT_KEYS'] is False
+        with app.test_request_context():
+            assert list(jsonify({'b': 1, 'a': 2}).get_json()) == ['b', 'a']
+
+    def test_non_str_keys_fall_back(self, app):
+        assert app.json.dumps_bytes({2: 'x', 'k': {None: 1}}) == b'{"2":"x","k":{"null":1}}'
+
+    def test_api_response_serialized_by_orjson(self, app):
+        from unittest.mock import patch
+
+        from app.utils.api_helpers import APIResponse
+
+        with app.test_request_context(), patch.object(app.json, 'dumps_bytes', wraps=app.json.dumps_bytes) as spy:
+            response, status = APIResponse.success(data={'books': [{'title': '中文'}]})
+            error, error_status = APIResponse.error('bad', 400)
+        assert spy.call_count == 2
+        assert (status, error_status) == (200, 400)
+        assert response.get_json()['data'] == {'books': [{'title': '中文'}]}
+        assert error.get_json() == {'success': False, 'message': 'bad'}
+
+    def test_template_tojson_uses_orjson_and_stays_html_safe(self, app):
+        from flask import render_template_string
+
+        assert app.jinja_env.policies['json.dumps_function'] == app.json.dumps
+        with app.app_context():
+            rendered = render_template_string('{{ books|tojson }}', books=[{'title': '</script>三体'}])
+        assert rendered == '[{"title":"\\u003c/script\\u003e三体"}]'
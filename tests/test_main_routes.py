@@ -8,6 +8,8 @@ from app.services.book_detail_service import (
     update_book_from_google_books,
 )
 from app.utils.book_filters import (
+    BookSearchIndex,
+    build_search_keys,
     filter_books_by_publisher,
     filter_books_by_search,
     filter_books_by_weeks,
@@ -75,6 +77,34 @@ class TestFilterBooksBySearch:
         assert len(result) == 1
         assert result[0]['author'] == 'John Smith'
 
+    def test_missing_fields_and_no_cross_field_match(self):
+        books = [{'title': None, 'author': 'Ann'}, {'title': 'Dune'}, {'title': 'ab', 'author': 'cd'}]
+        assert filter_books_by_search(books, 'ann') == [books[0]]
+        assert filter_books_by_search(books, 'dune') == [books[1]]
+        assert filter_books_by_search(books, 'bc') == []
+
+    def test_precomputed_search_keys(self):
+        books = [{'title': 'Dune', 'author': 'Frank Herbert'}, {'title': 'Emma', 'author': 'Jane Austen'}]
+        assert build_search_keys(books) == ['dune\0frank herbert', 'emma\0jane austen']
+
+    def test_search_index_matches_linear_scan(self):
+        books = [
+            {'title': 'Dune', 'author': 'Frank Herbert'},
+            {'title': 'Emma', 'author': 'Jane Austen'},
+            {'title': 'Dune Messiah', 'author': 'Frank Herbert'},
+            {'title': None, 'author': None},
+        ]
+        index = BookSearchIndex(books)
+        assert len(index) == 4
+        for query in ('dune', 'HERBERT', 'e', 'an', 'ne mes', 'xyz', 'a\0j'):
+            assert filter_books_by_search(books, query, index) == filter_books_by_search(books, query)
+        assert filter_books_by_search(books, 'dune', index) == [books[0], books[2]]
+
+    def test_casefold_matching(self):
+        books = [{'title': 'Die Straße', 'author': 'Anna'}]
+        assert filter_books_by_search(books, 'STRASSE') == books
+        assert filter_books_by_search(books, 'straße') == books
+
     def test_case_insensitive(self):
         books = [{'title': 'PYTHON', 'author': 'Author'}]
         result = filter_books_by_search(books, 'python')
@@ -317,6 +347,15 @@ class TestMainRoutes:
         response = client.get('/?category=hardcover-fiction')
         assert response.status_code == 200
 
+    def test_resolve_category_falls_back_to_first(self, app):
+        from app.routes.main import _resolve_category
+
+        with app.app_context():
+            first = next(iter(app.config['CATEGORIES']))
+            assert _resolve_category('hardcover-fiction') == 'hardcover-fiction'
+            assert _resolve_category('nope') == first
+            assert _resolve_category(None) == first
+
     def test_index_with_search(self, client):
         response = client.get('/?search=python')
         assert response.status_code == 200
@@ -476,8 +515,8 @@ class TestMainRoutes:
         response = client.get('/new-books')
         assert response.status_code == 200
 
-    def test_awards_page(self, client):
-        response = client.get('/awards')
+    def test_awards_page(self, buffered_client):
+        response = buffered_client.get('/awards')
         assert response.status_code == 200
 
     def test_book_detail_invalid_index(self, client):
@@ -5,6 +5,7 @@ from io import BytesIO
 from unittest.mock import MagicMock, patch
 
 from app.models.book import Book
+from app.utils.book_filters import BookSearchIndex
 
 
 def _make_book(**overrides):
@@ -74,6 +75,47 @@ class TestCachedImage:
         response = client.get(f'/cache/images/{filename}')
         assert response.status_code == 404
 
+    def test_serves_existing_file(self, client, app, tmp_path):
+        filename = '0123456789abcdef' * 2 + '.jpg'
+        (tmp_path / filename).write_bytes(b'jpeg-bytes')
+        with patch.dict(app.config, {'IMAGE_CACHE_DIR': tmp_path}):
+            response = client.get(f'/cache/images/{filename}')
+        assert response.status_code == 200
+        assert response.get_data() == b'jpeg-bytes'
+        assert response.headers['Cache-Control'] == 'public, max-age=31536000, immutable'
+        assert response.headers.get('ETag')
+        response.close()
+
+    def test_accel_redirect_delegates_to_nginx(self, client, app):
+        filename = 'c' * 32 + '.jpg'
+        with patch.dict(app.config, {'IMAGE_ACCEL_REDIRECT_PREFIX': '/_protected_images/'}):
+            response = client.get(f'/cache/images/{filename}')
+        assert response.status_code == 200
+        assert response.headers['X-Accel-Redirect'] == f'/_protected_images/{filename}'
+        assert response.headers['Content-Type'] == 'image/jpeg'
+        assert 'immutable' in response.headers['Cache-Control']
+        assert response.get_data() == b''
+
+    def test_accel_redirect_still_validates_filename(self, client, app):
+        with patch.dict(app.config, {'IMAGE_ACCEL_REDIRECT_PREFIX': '/_protected_images'}):
+            response = client.get('/cache/images/abc.jpg')
+        assert response.status_code == 404
+        assert 'X-Accel-Redirect' not in response.headers
+
+    def test_is_cache_image_name(self):
+        from app.routes.main import _is_cache_image_name
+
+        assert _is_cache_image_name('f' * 32 + '.jpg') is True
+        assert _is_cache_image_name('F' * 32 + '.jpg') is False
+        assert _is_cache_image_name('g' * 32 + '.jpg') is False
+        assert _is_cache_image_name('a' * 31 + '.jpg\n') is False
+        # 32 位哈希 + 结尾换行：正则 `$` 会放行，这里必须拒绝
+        assert _is_cache_image_name('a' * 32 + '.jpg\n') is False
+        # bytes.fromhex 会接受的写法：字节间空白、大写十六进制
+        assert _is_cache_image_name('aa ' * 10 + 'aa.jpg') is False
+        assert _is_cache_image_name('AB' * 16 + '.jpg') is False
+        assert _is_cache_image_name('a' * 32 + '.png') is False
+
 
 class TestAwardBookCover:
     @patch('app.services.award_cover_sync_service.AwardCoverSyncService')
@@ -165,12 +207,12 @@ class TestAwardBookCover:
 
 
 class TestAwardsPage:
-    def test_awards_default_render(self, client):
-        response = client.get('/awards')
+    def test_awards_default_render(self, buffered_client):
+        response = buffered_client.get('/awards')
         assert response.status_code == 200
 
-    def test_awards_page_declares_utf8_and_preserves_chinese(self, client):
-        response = client.get('/awards?lang=zh')
+    def test_awards_page_declares_utf8_and_preserves_chinese(self, buffered_client):
+        response = buffered_client.get('/awards?lang=zh')
         html = response.get_data(as_text=True)
 
         assert response.status_code == 200
@@ -178,68 +220,88 @@ class TestAwardsPage:
         assert '<meta charset="UTF-8">' in html
         assert '获奖书单' in html
 
-    def test_awards_with_view_list(self, client):
-        response = client.get('/awards?view=list')
+    def test_awards_page_is_streamed(self, buffered_client):
+        response = buffered_client.get('/awards', buffered=False)
+        assert response.is_streamed
+        html = response.get_data(as_text=True)
+        response.close()
+
+        nonce = response.headers['Content-Security-Policy'].split("'nonce-", 1)[1].split("'", 1)[0]
+        assert f'nonce="{nonce}"' in html
+        assert html.rstrip().endswith('</html>')
+
+    def test_awards_stream_gzipped_incrementally(self, buffered_client):
+        import gzip
+
+        response = buffered_client.get('/awards?lang=zh', headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['Vary'] == 'Accept-Encoding'
+        html = gzip.decompress(response.get_data()).decode()
+        assert html.startswith('<!DOCTYPE html>')
+        assert '获奖书单' in html
+
+    def test_awards_with_view_list(self, buffered_client):
+        response = buffered_client.get('/awards?view=list')
         assert response.status_code == 200
 
-    def test_awards_with_invalid_view(self, client):
-        response = client.get('/awards?view=invalid')
+    def test_awards_with_invalid_view(self, buffered_client):
+        response = buffered_client.get('/awards?view=invalid')
         assert response.status_code == 200
 
-    def test_awards_with_valid_year(self, client):
-        response = client.get('/awards?year=2024')
+    def test_awards_with_valid_year(self, buffered_client):
+        response = buffered_client.get('/awards?year=2024')
         assert response.status_code == 200
 
-    def test_awards_with_year_too_old(self, client):
-        response = client.get('/awards?year=1800')
+    def test_awards_with_year_too_old(self, buffered_client):
+        response = buffered_client.get('/awards?year=1800')
         assert response.status_code == 200
 
-    def test_awards_with_year_too_future(self, client):
-        response = client.get('/awards?year=2200')
+    def test_awards_with_year_too_future(self, buffered_client):
+        response = buffered_client.get('/awards?year=2200')
         assert response.status_code == 200
 
-    def test_awards_with_invalid_year(self, client):
-        response = client.get('/awards?year=abc')
+    def test_awards_with_invalid_year(self, buffered_client):
+        response = buffered_client.get('/awards?year=abc')
         assert response.status_code == 200
 
-    def test_awards_with_search(self, client):
-        response = client.get('/awards?search=test')
+    def test_awards_with_search(self, buffered_client):
+        response = buffered_client.get('/awards?search=test')
         assert response.status_code == 200
 
     @patch('app.services.award_book_service.AwardBookService')
-    def test_awards_awards_list_exception(self, MockAwardService, client):
+    def test_awards_awards_list_exception(self, MockAwardService, buffered_client):
         mock_svc = MagicMock()
         mock_svc.get_all_awards.side_effect = Exception('DB error')
-        mock_svc.get_distinct_years.return_value = []
-        mock_svc.get_award_books.return_value = ([], 0)
+        mock_svc.get_distinct_years_and_categories.return_value = ([], [])
+        mock_svc.get_award_book_rows.return_value = ([], 0)
         mock_svc.get_book_counts_by_award.return_value = {}
         MockAwardService.return_value = mock_svc
-        response = client.get('/awards')
+        response = buffered_client.get('/awards')
         assert response.status_code == 200
 
     @patch('app.services.award_book_service.AwardBookService')
-    def test_awards_years_list_exception(self, MockAwardService, client):
+    def test_awards_years_list_exception(self, MockAwardService, buffered_client):
         mock_svc = MagicMock()
         mock_svc.get_all_awards.return_value = []
-        mock_svc.get_distinct_years.side_effect = Exception('DB error')
-        mock_svc.get_award_books.return_value = ([], 0)
+        mock_svc.get_distinct_years_and_categories.side_effect = Exception('DB error')
+        mock_svc.get_award_book_rows.return_value = ([], 0)
         mock_svc.get_book_counts_by_award.return_value = {}
         MockAwardService.return_value = mock_svc
-        response = client.get('/awards')
+        response = buffered_client.get('/awards')
         assert response.status_code == 200
 
     @patch('app.services.award_book_service.AwardBookService')
-    def test_awards_books_load_exception(self, MockAwardService, client):
+    def test_awards_books_load_exception(self, MockAwardService, buffered_client):
         mock_svc = MagicMock()
         mock_svc.get_all_awards.return_value = []
-        mock_svc.get_distinct_years.return_value = []
-        mock_svc.get_award_books.side_effect = Exception('DB error')
+        mock_svc.get_distinct_years_and_categories.return_value = ([], [])
+        mock_svc.get_award_book_rows.side_effect = Exception('DB error')
         MockAwardService.return_value = mock_svc
-        response = client.get('/awards')
+        response = buffered_client.get('/awards')
         assert response.status_code == 200
 
     @patch('app.services.award_book_service.AwardBookService')
-    def test_awards_with_award_name_filter(self, MockAwardService, client):
+    def test_awards_with_award_name_filter(self, MockAwardService, buffered_client):
         mock_award = MagicMock()
         mock_award.id = 1
         mock_award.name = 'TestAward'
@@ -247,79 +309,85 @@ class TestAwardsPage:
         mock_award.description = 'desc'
         mock_award.book_count = 0
 
-        mock_book = MagicMock()
-        mock_book.id = 10
-        mock_book.title = 'Test Title'
-        mock_book.author = 'Author'
-        mock_book.description = 'desc'
-        mock_book.details = 'details'
-        mock_book.cover_local_path = None
-        mock_book.cover_original_url = None
-        mock_book.isbn13 = '9780000000001'
-        mock_book.isbn10 = None
-        mock_book.publisher = 'Pub'
-        mock_book.publication_year = 2024
-        mock_book.year = 2024
-        mock_book.category = 'fiction'
-        mock_book.award = mock_award
-        mock_book.buy_links = []
+        mock_book = {
+            'id': 10,
+            'title': 'Test Title',
+            'title_zh': None,
+            'description': 'desc',
+            'description_zh': None,
+            'details': 'details',
+            'cover_local_path': None,
+            'cover_original_url': None,
+            'isbn13': '9780000000001',
+            'isbn10': None,
+            'publisher': 'Pub',
+            'publication_year': 2024,
+            'year': 2024,
+            'category': 'fiction',
+            'buy_links': None,
+            'award_name': 'TestAward',
+        }
 
         mock_svc = MagicMock()
         mock_svc.get_all_awards.return_value = [mock_award]
-        mock_svc.get_distinct_years.return_value = [2024]
+        mock_svc.get_distinct_years_and_categories.return_value = ([2024], [])
         mock_svc.get_award_by_name.return_value = mock_award
-        mock_svc.get_award_books.return_value = ([mock_book], 1)
+        mock_svc.get_award_book_rows.return_value = ([mock_book], 1)
         mock_svc.get_book_counts_by_award.return_value = {1: 1}
         MockAwardService.return_value = mock_svc
 
-        response = client.get('/awards?award=TestAward')
+        response = buffered_client.get('/awards?award=TestAward')
         assert response.status_code == 200
+        # 奖项按名称从已载入的列表中解析，不再单独查询
+        mock_svc.get_award_by_name.assert_not_called()
+        _, kwargs = mock_svc.get_award_book_rows.call_args
+        assert kwargs.get('award_id') == 1
 
     @patch('app.services.award_book_service.AwardBookService')
-    def test_awards_with_category_filter(self, MockAwardService, client):
+    def test_awards_with_category_filter(self, MockAwardService, buffered_client):
         mock_award = MagicMock()
         mock_award.id = 1
         mock_award.name = 'TestAward'
         mock_award.book_count = 0
 
-        mock_book = MagicMock()
-        mock_book.id = 10
-        mock_book.title = 'Test Title'
-        mock_book.author = 'Author'
-        mock_book.description = 'desc'
-        mock_book.details = 'details'
-        mock_book.cover_local_path = None
-        mock_book.cover_original_url = None
-        mock_book.isbn13 = '9780000000001'
-        mock_book.isbn10 = None
-        mock_book.publisher = 'Pub'
-        mock_book.publication_year = 2024
-        mock_book.year = 2024
-        mock_book.category = 'Fiction'
-        mock_book.title_zh = None
-        mock_book.award = mock_award
-        mock_book.buy_links = []
+        mock_book = {
+            'id': 10,
+            'title': 'Test Title',
+            'title_zh': None,
+            'description': 'desc',
+            'description_zh': None,
+            'details': 'details',
+            'cover_local_path': None,
+            'cover_original_url': None,
+            'isbn13': '9780000000001',
+            'isbn10': None,
+            'publisher': 'Pub',
+            'publication_year': 2024,
+            'year': 2024,
+            'category': 'Fiction',
+            'buy_links': None,
+            'award_name': 'TestAward',
+        }
 
         mock_svc = MagicMock()
         mock_svc.get_all_awards.return_value = [mock_award]
-        mock_svc.get_distinct_years.return_value = [2024]
-        mock_svc.get_distinct_categories.return_value = ['Fiction', 'Non-fiction']
+        mock_svc.get_distinct_years_and_categories.return_value = ([2024], ['Fiction', 'Non-fiction'])
         mock_svc.get_award_by_name.return_value = mock_award
-        mock_svc.get_award_books.return_value = ([mock_book], 1)
+        mock_svc.get_award_book_rows.return_value = ([mock_book], 1)
         mock_svc.get_book_counts_by_award.return_value = {1: 1}
         MockAwardService.return_value = mock_svc
 
-        response = client.get('/awards?category=Fiction')
+        response = buffered_client.get('/awards?category=Fiction')
         assert response.status_code == 200
         html = response.get_data(as_text=True)
         assert 'Fiction' in html
 
         # category 参数应传给服务层查询方法
-        _, kwargs = mock_svc.get_award_books.call_args
+        _, kwargs = mock_svc.get_award_book_rows.call_args
         assert kwargs.get('category') == 'Fiction'
 
     @patch('app.services.award_book_service.AwardBookService')
-    def test_awards_with_award_and_category_intersection(self, MockAwardService, client):
+    def test_awards_with_award_and_category_intersection(self, MockAwardService, buffered_client):
         """奖项 + 类别同时筛选时,两个条件都应传给服务层（交集，而非互相覆盖）"""
         mock_award = MagicMock()
         mock_award.id = 1
@@ -328,20 +396,201 @@ class TestAwardsPage:
 
         mock_svc = MagicMock()
         mock_svc.get_all_awards.return_value = [mock_award]
-        mock_svc.get_distinct_years.return_value = []
-        mock_svc.get_distinct_categories.return_value = ['Fiction']
+        mock_svc.get_distinct_years_and_categories.return_value = ([], ['Fiction'])
         mock_svc.get_award_by_name.return_value = mock_award
-        mock_svc.get_award_books.return_value = ([], 0)
+        mock_svc.get_award_book_rows.return_value = ([], 0)
         mock_svc.get_book_counts_by_award.return_value = {}
         MockAwardService.return_value = mock_svc
 
-        response = client.get('/awards?award=TestAward&category=Fiction')
+        response = buffered_client.get('/awards?award=TestAward&category=Fiction')
         assert response.status_code == 200
 
-        _, kwargs = mock_svc.get_award_books.call_args
+        _, kwargs = mock_svc.get_award_book_rows.call_args
         assert kwargs.get('award_id') == 1
         assert kwargs.get('category') == 'Fiction'
 
+    @patch('app.services.award_book_service.AwardBookService')
+    def test_awards_page_number_capped(self, MockAwardService, buffered_client):
+        mock_svc = MagicMock()
+        mock_svc.get_all_awards.return_value = []
+        mock_svc.get_distinct_years_and_categories.return_value = ([], [])
+        mock_svc.get_award_book_rows.return_value = ([], 0)
+        mock_svc.get_book_counts_by_award.return_value = {}
+        MockAwardService.return_value = mock_svc
+
+        response = buffered_client.get('/awards?page=99999999&per_page=20')
+        assert response.status_code == 200
+        _, kwargs = mock_svc.get_award_book_rows.call_args
+        assert kwargs['page'] == 10000
+        assert kwargs['limit'] == 20
+
+    def test_award_book_card_fields(self):
+        from app.routes.main import _award_book_card
+
+        row = {
+            'id': 7,
+            'title': '9780000000002',
+            'title_zh': '三体',
+            'description_zh': None,
+            'isbn13': '9780000000002',
+            'award_name': None,
+        }
+        card = _award_book_card(row)
+        assert card['id'] == 7
+        assert card['title'] == '三体'
+        assert card['title_en'] == '三体'
+        assert card['title_zh'] == '三体'
+        assert card['isbn13'] == '9780000000002'
+        assert card['award_name'] == '未知奖项'
+
+    def test_awards_search_filters_in_sql(self, buffered_client, db, sample_award):
+        from app.models.schemas import AwardBook
+
+        db.session.add_all(
+            [
+                AwardBook(award_id=sample_award, title='Dune', author='Frank Herbert', year=2024, is_displayable=True),
+                AwardBook(
+                    award_id=sample_award, title='Hyperion', author='Dan Simmons', year=2024, is_displayable=True
+                ),
+            ]
+        )
+        db.session.commit()
+
+        response = buffered_client.get('/awards?search=herbert')
+
+        # 作者匹配在 SQL 中完成，未命中的图书不会进入页面
+        assert response.status_code == 200
+        html = response.get_data(as_text=True)
+        assert 'Dune' in html
+        assert 'Hyperion' not in html
+
+    @patch('app.services.award_book_service.AwardBookService')
+    def test_awards_context_cached_per_query(self, MockAwardService, buffered_client):
+        mock_svc = MagicMock()
+        mock_svc.get_all_awards.return_value = []
+        mock_svc.get_distinct_years_and_categories.return_value = ([2024], [])
+        mock_svc.get_award_book_rows.return_value = ([], 0)
+        mock_svc.get_book_counts_by_award.return_value = {}
+        MockAwardService.return_value = mock_svc
+
+        assert buffered_client.get('/awards?year=2024').status_code == 200
+        assert buffered_client.get('/awards?year=2024').status_code == 200
+        assert mock_svc.get_award_book_rows.call_count == 1
+
+        # 不同查询条件各自缓存
+        buffered_client.get('/awards?year=2023')
+        assert mock_svc.get_award_book_rows.call_count == 2
+
+    @patch('app.services.award_book_service.AwardBookService')
+    def test_award_filters_shared_across_queries(self, MockAwardService, buffered_client):
+        mock_award = MagicMock(id=1, country='美国', description='desc')
+        mock_award.name = 'TestAward'
+        mock_svc = MagicMock()
+        mock_svc.get_all_awards.return_value = [mock_award]
+        mock_svc.get_distinct_years_and_categories.return_value = ([2024], ['Fiction'])
+        mock_svc.get_award_book_rows.return_value = ([], 0)
+        mock_svc.get_book_counts_by_award.return_value = {1: 3}
+        MockAwardService.return_value = mock_svc
+
+        buffered_client.get('/awards?award=TestAward')
+        _, kwargs = mock_svc.get_award_book_rows.call_args
+        assert kwargs['award_id'] == 1
+        # 奖项已随列表载入，按名称查找不再单独查询
+        mock_svc.get_award_by_name.assert_not_called()
+
+        html = buffered_client.get('/awards?year=2024').get_data(as_text=True)
+        assert mock_svc.get_all_awards.call_count == 1
+        assert mock_svc.get_distinct_years_and_categories.call_count == 1
+        assert mock_svc.get_book_counts_by_award.call_count == 1
+        assert '3本图书' in html
+        # 计数写入副本而非共享的奖项摘要
+        from app.utils.cache import result_cache
+
+        assert 'book_count' not in result_cache.get('awards_page:awards')[0]
+
+    @patch('app.services.award_book_service.AwardBookService')
+    def test_unknown_award_skips_book_query(self, MockAwardService, buffered_client):
+        mock_award = MagicMock(id=1, country='美国', description='desc')
+        mock_award.name = 'TestAward'
+        mock_svc = MagicMock()
+        mock_svc.get_all_awards.return_value = [mock_award]
+        mock_svc.get_distinct_years_and_categories.return_value = ([2024], ['Fiction'])
+        mock_svc.get_book_counts_by_award.return_value = {1: 3}
+        MockAwardService.return_value = mock_svc
+
+        response = buffered_client.get('/awards.json?award=NoSuchAward')
+        assert response.get_json()['data']['books'] == []
+        assert response.get_json()['data']['total_books'] == 0
+        mock_svc.get_award_book_rows.assert_not_called()
+
+    def test_awards_json_matches_page_data(self, buffered_client, db, sample_award):
+        from app.models.schemas import AwardBook
+
+        db.session.add(
+            AwardBook(award_id=sample_award, title='Dune', author='Frank Herbert', year=2024, is_displayable=True)
+        )
+        db.session.commit()
+
+        response = buffered_client.get('/awards.json?year=2024&per_page=10')
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert [book['title'] for book in data['books']] == ['Dune']
+        assert data['books'][0]['award_name'] == '星云奖'
+        assert data['total_books'] == 1
+        assert data['per_page'] == 10
+        assert data['years'] == [2024]
+        assert data['awards'][0]['book_count'] == 1
+
+    def test_awards_last_page_only_materializes_its_rows(self, buffered_client, db, sample_award):
+        from app.models.schemas import AwardBook
+
+        db.session.add_all(
+            AwardBook(award_id=sample_award, title=f'Book {i}', author='A', year=2024, rank=i, is_displayable=True)
+            for i in range(25)
+        )
+        db.session.commit()
+
+        data = buffered_client.get('/awards.json?per_page=10&page=3').get_json()['data']
+        assert [book['title'] for book in data['books']] == [f'Book {i}' for i in range(20, 25)]
+        assert (data['total_books'], data['total_pages']) == (25, 3)
+        assert data['has_prev'] and not data['has_next']
+
+    @patch('app.services.award_book_service.AwardBookService')
+    def test_awards_json_shares_page_cache(self, MockAwardService, buffered_client):
+        mock_svc = MagicMock()
+        mock_svc.get_all_awards.return_value = []
+        mock_svc.get_distinct_years_and_categories.return_value = ([], [])
+        mock_svc.get_award_book_rows.return_value = ([], 0)
+        mock_svc.get_book_counts_by_award.return_value = {}
+        MockAwardService.return_value = mock_svc
+
+        buffered_client.get('/awards?search=x')
+        assert buffered_client.get('/awards.json?search=x').get_json()['success'] is True
+        assert mock_svc.get_award_book_rows.call_count == 1
+
+    def test_awards_json_is_rate_limited(self, app, buffered_client):
+        from app.utils.rate_limiter import IPRateLimiter
+
+        with (
+            patch.dict(app.config, {'TESTING': False}),
+            patch.object(IPRateLimiter, 'acquire', return_value=30),
+        ):
+            response = buffered_client.get('/awards.json')
+        assert response.status_code == 429
+
+    @patch('app.services.award_book_service.AwardBookService')
+    def test_awards_degraded_context_not_cached(self, MockAwardService, buffered_client):
+        mock_svc = MagicMock()
+        mock_svc.get_all_awards.return_value = []
+        mock_svc.get_distinct_years_and_categories.side_effect = Exception('DB error')
+        mock_svc.get_award_book_rows.return_value = ([], 0)
+        mock_svc.get_book_counts_by_award.return_value = {}
+        MockAwardService.return_value = mock_svc
+
+        buffered_client.get('/awards?view=list')
+        buffered_client.get('/awards?view=list')
+        assert mock_svc.get_award_book_rows.call_count == 2
+
 
 class TestNewBooksPage:
     def test_new_books_default(self, client):
@@ -1364,3 +1613,53 @@ class TestIndexRoute:
         finally:
             with app.app_context():
                 app.extensions.pop('book_service', None)
+
+    def test_category_books_reused_until_cache_time_changes(self, client, app):
+        mock_svc = _mock_book_service([_make_book()])
+        with app.app_context():
+            app.extensions['book_service'] = mock_svc
+        try:
+            client.get('/')
+            client.get('/?sort=weeks_desc')
+            assert mock_svc.get_books_by_category.call_count == 1
+
+            mock_svc.get_cache_time.return_value = '2024-01-21'
+            client.get('/')
+            assert mock_svc.get_books_by_category.call_count == 2
+        finally:
+            with app.app_context():
+                app.extensions.pop('book_service', None)
+
+    def test_book_detail_does_not_mutate_cached_list(self, client, app):
+        mock_svc = _mock_book_service([_make_book()])
+        with app.app_context():
+            app.extensions['book_service'] = mock_svc
+        try:
+            with (
+                patch('app.routes.main.fetch_google_books_details', side_effect=lambda b, _: b.update(extra='x')),
+                patch('app.routes.main.merge_or_translate_book'),
+            ):
+                assert client.get('/book/0').status_code == 200
+            with app.test_request_context():
+                from app.routes.main import _get_books_for_category
+
+                books_data, _ = _get_books_for_category('hardcover-fiction')
+            assert 'extra' not in books_data[0]
+            assert mock_svc.get_books_by_category.call_count == 1
+        finally:
+            with app.app_context():
+                app.extensions.pop('book_service', None)
+
+    def test_search_index_cached_with_category_list(self, client, app):
+        mock_svc = _mock_book_service([_make_book(), _make_book(id='9780000000002', title='Other Title')])
+        with app.app_context():
+            app.extensions['book_service'] = mock_svc
+        try:
+            with patch('app.routes.main.BookSearchIndex', wraps=BookSearchIndex) as mock_build:
+                assert 'Other Title' in client.get('/?search=other').get_data(as_text=True)
+                html = client.get('/?search=BOOK').get_data(as_text=True)
+            assert 'Test Book' in html and 'Other Title' not in html
+            assert mock_build.call_count == 1
+        finally:
+            with app.app_context():
+                app.extensions.pop('book_service', None)
@@ -167,14 +167,14 @@ class TestDesktopProfileRoute:
 class TestMobileAwardsRoute:
     """奖项榜单移动端渲染"""
 
-    def test_mobile_ua_renders_awards(self, client, db) -> None:
+    def test_mobile_ua_renders_awards(self, buffered_client, db) -> None:
         """移动端 UA 访问 /awards 应渲染移动版奖项页"""
-        resp = client.get('/awards', headers={'User-Agent': MOBILE_UA})
+        resp = buffered_client.get('/awards', headers={'User-Agent': MOBILE_UA})
         assert resp.status_code == 200
         assert b'm-tabbar' in resp.data
 
     @patch('app.services.award_book_service.AwardBookService')
-    def test_mobile_awards_filter_links_preserve_other_dimensions(self, MockAwardService, client) -> None:
+    def test_mobile_awards_filter_links_preserve_other_dimensions(self, MockAwardService, buffered_client) -> None:
         """移动端奖项页,清除某一维度筛选的链接应完整保留其余两个维度"""
         mock_award = MagicMock()
         mock_award.id = 1
@@ -182,14 +182,15 @@ class TestMobileAwardsRoute:
         mock_award.book_count = 0
         mock_svc = MagicMock()
         mock_svc.get_all_awards.return_value = [mock_award]
-        mock_svc.get_distinct_years.return_value = [2024]
-        mock_svc.get_distinct_categories.return_value = ['Fiction']
+        mock_svc.get_distinct_years_and_categories.return_value = ([2024], ['Fiction'])
         mock_svc.get_award_by_name.return_value = mock_award
-        mock_svc.get_award_books.return_value = ([], 0)
+        mock_svc.get_award_book_rows.return_value = ([], 0)
         mock_svc.get_book_counts_by_award.return_value = {1: 0}
         MockAwardService.return_value = mock_svc
 
-        resp = client.get('/awards?award=TestAward&year=2024&category=Fiction', headers={'User-Agent': MOBILE_UA})
+        resp = buffered_client.get(
+            '/awards?award=TestAward&year=2024&category=Fiction', headers={'User-Agent': MOBILE_UA}
+        )
         assert resp.status_code == 200
         html = resp.get_data(as_text=True)
 
@@ -254,6 +255,19 @@ class TestTemplateFallback:
                 result = render_adaptive('nonexistent.html')
                 assert result == 'desktop:nonexistent.html'
 
+    def test_stream_adaptive_selects_mobile_template_and_coalesces(self, app) -> None:
+        """流式渲染同样优先移动模板，并把 Jinja 小片段合并成块"""
+        from app.utils.template_resolver import _coalesce, _select_adaptive_template
+
+        with app.test_request_context('/', headers={'User-Agent': MOBILE_UA}):
+            assert _select_adaptive_template('awards.html').name == 'mobile/awards.html'
+            assert _select_adaptive_template('new_books.html').name == 'new_books.html'
+        with app.test_request_context('/'):
+            assert _select_adaptive_template('awards.html').name == 'awards.html'
+
+        assert list(_coalesce(iter(['ab', 'cd', 'e']), size=3)) == ['abcd', 'e']
+        assert list(_coalesce(iter([]))) == []
+
 
 class TestMobileAwardBookDetailRoute:
     """获奖图书详情页移动端渲染"""
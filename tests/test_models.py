@@ -327,6 +327,23 @@ class TestAwardBook:
         assert AwardBook._looks_like_isbn(None) is False
         assert AwardBook._looks_like_isbn('') is False
 
+    def test_trigram_indexes_postgresql_only(self):
+        """三元组索引仅在 PostgreSQL 下生成 gin_trgm_ops DDL"""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateIndex
+
+        indexes = {idx.name: idx for idx in AwardBook.__table__.indexes if idx.name.endswith('_trgm')}
+        assert set(indexes) == {f'idx_award_books_{c}_trgm' for c in ('title', 'author', 'title_zh')}
+        ddl = str(CreateIndex(indexes['idx_award_books_title_trgm']).compile(dialect=postgresql.dialect()))
+        assert 'USING gin (title gin_trgm_ops)' in ddl
+        assert all(idx._ddl_if.dialect == 'postgresql' for idx in indexes.values())
+
+    def test_composite_filter_indexes(self):
+        """奖项筛选/排序所用的复合索引在所有数据库下创建"""
+        columns = {idx.name: [c.name for c in idx.columns] for idx in AwardBook.__table__.indexes}
+        assert columns['idx_award_books_award_year_rank'] == ['award_id', 'year', 'rank']
+        assert columns['idx_award_books_award_category'] == ['award_id', 'category']
+
 
 # ==================== SystemConfig 模型测试 ====================
 
@@ -429,6 +446,41 @@ class TestBook:
         assert data['title'] == 'Test Book'
         assert data['description_zh'] == '中文描述'
 
+    def test_book_to_dict_matches_asdict(self):
+        """to_dict 输出字段与 asdict 一致，buy_links 为独立副本"""
+        from dataclasses import asdict
+
+        links = [{'name': 'Amazon', 'url': 'https://amazon.com'}]
+        book = Book(
+            id='9780143127550',
+            title='Test Book',
+            author='Test Author',
+            publisher='Test Publisher',
+            cover='',
+            list_name='Hardcover Fiction',
+            category_id='hardcover-fiction',
+            category_name='精装小说',
+            rank=1,
+            weeks_on_list=10,
+            rank_last_week='2',
+            published_date='2024-01-14',
+            description='Description',
+            details='Details',
+            publication_dt='2023-10-01',
+            page_count='320',
+            language='en',
+            buy_links=links,
+            isbn13='9780143127550',
+            isbn10='014312755X',
+            price='28.00',
+        )
+
+        data = book.to_dict()
+
+        assert data == asdict(book)
+        data['buy_links'][0]['name'] = 'changed'
+        assert links[0]['name'] == 'Amazon'
+
     def test_book_from_api_response(self):
         """测试从 API 响应创建 Book"""
         book_data = {
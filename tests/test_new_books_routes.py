@@ -165,6 +165,35 @@ class TestCSVSanitization:
                 if '=cmd' in line or 'cmd|' in line:
                     assert "'=cmd" in line or "'+" in line or "'@" in line, f'未转义: {line[:80]}'
 
+    def test_csv_bytes_have_single_bom_and_crlf(self, app, db, client):
+        """导出内容以单个 BOM 开头，行以 \\r\\n 结束，中文按 UTF-8 编码"""
+        from app.models.new_book import NewBook, Publisher
+
+        with app.app_context():
+            publisher = Publisher(name='编码', name_en='EncPub', website='', crawler_class='X', is_active=True)
+            db.session.add(publisher)
+            db.session.commit()
+            db.session.add(
+                NewBook(
+                    publisher_id=publisher.id,
+                    title='Encoded, Title',
+                    title_zh='编码测试',
+                    author='Author',
+                    isbn13='9780000000917',
+                    is_displayable=True,
+                )
+            )
+            db.session.commit()
+            app.extensions.pop('export_last_127.0.0.1', None)
+
+        response = client.get('/api/new-books/export/csv?days=365')
+        assert response.status_code == 200
+        body = response.data
+        assert body.startswith(b'\xef\xbb\xbf\xe4\xb9\xa6\xe5\x90\x8d,')
+        assert body.count(b'\xef\xbb\xbf') == 1
+        assert b'"Encoded, Title",' + '编码测试'.encode() in body
+        assert body.endswith(b'\r\n')
+
 
 class TestExportCooldown:
     """v0.9.68: CSV 导出每 IP 10 秒限速测试"""
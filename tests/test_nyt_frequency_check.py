@@ -1,6 +1,7 @@
 from unittest.mock import Mock
 
 import requests
+from flask import Flask
 
 from app.config import Config
 from scripts import check_nyt_category_frequencies as checker
@@ -10,6 +11,21 @@ def test_frequency_config_covers_every_supported_category():
     assert set(Config.NYT_CATEGORY_UPDATE_FREQUENCIES) == set(Config.CATEGORIES)
 
 
+def test_monthly_categories_derived_from_frequency_config(app):
+    expected = sorted(c for c, f in Config.NYT_CATEGORY_UPDATE_FREQUENCIES.items() if f == 'monthly')
+    assert list(app.config['NYT_MONTHLY_CATEGORIES']) == expected
+
+
+def test_monthly_categories_follow_subclass_frequencies():
+    class WeeklyOnlyConfig(Config):
+        NYT_CATEGORY_UPDATE_FREQUENCIES = {'hardcover-fiction': 'weekly', 'young-adult-hardcover': 'monthly'}
+
+    flask_app = Flask(__name__)
+    flask_app.config.from_object(WeeklyOnlyConfig)
+    WeeklyOnlyConfig.init_app(flask_app)
+    assert flask_app.config['NYT_MONTHLY_CATEGORIES'] == ('young-adult-hardcover',)
+
+
 def test_find_frequency_drift_accepts_matching_metadata():
     actual = {category: frequency.upper() for category, frequency in Config.NYT_CATEGORY_UPDATE_FREQUENCIES.items()}
 
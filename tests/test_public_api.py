@@ -30,7 +30,7 @@ class TestGetAllBestsellers:
 
     def test_with_mock_service(self, client, app):
         mock_service = MagicMock()
-        mock_service.get_books_by_category.return_value = []
+        mock_service.get_books_by_categories.return_value = {}
         mock_service.get_latest_cache_time.return_value = None
 
         with app.app_context():
@@ -42,6 +42,7 @@ def _make_book(**overrides):
 def _mock_book_service(books=None):
     svc = MagicMock()
     svc.get_books_by_category.return_value = books or []
+    svc.get_books_by_categories.side_effect = lambda ids: {cat_id: books or [] for cat_id in ids}
     svc.get_latest_cache_time.return_value = '2024-01-14'
     svc.search_books.return_value = []
     return svc
@@ -61,6 +62,10 @@ class TestGetAllBestsellersExtended:
             assert data['success'] is True
             assert 'books' in data['data']
             assert 'last_updated' in data['data']
+            mock_svc.get_books_by_categories.assert_called_once_with(tuple(app.config['CATEGORIES']))
+            mock_svc.get_books_by_category.assert_not_called()
+            first = next(iter(data['data']['books'].values()))
+            assert len(first['books']) == 1
         finally:
             with app.app_context():
                 app.extensions.pop('book_service', None)
@@ -79,7 +84,7 @@ class TestGetAllBestsellersExtended:
 
     def test_exception_returns_500(self, client, app):
         mock_svc = MagicMock()
-        mock_svc.get_books_by_category.side_effect = Exception('DB error')
+        mock_svc.get_books_by_categories.side_effect = Exception('DB error')
         with app.app_context():
             app.extensions['book_service'] = mock_svc
         try:
@@ -444,7 +449,7 @@ class TestGetWeeklyReportsExtended:
         assert data['success'] is False
         assert resp.status_code == 503
 
-    @patch('app.services.weekly_report_service.WeeklyReportService')
+    @patch('app.routes.public_api.WeeklyReportService')
     def test_success(self, MockWRS, client, app):
         mock_report = MagicMock()
         mock_report.to_dict.return_value = {'id': 1, 'title': 'Report 1'}
@@ -464,7 +469,7 @@ class TestGetWeeklyReportsExtended:
             with app.app_context():
                 app.extensions.pop('book_service', None)
 
-    @patch('app.services.weekly_report_service.WeeklyReportService')
+    @patch('app.routes.public_api.WeeklyReportService')
     def test_exception_returns_500(self, MockWRS, client, app):
         mock_svc = MagicMock()
         mock_svc.get_reports.side_effect = Exception('crash')
@@ -482,7 +487,7 @@ class TestGetWeeklyReportsExtended:
             with app.app_context():
                 app.extensions.pop('book_service', None)
 
-    @patch('app.services.weekly_report_service.WeeklyReportService')
+    @patch('app.routes.public_api.WeeklyReportService')
     def test_limit_clamped(self, MockWRS, client, app):
         mock_svc = MagicMock()
         mock_svc.get_reports.return_value = []
@@ -511,7 +516,7 @@ class TestGetLatestWeeklyReportExtended:
         assert data['success'] is False
         assert resp.status_code == 503
 
-    @patch('app.services.weekly_report_service.WeeklyReportService')
+    @patch('app.routes.public_api.WeeklyReportService')
     def test_no_report_available(self, MockWRS, client, app):
         mock_svc = MagicMock()
         mock_svc.get_latest_report.return_value = None
@@ -529,7 +534,7 @@ class TestGetLatestWeeklyReportExtended:
             with app.app_context():
                 app.extensions.pop('book_service', None)
 
-    @patch('app.services.weekly_report_service.WeeklyReportService')
+    @patch('app.routes.public_api.WeeklyReportService')
     def test_success(self, MockWRS, client, app):
         mock_report = MagicMock()
         mock_report.to_dict.return_value = {'id': 1}
@@ -548,7 +553,7 @@ class TestGetLatestWeeklyReportExtended:
             with app.app_context():
                 app.extensions.pop('book_service', None)
 
-    @patch('app.services.weekly_report_service.WeeklyReportService')
+    @patch('app.routes.public_api.WeeklyReportService')
     def test_exception_returns_500(self, MockWRS, client, app):
         mock_svc = MagicMock()
         mock_svc.get_latest_report.side_effect = Exception('crash')
@@ -578,7 +583,7 @@ class TestGetWeeklyReportByDateExtended:
         assert data['success'] is False
         assert resp.status_code == 503
 
-    @patch('app.services.weekly_report_service.WeeklyReportService')
+    @patch('app.routes.public_api.WeeklyReportService')
     def test_report_not_found(self, MockWRS, client, app):
         mock_svc = MagicMock()
         mock_svc.get_report_by_date.return_value = None
@@ -596,7 +601,7 @@ class TestGetWeeklyReportByDateExtended:
             with app.app_context():
                 app.extensions.pop('book_service', None)
 
-    @patch('app.services.weekly_report_service.WeeklyReportService')
+    @patch('app.routes.public_api.WeeklyReportService')
     def test_success(self, MockWRS, client, app):
         mock_report = MagicMock()
         mock_report.to_dict.return_value = {'id': 1}
@@ -615,7 +620,7 @@ class TestGetWeeklyReportByDateExtended:
             with app.app_context():
                 app.extensions.pop('book_service', None)
 
-    @patch('app.services.weekly_report_service.WeeklyReportService')
+    @patch('app.routes.public_api.WeeklyReportService')
     def test_exception_returns_500(self, MockWRS, client, app):
         mock_svc = MagicMock()
         mock_svc.get_report_by_date.side_effect = Exception('crash')
@@ -637,7 +642,7 @@ class TestGetWeeklyReportByDateExtended:
 class TestGetNewBooksExtended:
     """测试 /api/public/new-books 的异常路径"""
 
-    @patch('app.services.new_book.NewBookService')
+    @patch('app.routes.public_api.NewBookService')
     def test_exception_returns_500(self, MockNBS, client):
         mock_svc = MagicMock()
         mock_svc.get_new_books.side_effect = Exception('DB error')
@@ -647,7 +652,7 @@ class TestGetNewBooksExtended:
         assert data['success'] is False
         assert resp.status_code == 500
 
-    @patch('app.services.new_book.NewBookService')
+    @patch('app.routes.public_api.NewBookService')
     def test_with_publisher_id(self, MockNBS, client):
         mock_svc = MagicMock()
         mock_svc.get_new_books.return_value = ([], 0)
@@ -671,7 +676,7 @@ class TestGetNewBooksExtended:
 class TestGetNewBooksByPublisherExtended:
     """测试 /api/public/new-books/<publisher_name> 的各种路径"""
 
-    @patch('app.services.new_book.NewBookService')
+    @patch('app.routes.public_api.NewBookService')
     def test_exception_returns_500(self, MockNBS, client):
         mock_svc = MagicMock()
         mock_svc.get_publishers.side_effect = Exception('DB error')
@@ -681,7 +686,7 @@ class TestGetNewBooksByPublisherExtended:
         assert data['success'] is False
         assert resp.status_code == 500
 
-    @patch('app.services.new_book.NewBookService')
+    @patch('app.routes.public_api.NewBookService')
     def test_publisher_found_success(self, MockNBS, client):
         mock_publisher = MagicMock()
         mock_publisher.id = 1
@@ -701,21 +706,21 @@ class TestGetNewBooksByPublisherExtended:
 class TestGetRecommendationsExtended:
     """测试 /api/public/recommendations 的异常路径"""
 
-    @patch('app.services.recommendation_service.RecommendationService')
-    def test_exception_returns_500(self, MockRS, client):
+    @patch('app.routes.public_api.get_or_create_recommendation_service')
+    def test_exception_returns_500(self, mock_get_service, client):
         mock_svc = MagicMock()
         mock_svc.get_smart_recommendations.side_effect = Exception('crash')
-        MockRS.return_value = mock_svc
+        mock_get_service.return_value = mock_svc
         resp = client.get('/api/public/recommendations')
         data = json.loads(resp.data)
         assert data['success'] is False
         assert resp.status_code == 500
 
-    @patch('app.services.recommendation_service.RecommendationService')
-    def test_success_with_limit(self, MockRS, client):
+    @patch('app.routes.public_api.get_or_create_recommendation_service')
+    def test_success_with_limit(self, mock_get_service, client):
         mock_svc = MagicMock()
         mock_svc.get_smart_recommendations.return_value = {'recommendations': []}
-        MockRS.return_value = mock_svc
+        mock_get_service.return_value = mock_svc
         resp = client.get('/api/public/recommendations?limit=5')
         data = json.loads(resp.data)
         assert data['success'] is True
@@ -16,6 +16,7 @@ from app.schemas.validators import (
     TranslateBookFieldsRequest,
     TranslateRequest,
     UserPreferencesUpdate,
+    parse_json_body,
     parse_query_args,
 )
 
@@ -61,6 +62,30 @@ class TestTranslateRequest:
         with pytest.raises(ValidationError):
             TranslateRequest(text='Hello', source_lang='english')
 
+    def test_text_is_stripped_before_length_check(self):
+        with pytest.raises(ValidationError):
+            TranslateRequest(text='   ')
+        assert TranslateRequest(text='  Hello  ').text == 'Hello'
+
+
+class TestParseJsonBody:
+    def test_parses_bytes(self):
+        req = parse_json_body(TranslateRequest, b'{"text": "Hello", "target_lang": "ja"}')
+        assert req.text == 'Hello'
+        assert req.target_lang == 'ja'
+
+    def test_empty_body_uses_defaults(self):
+        req = parse_json_body(CacheClearRequest, b'')
+        assert req.cache_id is None
+
+    def test_invalid_json_raises(self):
+        with pytest.raises(ValidationError):
+            parse_json_body(CacheClearRequest, b'{bad json')
+
+    def test_preference_isbns_filtered_with_validate_isbn(self):
+        req = parse_json_body(UserPreferencesUpdate, b'{"last_viewed_isbns": ["080442957X", "bad"]}')
+        assert req.last_viewed_isbns == ['080442957X']
+
 
 class TestTranslateBookFieldsRequest:
     def test_has_any_field_true(self):
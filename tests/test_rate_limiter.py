@@ -1,6 +1,7 @@
 """rate_limiter 模块单元测试"""
 
 import time
+from unittest.mock import patch
 
 from app.utils.rate_limiter import IPRateLimiter, RateLimiter, get_rate_limiter
 
@@ -64,6 +65,24 @@ class TestIPRateLimiter:
         retry = limiter.get_retry_after('10.0.0.1')
         assert retry > 0
 
+    def test_acquire_returns_retry_after_atomically(self):
+        limiter = IPRateLimiter(max_requests=2, window_seconds=60)
+        assert limiter.acquire('10.0.0.1') == 0
+        assert limiter.acquire('10.0.0.1') == 0
+        retry = limiter.acquire('10.0.0.1')
+        assert 0 < retry <= 61
+        assert retry == limiter.get_retry_after('10.0.0.1')
+        # 被拒绝的请求不计入窗口
+        assert len(limiter._requests['10.0.0.1']) == 2
+
+    def test_expired_requests_evicted_from_window(self):
+        limiter = IPRateLimiter(max_requests=2, window_seconds=60)
+        limiter.is_allowed('10.0.0.1')
+        limiter.is_allowed('10.0.0.1')
+        with patch('app.utils.rate_limiter.time.time', return_value=time.time() + 61):
+            assert limiter.is_allowed('10.0.0.1') is True
+        assert len(limiter._requests['10.0.0.1']) == 1
+
     def test_retry_after_unknown_client_returns_zero(self):
         limiter = IPRateLimiter(max_requests=10, window_seconds=60)
         assert limiter.get_retry_after('unknown') == 0
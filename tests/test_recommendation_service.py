@@ -190,6 +190,24 @@ class TestGetSimilarityRecommendations:
             result = rec_service.get_similarity_recommendations()
             assert result['based_on'] == 'popular'
 
+    def test_candidates_skip_large_text_columns(self, app, db, rec_service, sample_books):
+        from sqlalchemy import inspect
+
+        with app.app_context():
+            db.session.expunge_all()
+            loaded = []
+            original = rec_service._format_award_book
+
+            def capture(book):
+                loaded.append(book)
+                return original(book)
+
+            with patch.object(rec_service, '_format_award_book', side_effect=capture):
+                result = rec_service.get_similarity_recommendations(category='fiction')
+            assert result['recommendations'][0]['title'] == 'The Great Novel'
+            assert loaded
+            assert all('description' in inspect(book).unloaded for book in loaded)
+
 
 class TestGetPersonalizedRecommendations:
     """测试 get_personalized_recommendations"""
@@ -228,6 +246,24 @@ class TestGetPersonalizedRecommendations:
             assert 'recommendations' in result
             assert result['based_on'] == 'personalized'
 
+    @patch.object(RecommendationService, '_get_viewed_books')
+    @patch.object(RecommendationService, '_analyze_user_interests')
+    @patch.object(RecommendationService, '_recommend_by_interests')
+    def test_fill_excludes_already_recommended(
+        self, mock_rec, mock_interests, mock_viewed, app, db, rec_service, sample_books
+    ):
+        mock_viewed.return_value = [MagicMock(isbn='9780000000001')]
+        mock_interests.return_value = {'authors': [], 'keywords': [], 'categories': []}
+        mock_rec.return_value = [{'id': sample_books[0], 'title': 'The Great Novel', 'type': 'award_book'}]
+
+        with app.app_context():
+            result = rec_service.get_personalized_recommendations('test-session', limit=2)
+            ids = [r['id'] for r in result['recommendations']]
+            assert len(ids) == 2
+            assert ids[0] == sample_books[0]
+            assert len(set(ids)) == 2
+            assert all(isinstance(r, dict) for r in result['recommendations'])
+
 
 class TestFormatAwardBook:
     """测试 _format_award_book"""
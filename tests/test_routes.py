@@ -173,6 +173,19 @@ class TestUserPreferences:
         data = json.loads(response.data)
         assert data['success'] is True
 
+    def test_update_preferences_invalid_view_mode(self, client, db, csrf_token):
+        """测试非法视图模式被请求体校验拒绝"""
+        response = client.post(
+            '/api/user/preferences',
+            data=json.dumps({'view_mode': 'table', 'preferred_categories': 'hardcover-fiction'}),
+            content_type='application/json',
+            headers={'X-CSRF-Token': csrf_token()},
+        )
+
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert data['success'] is False
+
 
 # ==================== ISBN 验证测试 ====================
 
@@ -291,7 +304,7 @@ class TestTranslationAPI:
         with (
             patch('app.utils.api_helpers.validate_csrf_token', return_value=True),
             patch(
-                'app.services.zhipu_translation_service.get_translation_service',
+                'app.routes.api.translation.get_translation_service',
                 return_value=translation_service,
             ),
         ):
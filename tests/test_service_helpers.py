@@ -10,6 +10,7 @@ from app.utils.service_helpers import (
     get_cache_service,
     get_google_books_client,
     get_image_cache_service,
+    get_or_create_google_books_client,
     get_or_create_recommendation_service,
     get_or_create_smart_search_service,
     get_recommendation_service,
@@ -163,6 +164,23 @@ class TestGetGoogleBooksClient:
             assert result is None
 
 
+class TestGetOrCreateGoogleBooksClient:
+    """测试 get_or_create_google_books_client 兜底实例复用"""
+
+    def test_fallback_client_is_reused(self, app):
+        with app.app_context():
+            book_service = app.extensions.pop('book_service', None)
+            try:
+                first = get_or_create_google_books_client()
+                second = get_or_create_google_books_client()
+                assert first is second
+                assert app.extensions['google_books_client'] is first
+            finally:
+                app.extensions.pop('google_books_client', None)
+                if book_service is not None:
+                    app.extensions['book_service'] = book_service
+
+
 class TestRequireCacheService:
     """require_cache_service 异常路径"""
 
@@ -233,6 +251,8 @@ class TestRecommendationAndSearchSingletons:
             app.extensions.pop('recommendation_service', None)
             svc = get_or_create_recommendation_service()
             assert svc is not None
+            assert get_or_create_recommendation_service() is svc
+            assert app.extensions['recommendation_service'] is svc
 
     def test_recommendation_get_or_create_returns_singleton(self, app):
         mock_svc = MagicMock()
@@ -255,6 +275,8 @@ class TestRecommendationAndSearchSingletons:
             app.extensions.pop('smart_search_service', None)
             svc = get_or_create_smart_search_service()
             assert svc is not None
+            assert get_or_create_smart_search_service() is svc
+            assert app.extensions['smart_search_service'] is svc
 
     def test_smart_search_get_or_create_returns_singleton(self, app):
         mock_svc = MagicMock()
@@ -34,6 +34,7 @@ def _make_flask_query(results=None, count_val=0):
     q = Mock()
     q.filter.return_value = q
     q.count.return_value = count_val
+    q.options.return_value = q
     q.order_by.return_value = q
     q.offset.return_value = q
     q.limit.return_value = q
@@ -231,6 +232,7 @@ class TestSearch:
             award_q = Mock()
             award_q.filter.return_value = award_q
             award_q.count.return_value = 50
+            award_q.options.return_value = award_q
             award_q.order_by.return_value = award_q
             award_q.offset.return_value = award_q
             award_q.limit.return_value = award_q
@@ -239,6 +241,7 @@ class TestSearch:
             new_q = Mock()
             new_q.filter.return_value = new_q
             new_q.count.return_value = 0
+            new_q.options.return_value = new_q
             new_q.order_by.return_value = new_q
             new_q.offset.return_value = new_q
             new_q.limit.return_value = new_q
@@ -251,6 +254,23 @@ class TestSearch:
                 result = service.search('test', limit=10, offset=0)
                 assert result['pagination']['has_more'] is True
 
+    def test_award_join_loads_only_award_name(self, service, app, db, sample_award, capture_statements):
+        from app.models.schemas import AwardBook
+
+        db.session.add(AwardBook(award_id=sample_award, title='Solaris', author='Lem', year=2024, is_displayable=True))
+        db.session.commit()
+        db.session.expunge_all()
+
+        with capture_statements() as statements:
+            result = service.search('solaris')
+
+        assert result['results'][0]['award'] == {'id': sample_award, 'name': '星云奖'}
+        award_select = next(s for s in statements if 'JOIN awards' in s)
+        assert 'awards_1.name' in award_select
+        assert 'awards_1.description' not in award_select
+        # 奖项名称随主查询取回，格式化时没有额外查询
+        assert not any(s.lstrip().startswith('SELECT awards.') for s in statements)
+
     def test_search_returns_formatted_results(self, service, app):
         with app.app_context():
             mock_book = Mock()
@@ -270,6 +290,7 @@ class TestSearch:
             award_q = Mock()
             award_q.filter.return_value = award_q
             award_q.count.return_value = 1
+            award_q.options.return_value = award_q
             award_q.order_by.return_value = award_q
             award_q.offset.return_value = award_q
             award_q.limit.return_value = award_q
@@ -278,6 +299,7 @@ class TestSearch:
             new_q = Mock()
             new_q.filter.return_value = new_q
             new_q.count.return_value = 0
+            new_q.options.return_value = new_q
             new_q.order_by.return_value = new_q
             new_q.offset.return_value = new_q
             new_q.limit.return_value = new_q
@@ -372,7 +394,7 @@ class TestApplyAwardSearchConditions:
             mock_title.ilike.return_value = dummy_cond
             mock_title_zh.ilike.return_value = dummy_cond
             service._apply_award_search_conditions(mock_query, '100%_test', 'title')
-            mock_title.ilike.assert_called_with('%100\\%\\_test%')
+            mock_title.ilike.assert_called_with('%100\\%\\_test%', escape='\\')
 
 
 class TestApplyNewBookSearchConditions:
@@ -450,6 +472,7 @@ class TestGenerateSuggestions:
         with patch('app.services.smart_search_service.SearchHistory') as MockSH:
             mock_q = Mock()
             mock_q.filter.return_value = mock_q
+            mock_q.options.return_value = mock_q
             mock_q.order_by.return_value = mock_q
             mock_q.limit.return_value = mock_q
             mock_q.all.return_value = [mock_search1, mock_search2]
@@ -469,6 +492,7 @@ class TestGenerateSuggestions:
         with patch('app.services.smart_search_service.SearchHistory') as MockSH:
             mock_q = Mock()
             mock_q.filter.return_value = mock_q
+            mock_q.options.return_value = mock_q
             mock_q.order_by.return_value = mock_q
             mock_q.limit.return_value = mock_q
             mock_q.all.return_value = [mock_search1, mock_search2]
@@ -586,6 +610,21 @@ class TestGetSuggestions:
             texts = [s['text'] for s in result['suggestions']]
             assert len(texts) == len(set(t.lower() for t in texts))
 
+    def test_full_title_page_skips_later_queries(self, service):
+        dummy_cond = text('1=1')
+        with patch('app.services.smart_search_service.AwardBook') as MockAward:
+            title_q = _make_flask_query([('Test A',), ('Test B',)])
+            MockAward.query = Mock()
+            MockAward.query.filter.return_value = title_q
+            MockAward.is_displayable = dummy_cond
+            for field in ('title', 'title_zh', 'author', 'publisher'):
+                column = Mock()
+                column.ilike.return_value = dummy_cond
+                setattr(MockAward, field, column)
+            result = service.get_suggestions('test', limit=2)
+            assert [s['text'] for s in result['suggestions']] == ['Test A', 'Test B']
+            assert MockAward.query.filter.call_count == 1
+
     def test_exception_returns_error(self, service):
         dummy_cond = text('1=1')
         with patch('app.services.smart_search_service.AwardBook') as MockAward:
@@ -606,6 +645,7 @@ class TestGetPopularSearches:
             mock_q = Mock()
             mock_q.with_entities.return_value = mock_q
             mock_q.group_by.return_value = mock_q
+            mock_q.options.return_value = mock_q
             mock_q.order_by.return_value = mock_q
             mock_q.limit.return_value = mock_q
             mock_q.all.return_value = [mock_item1, mock_item2]
@@ -623,6 +663,7 @@ class TestGetPopularSearches:
             mock_q = Mock()
             mock_q.with_entities.return_value = mock_q
             mock_q.group_by.return_value = mock_q
+            mock_q.options.return_value = mock_q
             mock_q.order_by.return_value = mock_q
             mock_q.limit.return_value = mock_q
             mock_q.all.return_value = []
@@ -647,6 +688,7 @@ class TestGetPopularSearches:
             mock_q = Mock()
             mock_q.with_entities.return_value = mock_q
             mock_q.group_by.return_value = mock_q
+            mock_q.options.return_value = mock_q
             mock_q.order_by.return_value = mock_q
             mock_q.limit.return_value = mock_q
             mock_q.all.return_value = [mock_item]
@@ -693,6 +735,7 @@ class TestGetSearchHistory:
         with patch('app.services.smart_search_service.SearchHistory') as MockSH:
             mock_q = Mock()
             mock_q.filter_by.return_value = mock_q
+            mock_q.options.return_value = mock_q
             mock_q.order_by.return_value = mock_q
             mock_q.limit.return_value = mock_q
             mock_q.all.return_value = [mock_h1, mock_h2]
@@ -709,6 +752,7 @@ class TestGetSearchHistory:
         with patch('app.services.smart_search_service.SearchHistory') as MockSH:
             mock_q = Mock()
             mock_q.filter_by.return_value = mock_q
+            mock_q.options.return_value = mock_q
             mock_q.order_by.return_value = mock_q
             mock_q.limit.return_value = mock_q
             mock_q.all.return_value = [mock_h1, mock_h2]
@@ -721,6 +765,7 @@ class TestGetSearchHistory:
         with patch('app.services.smart_search_service.SearchHistory') as MockSH:
             mock_q = Mock()
             mock_q.filter_by.return_value = mock_q
+            mock_q.options.return_value = mock_q
             mock_q.order_by.return_value = mock_q
             mock_q.limit.return_value = mock_q
             mock_q.all.return_value = []
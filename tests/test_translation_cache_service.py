@@ -367,6 +367,30 @@ class TestGetRecent:
         assert results[0].source_text == 'BothA'
 
 
+class TestGetRecentPreviews:
+    """测试 get_recent_previews 方法"""
+
+    def test_previews_truncated_in_sql(self, db):
+        """长文本只取前 preview_length + 1 个字符"""
+        service = TranslationCacheService()
+        _insert_cache(db, source_text='a' * 500, translated_text='短译文')
+
+        results = service.get_recent_previews(preview_length=100)
+        assert len(results) == 1
+        assert results[0].source_text == 'a' * 101
+        assert results[0].translated_text == '短译文'
+
+    def test_previews_filter_and_order(self, db):
+        """筛选与排序规则同 get_recent"""
+        service = TranslationCacheService()
+        _insert_cache(db, source_text='Old', last_used_at=datetime.now(UTC) - timedelta(hours=1))
+        _insert_cache(db, source_text='New', last_used_at=datetime.now(UTC))
+        _insert_cache(db, source_text='Other', target_lang='ja')
+
+        results = service.get_recent_previews(target_lang='zh')
+        assert [r.source_text for r in results] == ['New', 'Old']
+
+
 class TestSearch:
     """测试 search 方法"""
 
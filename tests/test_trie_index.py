@@ -0,0 +1,223 @@
+"""
+搜索建议前缀树测试
+"""
+
+import pytest
+
+from app.models.schemas import AwardBook
+from app.services.trie_index import SuggestionTrie
+
+
+@pytest.fixture
+def trie():
+    return SuggestionTrie(top_k=5)
+
+
+class TestSuggestionTrie:
+    def test_prefix_match_is_case_insensitive(self, trie):
+        trie.insert('The Hobbit', 'The Hobbit')
+        assert trie.suggest('the h') == [{'text': 'The Hobbit', 'type': 'title'}]
+        assert trie.suggest('THE') == [{'text': 'The Hobbit', 'type': 'title'}]
+
+    def test_no_match_returns_empty(self, trie):
+        trie.insert('Dune', 'Dune')
+        assert trie.suggest('dx') == []
+        assert trie.suggest('') == []
+
+    def test_type_priority_title_author_publisher(self, trie):
+        trie.add_book('Penguin Island', None, 'Pen Author', 'Penguin Books')
+        types = [s['type'] for s in trie.suggest('pen')]
+        assert types == ['title', 'author', 'publisher']
+
+    def test_title_zh_returns_english_title(self, trie):
+        trie.add_book('The Three-Body Problem', '三体', 'Liu Cixin', None)
+        assert trie.suggest('三') == [{'text': 'The Three-Body Problem', 'type': 'title'}]
+
+    def test_deduplicates_by_text(self, trie):
+        trie.insert('Same Title', 'Same Title')
+        trie.insert('same title', 'same title')
+        texts = [s['text'] for s in trie.suggest('same')]
+        assert texts == ['Same Title']
+
+    def test_top_k_bounded_and_limit(self, trie):
+        for i in range(10):
+            trie.insert(f'book {i}', f'Book {i}')
+        assert len(trie._root.children['b'].top) == 5
+        assert len(trie.suggest('book', limit=2)) == 2
+
+    def test_higher_weight_ranks_first(self, trie):
+        trie.insert('alpha', 'alpha', weight=1)
+        trie.insert('alpine', 'alpine', weight=5)
+        assert trie.suggest('alp')[0]['text'] == 'alpine'
+
+    def test_build_replaces_previous_entries(self, trie):
+        trie.insert('old', 'old')
+        trie.build([('New Book', None, 'Nora', None)])
+        assert trie.suggest('old') == []
+        assert trie.suggest('n')[0]['text'] == 'New Book'
+        assert not trie.needs_rebuild
+
+    def test_suggest_from_resumes_at_node(self, trie):
+        trie.insert('harry potter', 'Harry Potter')
+        trie.insert('harvest', 'Harvest')
+        _, node, consumed = trie.suggest_from(None, 'har', 10)
+        assert consumed == 3
+        suggestions, _, _ = trie.suggest_from(node, 'ry', 10)
+        assert suggestions == [{'text': 'Harry Potter', 'type': 'title'}]
+        assert trie.suggest_from(node, 'x', 10) == ([], None, 0)
+
+    def test_anchor_stops_before_partially_matched_edge(self, trie):
+        trie.insert('harry potter', 'Harry Potter')
+        trie.insert('harvest', 'Harvest')
+        suggestions, anchor, consumed = trie.suggest_from(None, 'harr', 10)
+        assert suggestions == [{'text': 'Harry Potter', 'type': 'title'}]
+        # 'harr' 落在 'ry potter' 边的中间，锚点停在 'har' 节点
+        assert consumed == 3
+        assert anchor is trie.suggest_from(None, 'har', 10)[1]
+
+    def test_single_branch_chains_are_compressed(self, trie):
+        trie.insert('abcdef', 'abcdef')
+        trie.insert('abcxyz', 'abcxyz')
+        root = trie._root
+        assert list(root.children) == ['a']
+        shared = root.children['a']
+        assert shared.label == 'abc'
+        assert sorted(child.label for child in shared.children.values()) == ['def', 'xyz']
+        assert trie.suggest('abcd') == [{'text': 'abcdef', 'type': 'title'}]
+        assert [s['text'] for s in trie.suggest('ab')] == ['abcdef', 'abcxyz']
+
+    def test_split_keeps_existing_anchor_usable(self, trie):
+        trie.insert('abcdef', 'abcdef')
+        _, anchor, consumed = trie.suggest_from(None, 'abcdef', 10)
+        assert consumed == 6
+        trie.insert('abcxyz', 'abcxyz')
+        trie.insert('abcdefgh', 'abcdefgh')
+        suggestions, _, _ = trie.suggest_from(anchor, 'g', 10)
+        assert suggestions == [{'text': 'abcdefgh', 'type': 'title'}]
+
+    def test_limit_above_top_k_falls_back_to_traversal(self):
+        trie = SuggestionTrie(top_k=2)
+        for i in range(4):
+            trie.insert(f'entry {i}', f'Entry {i}')
+        assert len(trie.suggest('entry', limit=10)) == 4
+
+    def test_build_bumps_generation(self, trie):
+        before = trie.generation
+        trie.build([])
+        assert trie.generation == before + 1
+
+    def test_mark_stale(self, trie):
+        trie.build([])
+        trie.mark_stale()
+        assert trie.needs_rebuild
+
+
+class TestSuggestionTrieDatabase:
+    @staticmethod
+    def _add_book(db, award_id, title, author, displayable=True):
+        book = AwardBook(award_id=award_id, title=title, author=author, year=2024, is_displayable=displayable)
+        db.session.add(book)
+        db.session.commit()
+        return book
+
+    def test_ensure_loaded_only_displayable(self, app, db, sample_award):
+        self._add_book(db, sample_award, 'Visible Book', 'Vera')
+        self._add_book(db, sample_award, 'Hidden Book', 'Hank', displayable=False)
+        trie = app.extensions['suggestion_trie']
+        trie.ensure_loaded()
+        assert trie.suggest('visible') == [{'text': 'Visible Book', 'type': 'title'}]
+        assert trie.suggest('hidden') == []
+
+    def test_insert_event_updates_loaded_trie(self, app, db, sample_award):
+        trie = app.extensions['suggestion_trie']
+        trie.ensure_loaded()
+        self._add_book(db, sample_award, 'Fresh Arrival', 'Fay')
+        assert not trie.needs_rebuild
+        assert trie.suggest('fresh') == [{'text': 'Fresh Arrival', 'type': 'title'}]
+
+    def test_hiding_book_marks_stale(self, app, db, sample_award):
+        book = self._add_book(db, sample_award, 'Soon Hidden', 'Sam')
+        trie = app.extensions['suggestion_trie']
+        trie.ensure_loaded()
+        book.is_displayable = False
+        db.session.commit()
+        assert trie.needs_rebuild
+        trie.ensure_loaded()
+        assert trie.suggest('soon') == []
+
+    def test_suggestions_route_uses_trie(self, client, db, sample_award):
+        self._add_book(db, sample_award, 'Routed Title', 'Rita')
+        response = client.get('/api/search/suggestions?prefix=rout&limit=5')
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert data['prefix'] == 'rout'
+        assert data['suggestions'] == [{'text': 'Routed Title', 'type': 'title'}]
+
+    def test_suggestions_route_caches_locus(self, client, db, sample_award):
+        from app.routes.api.recommendations import _locus_cache
+
+        self._add_book(db, sample_award, 'Locus Title', 'Lou')
+        with client.session_transaction() as sess:
+            sess['session_id'] = 'locus-session'
+        cache_key = 'locus:locus-session'
+        client.get('/api/search/suggestions?prefix=lo')
+        assert _locus_cache.get(cache_key)['prefix'] == 'lo'
+
+        response = client.get('/api/search/suggestions?prefix=LOCUS')
+        suggestions = response.get_json()['data']['suggestions']
+        assert suggestions == [{'text': 'Locus Title', 'type': 'title'}]
+        # 'locus' 落在 'cus title' 边中间，locus 仍停在最后一个完整匹配的节点
+        assert _locus_cache.get(cache_key)['prefix'] == 'lo'
+
+        # 重建后旧节点失效，必须从根节点重新查找
+        trie = client.application.extensions['suggestion_trie']
+        trie.mark_stale()
+        self._add_book(db, sample_award, 'Locusts', 'Lea')
+        response = client.get('/api/search/suggestions?prefix=locust')
+        assert response.get_json()['data']['suggestions'] == [{'text': 'Locusts', 'type': 'title'}]
+
+    def test_suggestions_without_session_skip_locus(self, app, db, sample_award):
+        from app.routes.api.recommendations import _locus_cache
+
+        self._add_book(db, sample_award, 'Cookieless Title', 'Cara')
+        _locus_cache.clear()
+        fresh_client = app.test_client()
+        response = fresh_client.get('/api/search/suggestions?prefix=cook')
+        assert response.get_json()['data']['suggestions'] == [{'text': 'Cookieless Title', 'type': 'title'}]
+        assert 'Set-Cookie' not in response.headers
+        assert _locus_cache.get_stats()['size'] == 0
+
+    def test_dead_prefix_short_circuits_extensions(self, client, db, sample_award):
+        from unittest.mock import patch
+
+        from app.routes.api.recommendations import _locus_cache
+
+        self._add_book(db, sample_award, 'Quartz Book', 'Nia')
+        with client.session_transaction() as sess:
+            sess['session_id'] = 'dead-prefix-session'
+        cache_key = 'locus:dead-prefix-session'
+        client.get('/api/search/suggestions?prefix=qx')
+        assert _locus_cache.get(cache_key)['node'] is None
+
+        with patch.object(SuggestionTrie, 'suggest_from') as mock_suggest:
+            response = client.get('/api/search/suggestions?prefix=qxyz')
+            mock_suggest.assert_not_called()
+        assert response.get_json()['data']['suggestions'] == []
+
+        # 回退到存活前缀时重新从根节点查找
+        response = client.get('/api/search/suggestions?prefix=qu')
+        assert response.get_json()['data']['suggestions'] == [{'text': 'Quartz Book', 'type': 'title'}]
+
+    def test_dead_prefix_invalidated_by_insert(self, client, db, sample_award):
+        from app.routes.api.recommendations import _locus_cache
+
+        self._add_book(db, sample_award, 'Quartz Book', 'Nia')
+        with client.session_transaction() as sess:
+            sess['session_id'] = 'dead-prefix-insert-session'
+        client.get('/api/search/suggestions?prefix=qx')
+        assert _locus_cache.get('locus:dead-prefix-insert-session')['node'] is None
+
+        # 增量插入不触发全量重建，但此前的死前缀不再成立
+        self._add_book(db, sample_award, 'Qxylo Saga', 'Ada')
+        response = client.get('/api/search/suggestions?prefix=qxy')
+        assert response.get_json()['data']['suggestions'] == [{'text': 'Qxylo Saga', 'type': 'title'}]
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import pytest
 
 from app.models.schemas import BookMetadata, SearchHistory, UserCategory, UserPreference, UserViewedBook
@@ -33,6 +35,29 @@ class TestUserServiceSaveCategories:
         categories = UserCategory.query.filter_by(session_id=session_id).all()
         assert len(categories) == 0
 
+    def test_save_categories_dedups_input(self, app, db, user_service, session_id):
+        user_service.save_user_categories(session_id, ['hardcover-fiction', 'hardcover-fiction', 'advice'])
+        categories = UserCategory.query.filter_by(session_id=session_id).all()
+        assert sorted(c.category_id for c in categories) == ['advice', 'hardcover-fiction']
+        assert db.session.get(UserPreference, session_id) is not None
+
+    def test_save_categories_writes_only_difference(self, app, db, user_service, session_id):
+        user_service.save_user_categories(session_id, ['hardcover-fiction', 'advice'])
+        kept_id = UserCategory.query.filter_by(session_id=session_id, category_id='advice').one().id
+
+        user_service.save_user_categories(session_id, ['advice', 'hardcover-nonfiction'])
+        categories = UserCategory.query.filter_by(session_id=session_id).all()
+        assert sorted(c.category_id for c in categories) == ['advice', 'hardcover-nonfiction']
+        # 未变化的行保留原记录，而不是删除后重建
+        assert UserCategory.query.filter_by(session_id=session_id, category_id='advice').one().id == kept_id
+
+    def test_save_unchanged_categories_issues_no_writes(self, app, db, user_service, session_id, capture_statements):
+        user_service.save_user_categories(session_id, ['hardcover-fiction', 'advice'])
+        with capture_statements() as statements:
+            user_service.save_user_categories(session_id, ['advice', 'hardcover-fiction'])
+        assert statements
+        assert all(s.lstrip().upper().startswith('SELECT') for s in statements)
+
 
 class TestUserServiceSaveViewedBooks:
     def test_save_viewed_books(self, app, db, user_service, session_id):
@@ -40,12 +65,47 @@ class TestUserServiceSaveViewedBooks:
         viewed = UserViewedBook.query.filter_by(session_id=session_id).all()
         assert len(viewed) == 2
 
+    def test_save_viewed_books_dedups_input(self, app, db, user_service, session_id):
+        user_service.save_viewed_books(session_id, ['9780143127550', '9780143127550'])
+        viewed = UserViewedBook.query.filter_by(session_id=session_id).all()
+        assert len(viewed) == 1
+
     def test_save_viewed_books_dedup(self, app, db, user_service, session_id):
         user_service.save_viewed_books(session_id, ['9780143127550'])
         user_service.save_viewed_books(session_id, ['9780143127550', '9780062796200'])
         viewed = UserViewedBook.query.filter_by(session_id=session_id).all()
         assert len(viewed) == 2
 
+    def test_save_viewed_books_refreshes_viewed_at(self, app, db, user_service, session_id):
+        user_service.save_viewed_books(session_id, ['9780143127550'])
+        record = UserViewedBook.query.filter_by(session_id=session_id).one()
+        record.viewed_at = datetime(2000, 1, 1)
+        db.session.commit()
+
+        user_service.save_viewed_books(session_id, ['9780143127550'])
+        db.session.expire_all()
+        record = UserViewedBook.query.filter_by(session_id=session_id).one()
+        assert record.viewed_at.year > 2000
+
+    def test_save_viewed_books_without_upsert_dialect(self, app, db, user_service, session_id, monkeypatch):
+        monkeypatch.setattr('app.services.user_service._UPSERT_DIALECTS', frozenset())
+        user_service.save_viewed_books(session_id, ['9780143127550'])
+        user_service.save_viewed_books(session_id, ['9780143127550', '9780062796200'])
+        viewed = UserViewedBook.query.filter_by(session_id=session_id).all()
+        assert len(viewed) == 2
+
+    def test_fallback_refreshes_viewed_at(self, app, db, user_service, session_id, monkeypatch):
+        monkeypatch.setattr('app.services.user_service._UPSERT_DIALECTS', frozenset())
+        user_service.save_viewed_books(session_id, ['9780143127550'])
+        record = UserViewedBook.query.filter_by(session_id=session_id).one()
+        record.viewed_at = datetime(2000, 1, 1)
+        db.session.commit()
+
+        user_service.save_viewed_books(session_id, ['9780143127550'])
+        db.session.expire_all()
+        record = UserViewedBook.query.filter_by(session_id=session_id).one()
+        assert record.viewed_at.year > 2000
+
 
 class TestUserServiceSearchHistory:
     def test_save_search_history(self, app, db, user_service, session_id):
@@ -81,6 +141,25 @@ class TestUserServicePreferences:
         prefs = user_service.get_preferences(session_id)
         assert prefs['view_mode'] == 'grid'
 
+    def test_save_preferences_single_commit(self, app, db, user_service, session_id, monkeypatch):
+        commits = []
+        original_commit = db.session.commit
+        monkeypatch.setattr(db.session, 'commit', lambda: commits.append(1) or original_commit())
+
+        user_service.save_preferences(session_id, 'grid', ['hardcover-fiction', 'advice'], ['9780143127550'])
+
+        assert len(commits) == 1
+        assert db.session.get(UserPreference, session_id).view_mode == 'grid'
+        assert UserCategory.query.filter_by(session_id=session_id).count() == 2
+        assert UserViewedBook.query.filter_by(session_id=session_id).count() == 1
+
+    def test_save_preferences_keeps_categories_when_none_given(self, app, db, user_service, session_id):
+        user_service.save_user_categories(session_id, ['hardcover-fiction'])
+        user_service.save_preferences(session_id, 'list')
+
+        assert db.session.get(UserPreference, session_id).view_mode == 'list'
+        assert UserCategory.query.filter_by(session_id=session_id).count() == 1
+
 
 class TestUserServiceBookTranslation:
     def test_save_book_translation_creates_metadata_with_required_fields(self, app, db, user_service):